@@ -4,12 +4,127 @@ ConfigManager - Handles loading, saving, and applying application settings
 
 import os
 import json
+import logging
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pygame is optional here so the config layer can be used without a display
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+log = logging.getLogger(__name__)
+
+# Default settings, used for any key missing from the config file. Values are
+# immutable so the per-manager copy can be shallow.
+_DEFAULT_SETTINGS = MappingProxyType({
+    # Application settings
+    "theme": "light",
+    "screen_width": 1024,
+    "screen_height": 768,
+    "fps": 60,
+    "vsync": True,
+    "precise_timing": False,
+    "show_grid": True,
+    
+    # Simulation defaults
+    "simulation.gravity": 9.81,
+    "simulation.default_length1": 120,
+    "simulation.default_length2": 120,
+    "simulation.default_mass1": 10,
+    "simulation.default_mass2": 10,
+    "simulation.default_angle1": 0.8,
+    "simulation.default_angle2": 0.5,
+    "simulation.default_velocity1": 0,
+    "simulation.default_velocity2": 0,
+    "simulation.default_path_color": (0, 128, 255),
+    "simulation.default_path_duration": 2.0,
+    "simulation.default_show_wire": True
+})
+
+# Color names in the row order of a Theme
+_THEME_KEYS = ("background", "text", "primary", "secondary", "accent", "grid")
+_THEME_INDEX = MappingProxyType({key: row for row, key in enumerate(_THEME_KEYS)})
+
+class Theme(Mapping):
+    """
+    Read-only color scheme mapping each name in _THEME_KEYS to a color
+    """
+    
+    __slots__ = ("_colors",)
+    
+    def __init__(self, rows):
+        """
+        Initialize the theme
+        
+        Args:
+            rows: RGB triples, one per entry of _THEME_KEYS and in that order
+        """
+        # Build each row's color object once so lookups don't convert per
+        # draw call; pygame.Color when available, plain tuples otherwise
+        if pygame is not None:
+            self._colors = tuple(pygame.Color(*row) for row in rows)
+        else:
+            self._colors = tuple(tuple(row) for row in rows)
+            
+    def __getitem__(self, key):
+        """
+        Get a color by name
+        
+        Args:
+            key: Color name from _THEME_KEYS
+            
+        Returns:
+            pygame.Color or tuple: The color
+        """
+        return self._colors[_THEME_INDEX[key]]
+        
+    def __iter__(self):
+        """Iterate over color names"""
+        return iter(_THEME_KEYS)
+        
+    def __len__(self):
+        """Number of colors in the scheme"""
+        return len(_THEME_KEYS)
+
+# Theme color schemes, built once at import and shared read-only by all managers
+_THEMES = MappingProxyType({
+    "light": Theme((
+        (240, 240, 245),  # background
+        (30, 30, 30),     # text
+        (0, 120, 215),    # primary
+        (0, 170, 170),    # secondary
+        (200, 0, 100),    # accent
+        (200, 200, 200)   # grid
+    )),
+    "dark": Theme((
+        (30, 30, 35),     # background
+        (220, 220, 220),  # text
+        (0, 150, 255),    # primary
+        (0, 200, 200),    # secondary
+        (255, 50, 100),   # accent
+        (60, 60, 60)      # grid
+    ))
+})
 
 class ConfigManager:
     """
     Manages configuration settings for the double pendulum simulation application
     """
     
+    __slots__ = ("config_file_name", "settings", "themes", "get_setting",
+                 "_save_lock", "_save_timer")
+    
+    # Seconds schedule_save waits for further changes before writing the file
+    SAVE_DELAY = 0.25
+    
     def __init__(self, config_file_name):
         """
         Initialize the configuration manager
@@ -19,56 +134,27 @@ class ConfigManager:
         """
         self.config_file_name = config_file_name
         self.settings = {}
-        self.themes = {
-            "light": {
-                "background": (240, 240, 245),
-                "text": (30, 30, 30),
-                "primary": (0, 120, 215),
-                "secondary": (0, 170, 170),
-                "accent": (200, 0, 100),
-                "grid": (200, 200, 200)
-            },
-            "dark": {
-                "background": (30, 30, 35),
-                "text": (220, 220, 220),
-                "primary": (0, 150, 255),
-                "secondary": (0, 200, 200),
-                "accent": (255, 50, 100),
-                "grid": (60, 60, 60)
-            }
-        }
+        self.themes = _THEMES
+        
+        # get_setting(key, default=None) is the settings dict's own C-level
+        # get, so lookups skip a Python wrapper call. self.settings must keep
+        # its identity (update it in place, never rebind it) for this to hold.
+        self.get_setting = self.settings.get
+        
+        # Pending schedule_save write, and the lock serializing file writes
+        self._save_lock = threading.Lock()
+        self._save_timer = None
         
     def initialize(self):
         """Initialize the configuration manager and load default settings"""
-        # Set default settings
-        self.settings = {
-            # Application settings
-            "theme": "light",
-            "screen_width": 1024,
-            "screen_height": 768,
-            "fps": 60,
-            "show_grid": True,
-            
-            # Simulation defaults
-            "simulation.gravity": 9.81,
-            "simulation.default_length1": 120,
-            "simulation.default_length2": 120,
-            "simulation.default_mass1": 10,
-            "simulation.default_mass2": 10,
-            "simulation.default_angle1": 0.8,
-            "simulation.default_angle2": 0.5,
-            "simulation.default_velocity1": 0,
-            "simulation.default_velocity2": 0,
-            "simulation.default_path_color": [0, 128, 255],
-            "simulation.default_path_duration": 2.0,
-            "simulation.default_show_wire": True
-        }
-        
-        # Load settings from file if it exists
-        if os.path.exists(self.config_file_name):
-            self.load_configuration()
+        # Start from a fresh copy of the default settings
+        self.settings.clear()
+        self.settings.update(_DEFAULT_SETTINGS)
+        
+        # Load settings from file (falls back to defaults if it is missing)
+        self.load_configuration()
             
-        print("ConfigManager initialized")
+        log.info("ConfigManager initialized")
         
     def load_configuration(self):
         """
@@ -78,17 +164,24 @@ class ConfigManager:
             dict: The loaded settings dictionary
         """
         try:
-            if os.path.exists(self.config_file_name):
-                with open(self.config_file_name, 'r') as f:
-                    loaded_settings = json.load(f)
-                    # Update settings, keeping defaults for any missing values
-                    for key, value in loaded_settings.items():
-                        self.settings[key] = value
-                print(f"Settings loaded from {self.config_file_name}")
+            # Open directly rather than stat-ing first; a missing file is
+            # reported through FileNotFoundError
+            with open(self.config_file_name, 'rb') as f:
+                data = f.read()
+                
+            # Prefer the C-backed orjson parser, fall back to stdlib json
+            if orjson is not None:
+                loaded_settings = orjson.loads(data)
             else:
-                print(f"Config file not found: {self.config_file_name}, using defaults")
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading configuration: {e}")
+                loaded_settings = json.loads(data)
+                
+            # Update settings, keeping defaults for any missing values
+            self.settings.update(loaded_settings)
+            log.info("Settings loaded from %s", self.config_file_name)
+        except FileNotFoundError:
+            log.info("Config file not found: %s, using defaults", self.config_file_name)
+        except (ValueError, IOError) as e:
+            log.error("Error loading configuration: %s", e)
             
         return self.settings
         
@@ -96,31 +189,84 @@ class ConfigManager:
         """
         Save current configuration to file
         
+        A write pending from schedule_save is dropped, since this one
+        includes its changes.
+        
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            with open(self.config_file_name, 'w') as f:
-                json.dump(self.settings, f, indent=4)
-            print(f"Settings saved to {self.config_file_name}")
-            return True
-        except IOError as e:
-            print(f"Error saving configuration: {e}")
-            return False
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            return self._write_settings(self.settings)
             
-    def get_setting(self, key, default=None):
+    def schedule_save(self):
         """
-        Get a setting value by key
+        Save the current configuration to file in the background
+        
+        The write happens SAVE_DELAY seconds later on a timer thread, and
+        a further call before then replaces it, so a burst of saves costs
+        one write.
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                
+            # Write a snapshot, as the settings may change while the timer runs
+            timer = threading.Timer(self.SAVE_DELAY, self._run_scheduled_save,
+                                    args=(dict(self.settings),))
+            timer.daemon = True
+            self._save_timer = timer
+            timer.start()
+            
+    def _run_scheduled_save(self, settings):
+        """
+        Write the settings snapshot taken by schedule_save
         
         Args:
-            key: The setting key
-            default: Default value if setting not found
+            settings: Settings dictionary to write
+        """
+        with self._save_lock:
+            # A later save may have replaced this one after the timer fired
+            if self._save_timer is not threading.current_thread():
+                return
+            self._save_timer = None
+            self._write_settings(settings)
             
-        Returns:
-            The setting value or default if not found
+    def _write_settings(self, settings):
         """
-        return self.settings.get(key, default)
+        Write settings to the config file; the caller holds _save_lock
         
+        Args:
+            settings: Settings dictionary to write
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        temp_file_name = self.config_file_name + ".tmp"
+        try:
+            # The stdlib encoder keeps the file's 4-space indent; orjson can
+            # only indent by two
+            data = json.dumps(settings, indent=4).encode("utf-8")
+                
+            # Write to a temporary file and atomically swap it into place, so
+            # a crash mid-write never leaves a truncated settings file
+            with open(temp_file_name, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file_name, self.config_file_name)
+            log.info("Settings saved to %s", self.config_file_name)
+            return True
+        except (TypeError, IOError) as e:
+            log.error("Error saving configuration: %s", e)
+            try:
+                os.remove(temp_file_name)
+            except OSError:
+                pass
+            return False
+            
     def set_setting(self, key, value):
         """
         Set a setting value
@@ -131,6 +277,41 @@ class ConfigManager:
         """
         self.settings[key] = value
         
+    def update_settings(self, changes):
+        """
+        Set several setting values at once
+        
+        Args:
+            changes: Mapping of setting keys to their new values
+        """
+        self.settings.update(changes)
+        
+    def get_settings(self, defaults):
+        """
+        Read several settings in one pass
+        
+        Args:
+            defaults: Mapping of setting keys to the value to use for keys
+                      that are not set
+            
+        Returns:
+            dict: The current value of each key in defaults
+        """
+        settings = self.settings
+        return {key: settings.get(key, default) for key, default in defaults.items()}
+        
+    def get_theme_colors(self):
+        """
+        Get the color scheme of the configured theme
+        
+        Unlike apply_theme this does not write the settings, so it is cheap
+        to call whenever a scene needs its colors.
+        
+        Returns:
+            Mapping: The theme's shared, read-only color scheme
+        """
+        return self.themes.get(self.get_setting("theme", "light"), self.themes["light"])
+        
     def apply_theme(self, theme_name):
         """
         Apply a theme and return its color scheme
@@ -139,7 +320,8 @@ class ConfigManager:
             theme_name: The name of the theme to apply
             
         Returns:
-            dict: The theme's color scheme
+            Mapping: The theme's color scheme (read-only), mapping color names
+            to pygame.Color objects (RGB tuples if pygame is unavailable)
         """
         # Set theme name in settings
         self.set_setting("theme", theme_name)
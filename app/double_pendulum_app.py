@@ -2,58 +2,101 @@
 DoublePendulumApp - Main application controller for the Double Pendulum Simulation
 """
 
+import logging
 import pygame
-import pygame_gui
-import os
-import json
+import pygame.freetype
 from app.config.config_manager import ConfigManager
 from app.scenes.scene_manager import SceneManager
-from app.scenes.home_scene import HomeScene
-from app.scenes.simulation_scene import SimulationScene
-from app.scenes.settings_scene import SettingsScene
-from app.scenes.information_scene import InformationScene
+from app.util.frame_pacer import FramePacer
 from app.util.scene_navigation import initialize_navigator
 
+log = logging.getLogger(__name__)
+
+# Event types no scene handles, dropped by SDL before they reach the
+# Python queue. Names missing from the installed pygame are skipped.
+BLOCKED_EVENTS = (
+    "JOYAXISMOTION", "JOYBALLMOTION", "JOYHATMOTION",
+    "JOYBUTTONDOWN", "JOYBUTTONUP", "JOYDEVICEADDED", "JOYDEVICEREMOVED",
+    "CONTROLLERAXISMOTION", "CONTROLLERBUTTONDOWN", "CONTROLLERBUTTONUP",
+    "CONTROLLERDEVICEADDED", "CONTROLLERDEVICEREMOVED", "CONTROLLERDEVICEREMAPPED",
+    "AUDIODEVICEADDED", "AUDIODEVICEREMOVED",
+    "TEXTINPUT", "TEXTEDITING", "KEYMAPCHANGED",
+    "FINGERDOWN", "FINGERUP", "FINGERMOTION", "MULTIGESTURE",
+    "DROPFILE", "DROPTEXT", "DROPBEGIN", "DROPCOMPLETE",
+    "CLIPBOARDUPDATE", "LOCALECHANGED"
+)
+
 class DoublePendulumApp:
     """
     Main application controller that manages the entire double pendulum simulation
     """
     
+    __slots__ = ("running", "clock", "pacer", "main_surface", "config_manager",
+                 "scene_manager", "fps", "precise_timing")
+    
+    # Scene physics advances in fixed steps of this size (seconds)
+    FIXED_DT = 1.0 / 240.0
+    
+    # Longest frame time fed to the accumulator, so a stall (window drag,
+    # breakpoint) cannot queue up an unbounded number of steps
+    MAX_FRAME_DT = 0.25
+    
+    # Longest time (ms) the loop blocks waiting for input while the scene
+    # is idle, so timers in the UI still advance now and then
+    IDLE_WAIT_MS = 100
+    
     def __init__(self):
         """Initialize class attributes"""
         self.running = False
         self.clock = None
+        self.pacer = None
         self.main_surface = None
         self.config_manager = None
         self.scene_manager = None
         self.fps = 60  # Default frame rate
+        self.precise_timing = False  # Predictive sleep-and-spin frame pacing for lower jitter
 
     def initialize(self):
         """
         Set up pygame, load configurations, and initialize scene manager
         """
-        # Initialize Pygame
-        pygame.init()
+        # Show diagnostics on the console unless the host configured logging
+        if not logging.getLogger().handlers:
+            logging.basicConfig(level=logging.INFO, format="%(message)s")
+            
+        # Initialize only the pygame subsystems the app uses: the display,
+        # which brings the event queue, and fonts (pygame_gui renders with
+        # freetype). pygame.init() would also start audio and joysticks.
+        pygame.display.init()
+        pygame.font.init()
+        pygame.freetype.init()
         pygame.display.set_caption("Double Pendulum Simulation")
         
-        # Create clock for managing frame rate
+        # Create clock and pacer for managing frame rate
         self.clock = pygame.time.Clock()
+        self.pacer = FramePacer()
         
         # Initialize configuration manager
         self.config_manager = ConfigManager("settings.json")
         self.config_manager.initialize()
         
-        # Load settings
-        settings = self.config_manager.load_configuration()
+        # Read settings (already loaded from file by ConfigManager.initialize)
+        settings = self.config_manager.settings
         self.fps = settings.get("fps", 60)
+        self.precise_timing = settings.get("precise_timing", False)
         screen_width = settings.get("screen_width", 1024)
         screen_height = settings.get("screen_height", 768)
         
+        # Drop event types no scene handles before they reach the queue
+        self._block_unused_events(BLOCKED_EVENTS)
+        
         # Create display surface
-        self.main_surface = pygame.display.set_mode(
-            (screen_width, screen_height), 
-            pygame.HWSURFACE | pygame.DOUBLEBUF
-        )
+        self.main_surface = self._create_display(
+            (screen_width, screen_height), settings.get("vsync", True))
+            
+        # No scene has a text field, so keystrokes need no IME composition
+        # (SDL starts text input along with the display)
+        pygame.key.stop_text_input()
         
         # Initialize scene manager
         self.scene_manager = SceneManager(self.main_surface, self.config_manager)
@@ -70,47 +113,137 @@ class DoublePendulumApp:
         # Set running flag
         self.running = True
         
-        print("Application initialized successfully")
+        log.info("Application initialized successfully")
 
+    def _create_display(self, size, vsync):
+        """
+        Create the display surface
+        
+        SCALED routes presentation through SDL's renderer, which is what
+        allows vsync to be requested in windowed mode. The renderer
+        presents the whole frame on every display.update, though, so
+        without vsync a plain window is used, where updating only the
+        dirty rects copies just those areas to the screen.
+        
+        Args:
+            size: (width, height) of the window
+            vsync: Whether to synchronize presentation with the display refresh
+            
+        Returns:
+            pygame.Surface: The display surface
+        """
+        if vsync:
+            try:
+                return pygame.display.set_mode(size, pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+            except pygame.error as e:
+                log.warning("VSync unavailable, falling back to frame limiter: %s", e)
+                
+        return pygame.display.set_mode(size)
+        
+    def _block_unused_events(self, event_names):
+        """
+        Block event types that no scene handles
+        
+        Args:
+            event_names: Names of pygame event constants to block (e.g. "JOYAXISMOTION")
+        """
+        # Resolve names against the installed pygame, skipping unknown ones
+        event_types = [getattr(pygame, name) for name in event_names
+                       if isinstance(getattr(pygame, name, None), int)]
+        if event_types:
+            pygame.event.set_blocked(event_types)
+            
     def _register_scenes(self):
         """
         Register all application scenes with the scene manager
+        
+        Scene modules are imported on first use, so startup only pays for
+        the home scene.
         """
-        self.scene_manager.register_scene("home", HomeScene)
-        self.scene_manager.register_scene("simulation", SimulationScene)
-        self.scene_manager.register_scene("settings", SettingsScene)
-        self.scene_manager.register_scene("information", InformationScene)
+        register = self.scene_manager.register_scene_lazy
+        register("home", "app.scenes.home_scene", "HomeScene")
+        register("simulation", "app.scenes.simulation_scene", "SimulationScene")
+        register("settings", "app.scenes.settings_scene", "SettingsScene")
+        register("information", "app.scenes.information_scene", "InformationScene")
 
     def run(self):
         """
         Main application loop - controls the program flow
+        
+        The frame rate and pacing mode are read once on entry; changing
+        self.fps or self.precise_timing takes effect on the next call to run().
         """
+        # Bind per-frame callables and constants to locals once. The pacer
+        # spins through the end of each frame instead of sleeping, trading
+        # some CPU for steadier frame times.
+        tick = self.pacer.tick if self.precise_timing else self.clock.tick
+        wait_event = pygame.event.wait
+        is_idle = self.scene_manager.is_idle
+        process_events = self._process_events
+        update = self.scene_manager.update
+        step = self.scene_manager.step
+        render = self.scene_manager.render
+        update_display = pygame.display.update
+        fps = self.fps
+        fixed_dt = self.FIXED_DT
+        max_frame_dt = self.MAX_FRAME_DT
+        idle_wait_ms = self.IDLE_WAIT_MS
+        
+        accumulator = 0.0
         while self.running:
-            # Calculate delta time in seconds
-            dt = self.clock.tick(self.fps) / 1000.0
-            
+            # While the scene has nothing to animate, blocking until input
+            # arrives takes the place of the frame limiter, so an event
+            # wakes the loop at once instead of after the rest of the
+            # frame. The time spent waiting is not simulated.
+            if is_idle():
+                dt = tick() * 0.001
+                first_event = wait_event(idle_wait_ms)
+                tick()
+            else:
+                dt = tick(fps) * 0.001
+                first_event = None
+                
             # Process events
-            self._process_events()
+            process_events(first_event)
             
-            # Update current scene
-            self.scene_manager.update(dt)
+            # Per-frame logic (widgets) runs once with the frame time, then
+            # the simulation catches up in fixed-size steps
+            dt = min(dt, max_frame_dt)
+            update(dt)
+            accumulator += dt
+            while accumulator >= fixed_dt:
+                step(fixed_dt)
+                accumulator -= fixed_dt
             
             # Render current scene
-            self.scene_manager.render()
+            dirty_rects = render()
             
-            # Update display
-            pygame.display.flip()
+            # Present only the areas the scene changed (with vsync the
+            # renderer presents the whole frame regardless)
+            if dirty_rects:
+                update_display(dirty_rects)
 
-    def _process_events(self):
+    def _process_events(self, first_event=None):
         """
         Handle global pygame events
+        
+        The OS event queue is pumped once, then everything SDL has queued
+        is drained in one call; pygame copies it out in batches rather than
+        one event at a time.
+        
+        Args:
+            first_event: Event already taken from the queue by
+                         pygame.event.wait, handled before the rest
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-                
-            # Pass event to current scene
-            self.scene_manager.handle_event(event)
+        pygame.event.pump()
+        events = pygame.event.get(pump=False)
+        if first_event is not None and first_event.type != pygame.NOEVENT:
+            events.insert(0, first_event)
+        if any(event.type == pygame.QUIT for event in events):
+            self.running = False
+            
+        # Pass the whole batch to the current scene
+        self.scene_manager.handle_events(events)
 
     def exit(self):
         """
@@ -124,4 +257,4 @@ class DoublePendulumApp:
         if self.scene_manager:
             self.scene_manager.cleanup()
         
-        print("Application shutdown complete")
\ No newline at end of file
+        log.info("Application shutdown complete")
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+Batch simulation of many independent double pendulums
+Integrates sweeps over initial conditions on the GPU through numba.cuda,
+falling back to the vectorized CPU kernels when no GPU is usable
+"""
+
+import logging
+import numpy as np
+
+from app.physics import kernels
+from app.physics.kernels import mass_terms_vec, rk4_step_vec
+
+log = logging.getLogger(__name__)
+
+# numba's CUDA target is optional; without it only the CPU path runs
+try:
+    from numba import cuda
+    HAVE_CUDA = cuda.is_available()
+except ImportError:
+    HAVE_CUDA = False
+
+# Columns of the initial_states array taken by simulate_ensemble
+FIELDS = ("angle1", "angle2", "velocity1", "velocity2",
+          "mass1", "mass2", "length1", "length2")
+
+# GPU threads per block
+BLOCK_SIZE = 128
+
+
+if HAVE_CUDA:
+    # Device copies of the shared scalar kernels
+    _accelerations_gpu = cuda.jit(device=True)(kernels.accelerations)
+    _rk4_step_gpu = cuda.jit(device=True)(kernels.make_rk4_step(_accelerations_gpu))
+    
+    @cuda.jit
+    def _ensemble_kernel(a1s, a2s, v1s, v2s, m1s, m2s, l1s, l2s, g, dt, n_steps, out):
+        # One thread per pendulum; each field array is read and written
+        # at the thread's index, so accesses coalesce
+        i = cuda.grid(1)
+        if i >= a1s.size:
+            return
+            
+        a1, a2, v1, v2 = a1s[i], a2s[i], v1s[i], v2s[i]
+        m1, m2, l1, l2 = m1s[i], m2s[i], l1s[i], l2s[i]
+        out[0, 0, i] = a1
+        out[0, 1, i] = a2
+        out[0, 2, i] = v1
+        out[0, 3, i] = v2
+        for step in range(1, n_steps + 1):
+            a1, a2, v1, v2 = _rk4_step_gpu(a1, a2, v1, v2, m1, m2, l1, l2, g, dt)
+            out[step, 0, i] = a1
+            out[step, 1, i] = a2
+            out[step, 2, i] = v1
+            out[step, 3, i] = v2
+
+
+def _simulate_gpu(columns, n_steps, dt, gravity, dtype):
+    """
+    Run the ensemble kernel on the GPU
+    
+    Args:
+        columns: (8, N) float64 array, one contiguous row per field
+        n_steps: Number of time steps to take
+        dt: Size of each time step
+        gravity: Gravity value to use
+        dtype: Storage type of the returned trajectories
+        
+    Returns:
+        numpy.ndarray: (n_steps + 1, 4, N) trajectories
+    """
+    count = columns.shape[1]
+    device_columns = [cuda.to_device(column) for column in columns]
+    device_out = cuda.device_array((n_steps + 1, 4, count), dtype=dtype)
+    blocks = (count + BLOCK_SIZE - 1) // BLOCK_SIZE
+    _ensemble_kernel[blocks, BLOCK_SIZE](*device_columns, float(gravity), float(dt),
+                                         n_steps, device_out)
+    return device_out.copy_to_host()
+
+
+def _simulate_cpu(columns, n_steps, dt, gravity, dtype):
+    """
+    Step every pendulum at once with the vectorized numpy kernel
+    
+    Args:
+        columns: (8, N) float64 array, one contiguous row per field
+        n_steps: Number of time steps to take
+        dt: Size of each time step
+        gravity: Gravity value to use
+        dtype: Storage type of the returned trajectories
+        
+    Returns:
+        numpy.ndarray: (n_steps + 1, 4, N) trajectories
+    """
+    trajectories = np.empty((n_steps + 1, 4, columns.shape[1]), dtype=dtype)
+    a1, a2, v1, v2, m1, m2, l1, l2 = columns
+    trajectories[0] = (a1, a2, v1, v2)
+    terms = mass_terms_vec(m1, m2, l1, l2, gravity)
+    for step in range(1, n_steps + 1):
+        a1, a2, v1, v2 = rk4_step_vec(a1, a2, v1, v2, m1, m2, l1, l2, gravity, dt, terms)
+        trajectories[step] = (a1, a2, v1, v2)
+    return trajectories
+
+
+def simulate_ensemble(initial_states, n_steps, dt, gravity, use_gpu=True,
+                      dtype=np.float32):
+    """
+    Integrate a batch of independent pendulums and record their trajectories
+    
+    Args:
+        initial_states: (N, 8) array-like, one row per pendulum with
+                        columns in FIELDS order
+        n_steps: Number of time steps to take
+        dt: Size of each time step
+        gravity: Gravity value to use
+        use_gpu: Whether to use the GPU when one is available
+        dtype: Storage type of the returned trajectories; integration
+               itself always runs in double precision
+               
+    Returns:
+        numpy.ndarray: (n_steps + 1, 4, N) array; trajectories[k, f, i]
+                       is field f (angle1, angle2, velocity1, velocity2)
+                       of pendulum i after k steps
+    """
+    # One contiguous array per field
+    columns = np.ascontiguousarray(np.asarray(initial_states, dtype=np.float64).T)
+    on_gpu = use_gpu and HAVE_CUDA and columns.shape[1] > 0
+    log.debug("Simulating %d pendulums for %d steps on the %s",
+              columns.shape[1], n_steps, "GPU" if on_gpu else "CPU")
+    if on_gpu:
+        return _simulate_gpu(columns, n_steps, dt, gravity, dtype)
+    return _simulate_cpu(columns, n_steps, dt, gravity, dtype)
@@ -0,0 +1,295 @@
+"""
+Equations of motion and Runge-Kutta steps shared by the simulation backends
+The scalar kernels are plain Python; each backend compiles its own copy
+with numba's CPU or CUDA target
+"""
+
+import math
+import numpy as np
+
+_TWO_PI = 2.0 * math.pi
+_INV_TWO_PI = 1.0 / _TWO_PI
+
+# Module-level aliases so the kernels do one global lookup per call
+# instead of a global plus an attribute lookup when running uncompiled
+_sin = math.sin
+_cos = math.cos
+_floor = math.floor
+
+
+def accelerations(a1, a2, v1, v2, m1, m2, l1, l2, g):
+    """
+    Calculate the angular accelerations of both pendulum arms
+    Based on the Lagrangian equations of motion for a double pendulum
+    
+    Args:
+        a1, a2: Angles in radians
+        v1, v2: Angular velocities
+        m1, m2: Bob masses
+        l1, l2: Rod lengths
+        g: Gravity value
+        
+    Returns:
+        tuple: (acceleration1, acceleration2)
+    """
+    # Trig terms shared by both equations. Only sin/cos of the angle
+    # difference and of a1 are evaluated; the double angle and
+    # sin(a1 - 2*a2) = sin(2d - a1) follow from identities.
+    d = a1 - a2
+    s12 = _sin(d)
+    c12 = _cos(d)
+    sin_a1 = _sin(a1)
+    cos_a1 = _cos(a1)
+    s2d = 2.0 * s12 * c12
+    c2d = 2.0 * c12 * c12 - 1.0
+    
+    # Mass and velocity terms
+    m_total = m1 + m2
+    m_sum = 2.0 * m1 + m2
+    v1_sq_l1 = v1 * v1 * l1
+    v2_sq_l2 = v2 * v2 * l2
+    
+    # One division for the common denominator
+    inv_den = 1.0 / (m_sum - m2 * c2d)
+    
+    # First pendulum
+    num1 = -g * m_sum * sin_a1
+    num2 = -m2 * g * (s2d * cos_a1 - c2d * sin_a1)
+    num3 = -2.0 * s12 * m2 * (v2_sq_l2 + v1_sq_l1 * c12)
+    acc1 = (num1 + num2 + num3) * inv_den / l1
+    
+    # Second pendulum
+    acc2 = 2.0 * s12 * (v1_sq_l1 * m_total + g * m_total * cos_a1
+                        + v2_sq_l2 * m2 * c12) * inv_den / l2
+                        
+    return acc1, acc2
+
+
+def make_rk4_step(accelerations):
+    """
+    Build a Runge-Kutta step around an equations-of-motion function
+    
+    numba can only call functions compiled for the same target, so each
+    backend passes in its own compiled copy of accelerations.
+    
+    Args:
+        accelerations: Function with the signature of accelerations
+        
+    Returns:
+        function: rk4_step(a1, a2, v1, v2, m1, m2, l1, l2, g, dt)
+    """
+    def rk4_step(a1, a2, v1, v2, m1, m2, l1, l2, g, dt):
+        """
+        Advance one pendulum by a classical fourth-order Runge-Kutta step
+        
+        Args:
+            a1, a2: Angles in radians
+            v1, v2: Angular velocities
+            m1, m2: Bob masses
+            l1, l2: Rod lengths
+            g: Gravity value
+            dt: Time step
+            
+        Returns:
+            tuple: (angle1, angle2, velocity1, velocity2) after the step
+        """
+        half_dt = 0.5 * dt
+        
+        # Each stage's angle derivative is its velocity, so only the
+        # velocity derivatives need the equations of motion
+        k1v1, k1v2 = accelerations(a1, a2, v1, v2, m1, m2, l1, l2, g)
+        
+        k2a1 = v1 + half_dt * k1v1
+        k2a2 = v2 + half_dt * k1v2
+        k2v1, k2v2 = accelerations(a1 + half_dt * v1, a2 + half_dt * v2,
+                                   k2a1, k2a2, m1, m2, l1, l2, g)
+                                   
+        k3a1 = v1 + half_dt * k2v1
+        k3a2 = v2 + half_dt * k2v2
+        k3v1, k3v2 = accelerations(a1 + half_dt * k2a1, a2 + half_dt * k2a2,
+                                   k3a1, k3a2, m1, m2, l1, l2, g)
+                                   
+        k4a1 = v1 + dt * k3v1
+        k4a2 = v2 + dt * k3v2
+        k4v1, k4v2 = accelerations(a1 + dt * k3a1, a2 + dt * k3a2,
+                                   k4a1, k4a2, m1, m2, l1, l2, g)
+                                   
+        # Weighted combination
+        sixth_dt = dt / 6.0
+        a1 += sixth_dt * (v1 + 2.0 * (k2a1 + k3a1) + k4a1)
+        a2 += sixth_dt * (v2 + 2.0 * (k2a2 + k3a2) + k4a2)
+        
+        # Wrap angles to [-pi, pi) by subtracting the nearest whole turn.
+        # math.remainder does the same but numba can't compile it.
+        a1 -= _TWO_PI * _floor(a1 * _INV_TWO_PI + 0.5)
+        a2 -= _TWO_PI * _floor(a2 * _INV_TWO_PI + 0.5)
+        v1 += sixth_dt * (k1v1 + 2.0 * (k2v1 + k3v1) + k4v1)
+        v2 += sixth_dt * (k1v2 + 2.0 * (k2v2 + k3v2) + k4v2)
+        
+        return a1, a2, v1, v2
+        
+    return rk4_step
+
+
+def mass_terms_vec(m1, m2, l1, l2, g):
+    """
+    Precompute the parts of the equations of motion that only depend on
+    mass, length and gravity
+    
+    These are fixed for a whole update, so computing them once saves
+    several array passes in every Runge-Kutta stage.
+    
+    Args:
+        m1, m2: Arrays of bob masses
+        l1, l2: Arrays of rod lengths
+        g: Gravity value
+        
+    Returns:
+        tuple: Arrays passed as the terms argument of accelerations_vec
+    """
+    m_total = m1 + m2
+    m_sum = 2.0 * m1 + m2
+    return (m_total, m_sum, -g * m_sum, -m2 * g, -2.0 * m2, g * m_total,
+            m2, l1, l2)
+
+
+def accelerations_vec(a1, a2, v1, v2, terms):
+    """
+    Array form of accelerations, evaluated for many pendulums at once
+    
+    Intermediate arrays are reused with out= and in-place operators, so a
+    call allocates only a handful of arrays however many terms it combines.
+    
+    Args:
+        a1, a2: Arrays of angles in radians
+        v1, v2: Arrays of angular velocities
+        terms: Constant terms from mass_terms_vec
+        
+    Returns:
+        tuple: (acceleration1 array, acceleration2 array)
+    """
+    m_total, m_sum, neg_g_m_sum, neg_m2_g, neg_two_m2, g_m_total, m2, l1, l2 = terms
+    
+    # Same identities as the scalar kernel
+    c12 = np.subtract(a1, a2)
+    s12 = np.sin(c12)
+    np.cos(c12, out=c12)
+    sin_a1 = np.sin(a1)
+    cos_a1 = np.cos(a1)
+    s2d = 2.0 * s12
+    s2d *= c12
+    c2d = 2.0 * c12
+    c2d *= c12
+    c2d -= 1.0
+    
+    v1_sq_l1 = v1 * v1
+    v1_sq_l1 *= l1
+    v2_sq_l2 = v2 * v2
+    v2_sq_l2 *= l2
+    
+    inv_den = m2 * c2d
+    np.subtract(m_sum, inv_den, out=inv_den)
+    np.divide(1.0, inv_den, out=inv_den)
+    
+    # First pendulum: acc1 = (num1 + num2 + num3) * inv_den / l1
+    acc1 = neg_g_m_sum * sin_a1
+    s2d *= cos_a1
+    c2d *= sin_a1
+    s2d -= c2d
+    s2d *= neg_m2_g
+    acc1 += s2d
+    num3 = neg_two_m2 * s12
+    tmp = v1_sq_l1 * c12
+    tmp += v2_sq_l2
+    num3 *= tmp
+    acc1 += num3
+    acc1 *= inv_den
+    acc1 /= l1
+    
+    # Second pendulum
+    acc2 = np.multiply(v1_sq_l1, m_total, out=v1_sq_l1)
+    np.multiply(g_m_total, cos_a1, out=cos_a1)
+    acc2 += cos_a1
+    v2_sq_l2 *= m2
+    v2_sq_l2 *= c12
+    acc2 += v2_sq_l2
+    s12 *= 2.0
+    acc2 *= s12
+    acc2 *= inv_den
+    acc2 /= l2
+    
+    return acc1, acc2
+
+
+def rk4_step_vec(a1, a2, v1, v2, m1, m2, l1, l2, g, dt, terms=None):
+    """
+    Array form of the step make_rk4_step builds, for many pendulums at once
+    
+    Args:
+        a1, a2: Arrays of angles in radians
+        v1, v2: Arrays of angular velocities
+        m1, m2: Arrays of bob masses
+        l1, l2: Arrays of rod lengths
+        g: Gravity value
+        dt: Time step
+        terms: Result of mass_terms_vec for these arrays, when the
+               caller steps them more than once
+               
+    Returns:
+        tuple: New (angle1, angle2, velocity1, velocity2) arrays
+    """
+    if terms is None:
+        terms = mass_terms_vec(m1, m2, l1, l2, g)
+    half_dt = 0.5 * dt
+    
+    k1v1, k1v2 = accelerations_vec(a1, a2, v1, v2, terms)
+    
+    k2a1 = v1 + half_dt * k1v1
+    k2a2 = v2 + half_dt * k1v2
+    k2v1, k2v2 = accelerations_vec(a1 + half_dt * v1, a2 + half_dt * v2,
+                                   k2a1, k2a2, terms)
+                                   
+    k3a1 = v1 + half_dt * k2v1
+    k3a2 = v2 + half_dt * k2v2
+    k3v1, k3v2 = accelerations_vec(a1 + half_dt * k2a1, a2 + half_dt * k2a2,
+                                   k3a1, k3a2, terms)
+                                   
+    k4a1 = v1 + dt * k3v1
+    k4a2 = v2 + dt * k3v2
+    k4v1, k4v2 = accelerations_vec(a1 + dt * k3a1, a2 + dt * k3a2,
+                                   k4a1, k4a2, terms)
+                                   
+    # Weighted sums, accumulated into the stage arrays that are no
+    # longer needed
+    sixth_dt = dt / 6.0
+    k2a1 += k3a1
+    k2a1 *= 2.0
+    k2a1 += v1
+    k2a1 += k4a1
+    new_a1 = np.multiply(k2a1, sixth_dt, out=k2a1)
+    new_a1 += a1
+    k2a2 += k3a2
+    k2a2 *= 2.0
+    k2a2 += v2
+    k2a2 += k4a2
+    new_a2 = np.multiply(k2a2, sixth_dt, out=k2a2)
+    new_a2 += a2
+    
+    # Wrap angles to [-pi, pi] by subtracting the nearest whole turn
+    new_a1 -= _TWO_PI * np.rint(new_a1 * _INV_TWO_PI)
+    new_a2 -= _TWO_PI * np.rint(new_a2 * _INV_TWO_PI)
+    
+    k2v1 += k3v1
+    k2v1 *= 2.0
+    k2v1 += k1v1
+    k2v1 += k4v1
+    new_v1 = np.multiply(k2v1, sixth_dt, out=k2v1)
+    new_v1 += v1
+    k2v2 += k3v2
+    k2v2 *= 2.0
+    k2v2 += k1v2
+    k2v2 += k4v2
+    new_v2 = np.multiply(k2v2, sixth_dt, out=k2v2)
+    new_v2 += v2
+    
+    return new_a1, new_a2, new_v1, new_v2
@@ -4,10 +4,215 @@ Handles the mathematical modeling of pendulum dynamics
 """
 
 import math
+import time
+import logging
+import threading
 import numpy as np
-from collections import deque
 import pygame
 
+from app.physics import kernels
+from app.physics.kernels import mass_terms_vec, rk4_step_vec
+
+log = logging.getLogger(__name__)
+
+# numba is optional; without it the kernels below run as plain Python
+try:
+    from numba import njit, prange, get_num_threads
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Module-level aliases so the kernels do one global lookup per call
+# instead of a global plus an attribute lookup when running uncompiled
+_sin = math.sin
+_cos = math.cos
+
+# Squared radius within which a bob can be grabbed, however small it is
+# (a bob's own hit radius equals its mass)
+MIN_HIT_RADIUS_SQ = 10 * 10
+
+# Longest time step the integrator takes; longer updates are split into
+# equal substeps no larger than this
+MAX_INTERNAL_DT = 0.01
+
+# Pre-rendered filled circles, keyed by (color, radius)
+_discs = {}
+
+
+def _get_disc(color, radius):
+    """
+    Get a filled circle as a small surface, rendering it on first use
+    
+    Args:
+        color: RGB color tuple
+        radius: Radius in pixels
+        
+    Returns:
+        pygame.Surface: Transparent surface with the circle centered at
+                        (radius + 1, radius + 1)
+    """
+    key = (color, radius)
+    disc = _discs.get(key)
+    if disc is None:
+        size = 2 * radius + 2
+        disc = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(disc, color, (radius + 1, radius + 1), radius)
+        disc = _discs[key] = disc.convert_alpha()
+    return disc
+
+
+# Compiled copies of the shared scalar kernels
+_accelerations_nb = njit(cache=True, fastmath=True)(kernels.accelerations)
+_rk4_step_nb = njit(cache=True, fastmath=True)(kernels.make_rk4_step(_accelerations_nb))
+
+
+@njit(cache=True, fastmath=True)
+def _rk4_substeps_nb(a1, a2, v1, v2, m1, m2, l1, l2, g, dt, steps):
+    """
+    Advance one pendulum by several equal Runge-Kutta steps
+    
+    Args:
+        a1, a2: Angles in radians
+        v1, v2: Angular velocities
+        m1, m2: Bob masses
+        l1, l2: Rod lengths
+        g: Gravity value
+        dt: Size of each step
+        steps: Number of steps to take
+        
+    Returns:
+        tuple: (angle1, angle2, velocity1, velocity2) after the steps
+    """
+    for _ in range(steps):
+        a1, a2, v1, v2 = _rk4_step_nb(a1, a2, v1, v2, m1, m2, l1, l2, g, dt)
+    return a1, a2, v1, v2
+
+
+def _substep_count(dt, max_dt):
+    """
+    Number of equal substeps needed to keep each one within max_dt
+    
+    Args:
+        dt: Total time to advance
+        max_dt: Longest allowed substep
+        
+    Returns:
+        int: Substep count, at least 1
+    """
+    return max(1, math.ceil(dt / max_dt))
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _update_system_nb(a1, a2, v1, v2, m1, m2, l1, l2, dragging,
+                      x1, y1, x2, y2, g, dt, steps):
+    """
+    Advance every pendulum of a system in place, spread over all cores
+    
+    Args:
+        a1, a2, v1, v2: State arrays, updated in place
+        m1, m2, l1, l2: Parameter arrays
+        dragging: Boolean array; pendulums being dragged keep their state
+        x1, y1, x2, y2: Bob position arrays, recomputed in place
+        g: Gravity value
+        dt: Size of each substep
+        steps: Number of substeps
+    """
+    for i in prange(a1.shape[0]):
+        l1_i = l1[i]
+        l2_i = l2[i]
+        if dragging[i]:
+            b1 = a1[i]
+            b2 = a2[i]
+        else:
+            b1, b2, w1, w2 = _rk4_substeps_nb(a1[i], a2[i], v1[i], v2[i], m1[i], m2[i],
+                                              l1_i, l2_i, g, dt, steps)
+            a1[i] = b1
+            a2[i] = b2
+            v1[i] = w1
+            v2[i] = w2
+        bx = l1_i * _sin(b1)
+        by = l1_i * _cos(b1)
+        x1[i] = bx
+        y1[i] = by
+        x2[i] = bx + l2_i * _sin(b2)
+        y2[i] = by + l2_i * _cos(b2)
+
+
+# Compile (or load from the on-disk cache) at import so the first frame
+# doesn't stall on JIT compilation
+_rk4_substeps_nb(0.5, 0.5, 0.0, 0.0, 10.0, 10.0, 120.0, 120.0, 9.81, 0.01, 1)
+
+# The parallel kernel can take seconds to compile on a cold cache, so it
+# is built on a background thread the first time a system is large enough
+# to use it; systems take the numpy path until it is ready, and for good
+# if the compile fails
+_update_system_done = threading.Event()
+_update_system_failed = False
+_update_system_compile_lock = threading.Lock()
+_update_system_compile_thread = None
+
+
+def _compile_update_system():
+    """Compile _update_system_nb for the array types PendulumState holds"""
+    global _update_system_failed
+    try:
+        _update_system_nb.compile(
+            "void(" + "f8[::1], " * 8 + "b1[::1], " + "f4[::1], " * 4 + "f8, f8, i8)")
+    except Exception:
+        log.warning("Could not compile the parallel kernel, using numpy", exc_info=True)
+        _update_system_failed = True
+    finally:
+        _update_system_done.set()
+        
+        
+def _update_system_pending():
+    """
+    Check whether the parallel kernel is still being compiled
+    
+    Returns:
+        bool: True until the compile has finished or failed
+    """
+    return HAVE_NUMBA and not _update_system_done.is_set()
+    
+    
+def _update_system_ready(wait=False):
+    """
+    Check whether the parallel kernel is compiled, starting its compile
+    
+    Args:
+        wait: Block until the compile has finished or failed
+        
+    Returns:
+        bool: True if _update_system_nb can be called without compiling
+    """
+    global _update_system_compile_thread
+    if not HAVE_NUMBA:
+        return False
+    if _update_system_done.is_set():
+        return not _update_system_failed
+        
+    with _update_system_compile_lock:
+        if _update_system_compile_thread is None:
+            # Start numba's worker pool here rather than on the compile
+            # thread; a TBB pool started off the main thread hangs the
+            # interpreter at exit
+            get_num_threads()
+            _update_system_compile_thread = threading.Thread(
+                target=_compile_update_system, name="numba-compile", daemon=True)
+            _update_system_compile_thread.start()
+            
+    if wait:
+        _update_system_done.wait()
+    return _update_system_done.is_set() and not _update_system_failed
+
+
 class PhysicsEngine:
     """
     Core physics engine that manages time stepping and physical constants
@@ -26,7 +231,7 @@ class PhysicsEngine:
             default_gravity: Initial gravity value
         """
         self.gravity = default_gravity
-        print(f"Physics engine initialized with gravity: {self.gravity}")
+        log.debug("Physics engine initialized with gravity: %s", self.gravity)
         
     def update(self, dt):
         """
@@ -40,6 +245,17 @@ class PhysicsEngine:
         # physics calculations happen in the pendulum system
         pass
         
+    def step(self, pendulum_system, dt):
+        """
+        Advance the engine and every pendulum of a system by one frame
+        
+        Args:
+            pendulum_system: PendulumSystem to advance
+            dt: Delta time in seconds
+        """
+        self.update(dt)
+        pendulum_system.update(dt, self.gravity)
+        
     def set_gravity(self, gravity):
         """
         Set the gravity constant
@@ -139,8 +355,23 @@ class PendulumParams:
 class PathTracer:
     """
     Tracks and renders the path of a pendulum bob
+    
+    The path is drawn incrementally onto a persistent per-pixel alpha
+    layer: each render the layer fades by the time since the last one and
+    only the newest segments are drawn, so the cost doesn't grow with the
+    path length.
     """
     
+    # Number of alpha steps used when the whole path is redrawn
+    REBUILD_BANDS = 8
+    
+    # Points per second of path the buffer is sized for
+    POINT_RATE = 60
+    
+    # Longest gap between renders (seconds) that is faded in full, so the
+    # path doesn't vanish after the scene was left or sat idle
+    MAX_FADE_STEP = 0.25
+    
     def __init__(self, max_points=500, color=(0, 128, 255)):
         """
         Initialize the path tracer
@@ -149,10 +380,21 @@ class PathTracer:
             max_points: Maximum number of points to store
             color: RGB color tuple for the path
         """
-        self.points = deque(maxlen=max_points)
-        self.max_points = max_points
         self.color = color
         self.visible = True
+        self._allocate(max_points)
+        self.duration = max_points / self.POINT_RATE  # Seconds a point takes to fade out
+        
+        # Persistent path layer and the screen area it covers
+        self.layer = None
+        self.layer_rect = None
+        self._fade_carry = 0.0  # Fractional alpha not yet faded
+        self._last_render = None  # perf_counter time of the last fade
+        self._new_points = 0    # Points added since the last render
+        
+        # Newest point and the one before it, as ints
+        self._last_point = None
+        self._prev_point = None
         
     def initialize(self, max_points, color):
         """
@@ -162,10 +404,43 @@ class PathTracer:
             max_points: Maximum number of points to store
             color: RGB color tuple for the path
         """
-        self.max_points = max_points
-        self.points = deque(maxlen=max_points)
+        self._allocate(max_points)
+        self.duration = max_points / self.POINT_RATE
         self.color = color
+        self.layer = None
+        self._fade_carry = 0.0
+        self._last_render = None
+        self._new_points = 0
+        self._last_point = None
+        self._prev_point = None
+        
+    def _allocate(self, max_points):
+        """
+        Allocate an empty ring buffer for max_points points
         
+        Args:
+            max_points: Maximum number of points to store
+        """
+        # Screen coordinates fit comfortably in 16 bits, which halves the
+        # buffer and the copies made when the path is redrawn
+        self.max_points = max_points
+        self.buffer = np.empty((max(1, max_points), 2), dtype=np.int16)
+        self.head = 0   # Slot the next point is written to
+        self.count = 0  # Number of stored points
+        
+    @property
+    def points(self):
+        """
+        Stored points, oldest first
+        
+        Returns:
+            numpy.ndarray: (count, 2) array of x, y coordinates
+        """
+        if self.count < self.max_points:
+            return self.buffer[:self.count]
+        return np.concatenate((self.buffer[self.head:self.max_points],
+                               self.buffer[:self.head]))
+                               
     def add_point(self, x, y):
         """
         Add a point to the path
@@ -174,13 +449,29 @@ class PathTracer:
             x: X-coordinate
             y: Y-coordinate
         """
-        if self.visible:
-            self.points.append((x, y))
+        if self.visible and self.max_points > 0:
+            x = int(x)
+            y = int(y)
+            head = self.head
+            self.buffer[head, 0] = x
+            self.buffer[head, 1] = y
+            self.head = (head + 1) % self.max_points
+            if self.count < self.max_points:
+                self.count += 1
+            self._new_points += 1
+            self._prev_point = self._last_point
+            self._last_point = (x, y)
             
     def clear(self):
         """Clear all points from the path"""
-        self.points.clear()
-        
+        self.head = 0
+        self.count = 0
+        self._new_points = 0
+        self._last_point = None
+        self._prev_point = None
+        if self.layer is not None:
+            self.layer.fill((0, 0, 0, 0))
+            
     def set_color(self, r, g, b):
         """
         Set the path color
@@ -190,8 +481,15 @@ class PathTracer:
             g: Green component (0-255)
             b: Blue component (0-255)
         """
+        if (r, g, b) == tuple(self.color[:3]):
+            return
         self.color = (r, g, b)
         
+        # Recolor the path drawn so far, keeping each pixel's faded alpha
+        if self.layer is not None:
+            self.layer.fill((0, 0, 0), special_flags=pygame.BLEND_RGB_MULT)
+            self.layer.fill((r, g, b), special_flags=pygame.BLEND_RGB_ADD)
+        
     def set_duration(self, seconds, fps=60):
         """
         Set the path duration by adjusting the number of stored points
@@ -200,56 +498,280 @@ class PathTracer:
             seconds: Duration in seconds
             fps: Frames per second of the simulation
         """
-        self.max_points = int(seconds * fps)
-        new_points = deque(maxlen=self.max_points)
-        
-        # Preserve existing points up to the new maximum
-        for i, point in enumerate(self.points):
-            if i < self.max_points:
-                new_points.append(point)
-                
-        self.points = new_points
-        
-    def render(self, surface):
+        # Preserve the newest existing points up to the new maximum
+        old_points = self.points
+        self.duration = seconds
+        self._allocate(int(seconds * fps))
+        kept = min(len(old_points), self.max_points)
+        if kept:
+            self.buffer[:kept] = old_points[-kept:]
+            self.count = kept
+            self.head = kept % self.max_points
+            
+    def render(self, surface, bounds=None, point=None):
         """
         Render the path to a surface
         
         Args:
             surface: Pygame surface to render on
+            bounds: pygame.Rect of the surface the path can reach, or None
+                    for the whole surface
+            point: (x, y) to add to the path before drawing, or None
         """
-        if not self.visible or len(self.points) < 2:
+        if point is not None:
+            self.add_point(point[0], point[1])
+            
+        if not self.visible or self.count < 2:
+            self._new_points = 0
             return
             
-        # Draw path with fading opacity
-        points_list = list(self.points)
-        for i in range(1, len(points_list)):
-            # Calculate opacity based on position in the path
-            # Newer points are more opaque
-            alpha = int(255 * (i / len(points_list)))
+        if bounds is None:
+            bounds = surface.get_rect()
+            
+        if self.layer is None or bounds != self.layer_rect:
+            # Size or position changed, so redraw the stored path
+            self._rebuild_layer(bounds)
+        else:
+            # Fade the existing path so a point disappears after duration
+            # seconds however often it is rendered, carrying fractions
+            # between renders
+            now = time.perf_counter()
+            elapsed = min(now - self._last_render, self.MAX_FADE_STEP)
+            self._last_render = now
+            if self.duration > 0.0:
+                self._fade_carry += 255.0 * elapsed / self.duration
+            fade = int(self._fade_carry)
+            if fade:
+                self._fade_carry -= fade
+                self.layer.fill((0, 0, 0, min(fade, 255)), special_flags=pygame.BLEND_RGBA_SUB)
+                
+            # Draw only the segments added since the last frame. The usual
+            # single new segment comes from the ints kept by add_point,
+            # without reading back from the buffer.
+            new_points = self._new_points
+            if new_points == 1 and self._prev_point is not None:
+                left, top = bounds.topleft
+                prev_x, prev_y = self._prev_point
+                last_x, last_y = self._last_point
+                pygame.draw.line(self.layer, self.color, (prev_x - left, prev_y - top),
+                                 (last_x - left, last_y - top), 2)
+            elif new_points:
+                points = self._latest_points(new_points + 1) - bounds.topleft
+                pygame.draw.lines(self.layer, self.color, False, points.tolist(), 2)
+                
+        self._new_points = 0
+        surface.blit(self.layer, bounds.topleft)
+        
+    def _latest_points(self, n):
+        """
+        Get the newest stored points
+        
+        Args:
+            n: Number of points wanted
+            
+        Returns:
+            numpy.ndarray: (min(n, count), 2) array of points, oldest first
+        """
+        n = min(n, self.count)
+        indices = np.arange(self.head - n, self.head) % self.max_points
+        return self.buffer[indices]
+        
+    def _rebuild_layer(self, bounds):
+        """
+        Allocate the path layer for an area and redraw the stored path
+        
+        The path is drawn in REBUILD_BANDS pieces of increasing opacity,
+        approximating the fade of an incrementally drawn path.
+        
+        Args:
+            bounds: pygame.Rect of the screen area the layer covers
+        """
+        self.layer = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        self.layer_rect = pygame.Rect(bounds)
+        self._fade_carry = 0.0
+        self._last_render = time.perf_counter()
+        
+        points = self.points - bounds.topleft
+        segments = len(points) - 1
+        bands = self.REBUILD_BANDS
+        r, g, b = self.color[:3]
+        for band in range(bands):
+            start = band * segments // bands
+            end = (band + 1) * segments // bands + 1
+            if end - start >= 2:
+                alpha = 255 * (band + 1) // bands
+                pygame.draw.lines(self.layer, (r, g, b, alpha), False,
+                                  points[start:end].tolist(), 2)
+
+
+class PendulumState:
+    """
+    Structure-of-arrays storage for the state of many pendulums
+    
+    Each field is a numpy array with one slot per pendulum; slots
+    [0, count) are live. Pendulum objects hold a slot index and read and
+    write their fields through it.
+    """
+    
+    # Per-pendulum numeric fields, each stored as one array
+    FIELDS = ("angle1", "angle2", "velocity1", "velocity2",
+              "mass1", "mass2", "length1", "length2",
+              "x1", "y1", "x2", "y2", "offset_x", "offset_y")
+              
+    # Bob positions are derived each step and only drawn, so single
+    # precision is plenty and halves their footprint; everything that is
+    # integrated stays double precision to keep energy drift down. Anchor
+    # offsets are whole pixels, so hit tests against them need no floats
+    # wider than the positions
+    FIELD_DTYPES = {"x1": np.float32, "y1": np.float32,
+                    "x2": np.float32, "y2": np.float32,
+                    "offset_x": np.int16, "offset_y": np.int16}
+                    
+    def __init__(self, capacity=8):
+        """
+        Initialize the state storage
+        
+        Args:
+            capacity: Number of slots to allocate up front
+        """
+        self.count = 0
+        self.capacity = max(1, capacity)
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(self.capacity, self.FIELD_DTYPES.get(name, np.float64)))
+        self.dragging = np.zeros(self.capacity, dtype=bool)
+        
+    def allocate(self):
+        """
+        Reserve a slot for a new pendulum, growing the arrays if full
+        
+        Returns:
+            int: Index of the new slot
+        """
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+            
+        index = self.count
+        for name in self.FIELDS:
+            getattr(self, name)[index] = 0.0
+        self.dragging[index] = False
+        
+        self.count += 1
+        return index
+        
+    def release(self, index):
+        """
+        Free a slot by moving the last live slot into it
+        
+        Args:
+            index: Index of the slot to free
             
-            # Create color with alpha
-            color = (*self.color, alpha)
+        Returns:
+            int: Former index of the slot moved into index, or None if
+                 index was already the last slot
+        """
+        last = self.count - 1
+        self.count = last
+        if index == last:
+            return None
             
-            # Draw line segment
-            pygame.draw.line(surface, color, points_list[i-1], points_list[i], 2)
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            array[index] = array[last]
+        self.dragging[index] = self.dragging[last]
+        return last
+        
+    def clear(self):
+        """Release all slots"""
+        self.count = 0
+        
+    def _grow(self, capacity):
+        """
+        Reallocate every array with a larger capacity
+        
+        Args:
+            capacity: New number of slots
+        """
+        count = self.count
+        for name in self.FIELDS + ("dragging",):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:count] = old[:count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+
+def _state_field(name, cast=float):
+    """
+    Build a property that reads and writes one PendulumState field
+    
+    Args:
+        name: Name of the PendulumState array
+        cast: Conversion applied when reading, so callers get Python scalars
+        
+    Returns:
+        property: Accessor for the pendulum's slot in that array
+    """
+    def fget(self):
+        return cast(getattr(self.state, name)[self.index])
+        
+    def fset(self, value):
+        getattr(self.state, name)[self.index] = value
+        
+    return property(fget, fset)
 
 
 class Pendulum:
     """
     Models a double pendulum with physics calculations and rendering
+    
+    Physical state lives in a slot of a PendulumState, so a PendulumSystem
+    can step all of its pendulums with whole-array operations.
     """
     
-    def __init__(self, pendulum_id):
+    # The object is only a handle onto its state slot plus a few
+    # presentation fields, so it carries no per-instance dict
+    __slots__ = ("id", "path_tracer", "initial_state", "state", "index",
+                 "acceleration1", "acceleration2", "_cart_dirty", "screen_positions",
+                 "show_wire", "drag_joint")
+                 
+    # Views onto this pendulum's slot in the shared state arrays
+    angle1 = _state_field("angle1")
+    angle2 = _state_field("angle2")
+    velocity1 = _state_field("velocity1")
+    velocity2 = _state_field("velocity2")
+    mass1 = _state_field("mass1")
+    mass2 = _state_field("mass2")
+    length1 = _state_field("length1")
+    length2 = _state_field("length2")
+    x1 = _state_field("x1")
+    y1 = _state_field("y1")
+    x2 = _state_field("x2")
+    y2 = _state_field("y2")
+    offset_x = _state_field("offset_x", int)
+    offset_y = _state_field("offset_y", int)
+    dragging = _state_field("dragging", bool)
+    
+    def __init__(self, pendulum_id, state=None, index=None):
         """
         Initialize the pendulum with a unique ID
         
         Args:
             pendulum_id: Unique identifier for this pendulum
+            state: PendulumState holding the physical state, or None for
+                   a private single-slot store
+            index: Slot in state reserved for this pendulum, or None to
+                   allocate one
         """
         self.id = pendulum_id
         self.path_tracer = PathTracer()
         self.initial_state = None
         
+        # Slot in the state arrays
+        if state is None:
+            state = PendulumState(1)
+        self.state = state
+        self.index = state.allocate() if index is None else index
+        
         # Physical state
         self.offset_x = 0
         self.offset_y = 0
@@ -264,11 +786,15 @@ class Pendulum:
         self.acceleration1 = 0
         self.acceleration2 = 0
         
-        # Cartesian positions
+        # Cartesian positions, and whether they lag the angles/lengths
         self.x1 = 0
         self.y1 = 0
         self.x2 = 0
         self.y2 = 0
+        self._cart_dirty = False
+        
+        # Screen positions from the last render, see hit_test
+        self.screen_positions = None
         
         # Visual properties
         self.show_wire = True
@@ -308,71 +834,63 @@ class Pendulum:
         # Calculate initial positions
         self._calculate_cartesian_positions()
         
-    def update(self, dt, gravity):
-        """
-        Update pendulum physics
-        
-        Args:
-            dt: Delta time in seconds
-            gravity: Gravity value to use for calculations
-        """
-        if self.dragging:
-            # Skip physics update when being dragged
-            return
-            
-        # Perform Velocity Verlet integration
-        self._velocity_verlet_step(dt, gravity)
-        
-        # Calculate Cartesian positions from angles
-        self._calculate_cartesian_positions()
-        
-        # We won't add the point here anymore - it will be done in render
-        # to ensure screen coordinates are used
-        
-    def render(self, surface):
+    def render(self, surface, screen_center=None):
         """
         Render the pendulum to a surface
         
         Args:
             surface: Pygame surface to render on
+            screen_center: (x, y) center of the surface, if already known
         """
-        # Calculate anchor point (center of screen + offset)
-        anchor_x = surface.get_width() // 2 + self.offset_x
-        anchor_y = surface.get_height() // 2 + self.offset_y
-        
-        # Convert to screen coordinates
-        screen_x1 = anchor_x + self.x1
-        screen_y1 = anchor_y + self.y1
-        screen_x2 = anchor_x + self.x2
-        screen_y2 = anchor_y + self.y2
-        
-        # Add point to path tracer for the second bob using screen coordinates
-        if not self.dragging:
-            self.path_tracer.add_point(screen_x2, screen_y2)
-        
-        # Render path
-        self.path_tracer.render(surface)
-        
-        # Draw pendulum wires if enabled
+        # Anchor point is the center of the surface plus the offset
+        if screen_center is None:
+            screen_center = (surface.get_width() // 2, surface.get_height() // 2)
+            
+        # Convert to screen coordinates, keeping them for hit-tests until
+        # the next frame
+        self.screen_positions = self._calculate_screen_positions(screen_center)
+        anchor_x, anchor_y, screen_x1, screen_y1, screen_x2, screen_y2 = self.screen_positions
+        
+        # Extend and render the path of the second bob in one call,
+        # limited to the box the bob can reach. The reach is rounded up
+        # so small length changes don't force the path layer to be rebuilt.
+        reach = (int(self.length1 + self.length2) + 35) & ~31
+        self.path_tracer.render(
+            surface, pygame.Rect(anchor_x - reach, anchor_y - reach, 2 * reach, 2 * reach),
+            None if self.dragging else (screen_x2, screen_y2))
+            
+        # Draw both pendulum rods as one polyline if enabled
         if self.show_wire:
-            # Draw first pendulum rod
-            pygame.draw.line(surface, (100, 100, 100), 
-                            (anchor_x, anchor_y), (screen_x1, screen_y1), 2)
-            # Draw second pendulum rod
-            pygame.draw.line(surface, (100, 100, 100), 
-                            (screen_x1, screen_y1), (screen_x2, screen_y2), 2)
-        
-        # Draw anchor point
-        pygame.draw.circle(surface, (150, 150, 150), (anchor_x, anchor_y), 6)
-        
-        # Draw first bob
-        pygame.draw.circle(surface, (200, 100, 100), (screen_x1, screen_y1), 
-                          int(self.mass1 * 0.8))
-        
-        # Draw second bob
-        pygame.draw.circle(surface, (100, 100, 200), (screen_x2, screen_y2), 
-                          int(self.mass2 * 0.8))
+            pygame.draw.lines(surface, (100, 100, 100), False,
+                              ((anchor_x, anchor_y), (screen_x1, screen_y1), (screen_x2, screen_y2)), 2)
+                              
+        # Blit the anchor point and both bobs from pre-rendered circles
+        radius1 = int(self.mass1 * 0.8)
+        radius2 = int(self.mass2 * 0.8)
+        surface.blits((
+            (_get_disc((150, 150, 150), 6), (anchor_x - 7, anchor_y - 7)),
+            (_get_disc((200, 100, 100), radius1), (screen_x1 - radius1 - 1, screen_y1 - radius1 - 1)),
+            (_get_disc((100, 100, 200), radius2), (screen_x2 - radius2 - 1, screen_y2 - radius2 - 1)),
+        ), doreturn=False)
+        
+    def get_bounds(self, screen_center):
+        """
+        Get the area render can draw on
         
+        Args:
+            screen_center: (x, y) center of the surface
+            
+        Returns:
+            pygame.Rect: Square around the anchor holding the path, rods and bobs
+        """
+        # The path layer reaches at most 35 pixels past the rods, and the
+        # bobs their radius plus a pixel of rod width
+        radius = int(max(self.mass1, self.mass2) * 0.8)
+        half = int(self.length1 + self.length2) + max(36, radius + 2)
+        return pygame.Rect(screen_center[0] + self.offset_x - half,
+                           screen_center[1] + self.offset_y - half,
+                           2 * half, 2 * half)
+                           
     def reset(self):
         """Reset pendulum to initial state"""
         if self.initial_state:
@@ -391,7 +909,9 @@ class Pendulum:
         else:
             self.length2 = value
             
-        self._calculate_cartesian_positions()
+        # Positions are recomputed on next use, so a burst of slider
+        # events costs no trig
+        self._cart_dirty = True
         
     def set_mass(self, bob, value):
         """
@@ -419,7 +939,7 @@ class Pendulum:
         else:
             self.angle2 = value
             
-        self._calculate_cartesian_positions()
+        self._cart_dirty = True
         
     def set_velocity(self, joint, value):
         """
@@ -449,37 +969,49 @@ class Pendulum:
         Returns:
             bool: True if drag started, False otherwise
         """
-        # Adjust position to be relative to anchor point
-        anchor_x = screen_center[0] + self.offset_x
-        anchor_y = screen_center[1] + self.offset_y
+        joint = self.hit_test(position, screen_center)
+        if joint:
+            self.dragging = True
+            self.drag_joint = joint
+            return True
+            
+        return False
         
-        # Calculate screen positions of bobs
-        screen_x1 = anchor_x + self.x1
-        screen_y1 = anchor_y + self.y1
-        screen_x2 = anchor_x + self.x2
-        screen_y2 = anchor_y + self.y2
+    def hit_test(self, position, screen_center):
+        """
+        Find which bob, if any, is under a screen position
         
-        # Check if mouse is near second bob (check this first as it's usually on top)
-        dx2 = position[0] - screen_x2
-        dy2 = position[1] - screen_y2
-        dist2 = math.sqrt(dx2*dx2 + dy2*dy2)
+        Uses the positions from the last render when available, so the
+        test matches what is on screen.
         
-        if dist2 <= max(10, self.mass2):
-            self.dragging = True
-            self.drag_joint = 2
-            return True
+        Args:
+            position: (x, y) position to check
+            screen_center: (x, y) center of the screen
+            
+        Returns:
+            int: 2 for the second bob, 1 for the first bob, 0 for neither
+        """
+        positions = self.screen_positions
+        if positions is None:
+            positions = self._calculate_screen_positions(screen_center)
+        _, _, screen_x1, screen_y1, screen_x2, screen_y2 = positions
         
-        # Check if mouse is near first bob
+        # Check if position is near second bob (check this first as it's
+        # usually on top); squared distances avoid a sqrt per test
+        dx2 = position[0] - screen_x2
+        dy2 = position[1] - screen_y2
+        mass2 = self.mass2
+        if dx2*dx2 + dy2*dy2 <= max(MIN_HIT_RADIUS_SQ, mass2*mass2):
+            return 2
+            
+        # Check if position is near first bob
         dx1 = position[0] - screen_x1
         dy1 = position[1] - screen_y1
-        dist1 = math.sqrt(dx1*dx1 + dy1*dy1)
-        
-        if dist1 <= max(10, self.mass1):
-            self.dragging = True
-            self.drag_joint = 1
-            return True
+        mass1 = self.mass1
+        if dx1*dx1 + dy1*dy1 <= max(MIN_HIT_RADIUS_SQ, mass1*mass1):
+            return 1
             
-        return False
+        return 0
         
     def update_drag(self, position, screen_center):
         """
@@ -517,8 +1049,9 @@ class Pendulum:
             # We need to find the angle that puts the second bob at the mouse position
             # This is more complex as it depends on both angles and lengths
             
-            # First, calculate position of first bob
-            self._calculate_cartesian_positions()
+            # First bob position
+            if self._cart_dirty:
+                self._calculate_cartesian_positions()
             first_bob_x = self.x1
             first_bob_y = self.y1
             
@@ -538,8 +1071,8 @@ class Pendulum:
             self.velocity1 = 0
             self.velocity2 = 0
             
-        # Update cartesian positions
-        self._calculate_cartesian_positions()
+        # Cartesian positions are recomputed on next use
+        self._cart_dirty = True
         
     def end_drag(self):
         """End the drag operation"""
@@ -549,113 +1082,48 @@ class Pendulum:
         # Clear path when drag ends
         self.path_tracer.clear()
         
-    def _velocity_verlet_step(self, dt, gravity):
+    def _calculate_screen_positions(self, screen_center):
         """
-        Perform a velocity Verlet integration step for accurate physics
+        Calculate screen positions of the anchor and both bobs
         
         Args:
-            dt: Time step
-            gravity: Gravity value
-        """
-        # Save current accelerations
-        accel1_old = self._calculate_acceleration1(gravity)
-        accel2_old = self._calculate_acceleration2(gravity)
-        
-        # Half-step velocity update
-        self.velocity1 += 0.5 * accel1_old * dt
-        self.velocity2 += 0.5 * accel2_old * dt
-        
-        # Full-step position update
-        self.angle1 += self.velocity1 * dt
-        self.angle2 += self.velocity2 * dt
-        
-        # Normalize angles to [-π, π] range
-        self.angle1 = ((self.angle1 + math.pi) % (2 * math.pi)) - math.pi
-        self.angle2 = ((self.angle2 + math.pi) % (2 * math.pi)) - math.pi
-        
-        # Calculate new accelerations after position update
-        accel1_new = self._calculate_acceleration1(gravity)
-        accel2_new = self._calculate_acceleration2(gravity)
-        
-        # Complete velocity update
-        self.velocity1 += 0.5 * accel1_new * dt
-        self.velocity2 += 0.5 * accel2_new * dt
-        
-    def _calculate_acceleration1(self, gravity):
-        """
-        Calculate angular acceleration for the first pendulum
-        Based on the equations of motion for a double pendulum
-        
-        Args:
-            gravity: Gravity value
+            screen_center: (x, y) center of the screen
             
         Returns:
-            float: Angular acceleration
+            tuple: (anchor_x, anchor_y, x1, y1, x2, y2) in screen coordinates
         """
-        # Double pendulum equation variables
-        g = gravity
-        m1 = self.mass1
-        m2 = self.mass2
-        l1 = self.length1
-        l2 = self.length2
-        a1 = self.angle1
-        a2 = self.angle2
-        v1 = self.velocity1
-        v2 = self.velocity2
-        
-        # Double pendulum equations of motion for first pendulum
-        # Using the Lagrangian formulation
-        num1 = -g * (2 * m1 + m2) * math.sin(a1)
-        num2 = -m2 * g * math.sin(a1 - 2 * a2)
-        num3 = -2 * math.sin(a1 - a2) * m2 * (v2**2 * l2 + v1**2 * l1 * math.cos(a1 - a2))
-        den = l1 * (2 * m1 + m2 - m2 * math.cos(2 * a1 - 2 * a2))
-        
-        return (num1 + num2 + num3) / den
-        
-    def _calculate_acceleration2(self, gravity):
-        """
-        Calculate angular acceleration for the second pendulum
-        Based on the equations of motion for a double pendulum
-        
-        Args:
-            gravity: Gravity value
+        if self._cart_dirty:
+            self._calculate_cartesian_positions()
             
-        Returns:
-            float: Angular acceleration
+        anchor_x = screen_center[0] + self.offset_x
+        anchor_y = screen_center[1] + self.offset_y
+        return (anchor_x, anchor_y,
+                anchor_x + self.x1, anchor_y + self.y1,
+                anchor_x + self.x2, anchor_y + self.y2)
+                
+    def _calculate_cartesian_positions(self, _sin=math.sin, _cos=math.cos):
         """
-        # Double pendulum equation variables
-        g = gravity
-        m1 = self.mass1
-        m2 = self.mass2
+        Calculate Cartesian (x,y) positions from pendulum angles
+        """
+        # Read each state field once
         l1 = self.length1
         l2 = self.length2
         a1 = self.angle1
         a2 = self.angle2
-        v1 = self.velocity1
-        v2 = self.velocity2
-        
-        # Double pendulum equations of motion for second pendulum
-        # Using the Lagrangian formulation
-        num1 = 2 * math.sin(a1 - a2)
-        num2 = v1**2 * l1 * (m1 + m2) + g * (m1 + m2) * math.cos(a1)
-        num3 = v2**2 * l2 * m2 * math.cos(a1 - a2)
-        den = l2 * (2 * m1 + m2 - m2 * math.cos(2 * a1 - 2 * a2))
         
-        return num1 * (num2 + num3) / den
-        
-    def _calculate_cartesian_positions(self):
-        """
-        Calculate Cartesian (x,y) positions from pendulum angles
-        """
         # First pendulum bob position
-        self.x1 = self.length1 * math.sin(self.angle1)
-        self.y1 = self.length1 * math.cos(self.angle1)
+        x1 = l1 * _sin(a1)
+        y1 = l1 * _cos(a1)
+        self.x1 = x1
+        self.y1 = y1
         
         # Second pendulum bob position (relative to first)
-        self.x2 = self.x1 + self.length2 * math.sin(self.angle2)
-        self.y2 = self.y1 + self.length2 * math.cos(self.angle2)
+        self.x2 = x1 + l2 * _sin(a2)
+        self.y2 = y1 + l2 * _cos(a2)
+        
+        self._cart_dirty = False
         
-    def calculate_energy(self, gravity):
+    def calculate_energy(self, gravity, _sin=math.sin, _cos=math.cos):
         """
         Calculate the total energy of the pendulum system
         
@@ -677,16 +1145,20 @@ class Pendulum:
         v2 = self.velocity2
         
         # Calculate positions
-        x1 = l1 * math.sin(a1)
-        y1 = -l1 * math.cos(a1)  # Negative as y increases downward
-        x2 = x1 + l2 * math.sin(a2)
-        y2 = y1 - l2 * math.cos(a2)
+        sin_a1 = _sin(a1)
+        cos_a1 = _cos(a1)
+        sin_a2 = _sin(a2)
+        cos_a2 = _cos(a2)
+        x1 = l1 * sin_a1
+        y1 = -l1 * cos_a1  # Negative as y increases downward
+        x2 = x1 + l2 * sin_a2
+        y2 = y1 - l2 * cos_a2
         
         # Calculate velocities in Cartesian coordinates
-        vx1 = l1 * v1 * math.cos(a1)
-        vy1 = l1 * v1 * math.sin(a1)
-        vx2 = vx1 + l2 * v2 * math.cos(a2)
-        vy2 = vy1 + l2 * v2 * math.sin(a2)
+        vx1 = l1 * v1 * cos_a1
+        vy1 = l1 * v1 * sin_a1
+        vx2 = vx1 + l2 * v2 * cos_a2
+        vy2 = vy1 + l2 * v2 * sin_a2
         
         # Kinetic energy: KE = 0.5 * m * v^2
         ke1 = 0.5 * m1 * (vx1**2 + vy1**2)
@@ -710,20 +1182,41 @@ class PendulumSystem:
     Manages multiple pendulums and provides a unified interface for the simulation
     """
     
+    # Up to this many pendulums, update steps each through the scalar
+    # kernel instead of the vectorized numpy path
+    SCALAR_UPDATE_LIMIT = 16
+    
+    # State arrays the update routines work on, in kernel argument order
+    _UPDATE_FIELDS = ("angle1", "angle2", "velocity1", "velocity2",
+                      "mass1", "mass2", "length1", "length2", "dragging",
+                      "x1", "y1", "x2", "y2")
+                      
     def __init__(self):
         """Initialize the pendulum system"""
-        self.pendulums = {}  # Dictionary of pendulum_id -> Pendulum
+        self.pendulums = []  # Pendulums in state slot order
+        self.pendulums_by_id = {}  # Dictionary of pendulum_id -> Pendulum
         self.selected_pendulum = None
         self.next_pendulum_id = 0
+        self.max_internal_dt = MAX_INTERNAL_DT
+        
+        # Shared state arrays; slot i belongs to self.pendulums[i]
+        self.state = PendulumState()
+        
+        # Update routine chosen for the current pendulum count, see update
+        self._update_key = None
+        self._update_impl = None
+        self._update_views = ()
         
     def initialize(self):
         """Initialize the pendulum system"""
         # Clear any existing pendulums
         self.pendulums.clear()
+        self.pendulums_by_id.clear()
+        self.state.clear()
         self.selected_pendulum = None
         self.next_pendulum_id = 0
         
-        print("Pendulum system initialized")
+        log.debug("Pendulum system initialized")
         
     def update(self, dt, gravity):
         """
@@ -733,8 +1226,128 @@ class PendulumSystem:
             dt: Delta time in seconds
             gravity: Gravity value to use
         """
-        for pendulum in self.pendulums.values():
-            pendulum.update(dt, gravity)
+        state = self.state
+        n = state.count
+        if n == 0:
+            return
+            
+        steps = _substep_count(dt, self.max_internal_dt)
+        sub_dt = dt / steps
+        
+        # The update routine and the array views it works on only depend
+        # on the pendulum count and the arrays' capacity, so they are
+        # chosen again only when one of those changes
+        if self._update_key != (n, state.capacity):
+            self._select_update(n)
+        self._update_impl(sub_dt, steps, gravity)
+        
+    def _select_update(self, n):
+        """
+        Choose the update routine for n pendulums and slice its array views
+        
+        Args:
+            n: Number of live slots
+        """
+        state = self.state
+        self._update_key = (n, state.capacity)
+        self._update_views = tuple(getattr(state, name)[:n] for name in self._UPDATE_FIELDS)
+        
+        # For a handful of pendulums the per-call cost of numpy outweighs
+        # its vector speed, so each one is stepped through the scalar
+        # kernel; with numba, one compiled call steps any larger system
+        if n <= self.SCALAR_UPDATE_LIMIT:
+            self._update_impl = self._update_scalar
+        elif _update_system_ready():
+            self._update_impl = self._update_compiled
+        else:
+            self._update_impl = self._update_vector
+            
+            # Choose again on the next update, until the kernel is compiled
+            if _update_system_pending():
+                self._update_key = None
+            
+    def _update_compiled(self, dt, steps, gravity):
+        """
+        Step every live slot with the parallel numba kernel
+        
+        Args:
+            dt: Size of each substep
+            steps: Number of substeps
+            gravity: Gravity value to use
+        """
+        _update_system_nb(*self._update_views, gravity, dt, steps)
+        
+    def _update_vector(self, dt, steps, gravity):
+        """
+        Step every live slot at once with numpy array operations
+        
+        Args:
+            dt: Size of each substep
+            steps: Number of substeps
+            gravity: Gravity value to use
+        """
+        # Live slices of the state arrays (views, so writes land in place)
+        a1, a2, v1, v2, m1, m2, l1, l2, dragging, x1, y1, x2, y2 = self._update_views
+        
+        # Pendulums being dragged keep their state
+        moving = ~dragging
+        
+        # Runge-Kutta steps for every pendulum at once, in substeps of at
+        # most max_internal_dt
+        terms = mass_terms_vec(m1, m2, l1, l2, gravity)
+        new_a1, new_a2, new_v1, new_v2 = a1, a2, v1, v2
+        for _ in range(steps):
+            new_a1, new_a2, new_v1, new_v2 = rk4_step_vec(
+                new_a1, new_a2, new_v1, new_v2, m1, m2, l1, l2, gravity, dt, terms)
+                
+        np.copyto(a1, new_a1, where=moving)
+        np.copyto(a2, new_a2, where=moving)
+        np.copyto(v1, new_v1, where=moving)
+        np.copyto(v2, new_v2, where=moving)
+        
+        # Cartesian positions from the (possibly unchanged) angles
+        np.multiply(l1, np.sin(a1), out=x1)
+        np.multiply(l1, np.cos(a1), out=y1)
+        np.add(x1, l2 * np.sin(a2), out=x2)
+        np.add(y1, l2 * np.cos(a2), out=y2)
+        
+    def _update_scalar(self, dt, steps, gravity, _sin=math.sin, _cos=math.cos):
+        """
+        Step every live slot one pendulum at a time
+        
+        Args:
+            dt: Size of each substep
+            steps: Number of substeps
+            gravity: Gravity value to use
+        """
+        state = self.state
+        angle1, angle2 = state.angle1, state.angle2
+        velocity1, velocity2 = state.velocity1, state.velocity2
+        length1, length2 = state.length1, state.length2
+        
+        for i in range(state.count):
+            # Pendulums being dragged keep their state
+            if state.dragging[i]:
+                continue
+                
+            l1 = length1.item(i)
+            l2 = length2.item(i)
+            a1, a2, v1, v2 = _rk4_substeps_nb(
+                angle1.item(i), angle2.item(i), velocity1.item(i), velocity2.item(i),
+                state.mass1.item(i), state.mass2.item(i), l1, l2,
+                gravity, dt, steps)
+            angle1[i] = a1
+            angle2[i] = a2
+            velocity1[i] = v1
+            velocity2[i] = v2
+            
+            # Cartesian positions
+            x1 = l1 * _sin(a1)
+            y1 = l1 * _cos(a1)
+            state.x1[i] = x1
+            state.y1[i] = y1
+            state.x2[i] = x1 + l2 * _sin(a2)
+            state.y2[i] = y1 + l2 * _cos(a2)
             
     def render(self, surface):
         """
@@ -743,9 +1356,28 @@ class PendulumSystem:
         Args:
             surface: Pygame surface to render on
         """
-        for pendulum in self.pendulums.values():
-            pendulum.render(surface)
+        # The surface center is shared by every pendulum, so look it up once
+        screen_center = (surface.get_width() // 2, surface.get_height() // 2)
+        for pendulum in self.pendulums:
+            pendulum.render(surface, screen_center)
             
+    def get_bounds(self, screen_center):
+        """
+        Get the area render can draw on
+        
+        Args:
+            screen_center: (x, y) center of the surface
+            
+        Returns:
+            pygame.Rect: Union of every pendulum's bounds, or None if there
+                         are no pendulums
+        """
+        if not self.pendulums:
+            return None
+        bounds = self.pendulums[0].get_bounds(screen_center)
+        bounds.unionall_ip([pendulum.get_bounds(screen_center) for pendulum in self.pendulums[1:]])
+        return bounds
+        
     def create_pendulum(self, params):
         """
         Create a new pendulum with given parameters
@@ -759,15 +1391,16 @@ class PendulumSystem:
         pendulum_id = self.next_pendulum_id
         self.next_pendulum_id += 1
         
-        pendulum = Pendulum(pendulum_id)
+        pendulum = Pendulum(pendulum_id, self.state, self.state.allocate())
         pendulum.initialize(params)
         
-        self.pendulums[pendulum_id] = pendulum
+        self.pendulums.append(pendulum)
+        self.pendulums_by_id[pendulum_id] = pendulum
         
         # Select the newly created pendulum
         self.selected_pendulum = pendulum
         
-        print(f"Created pendulum with ID: {pendulum_id}")
+        log.debug("Created pendulum with ID: %s", pendulum_id)
         return pendulum
         
     def remove_pendulum(self, pendulum_id):
@@ -780,17 +1413,23 @@ class PendulumSystem:
         Returns:
             bool: True if removed, False if not found
         """
-        if pendulum_id in self.pendulums:
+        if pendulum_id in self.pendulums_by_id:
             # If removing the selected pendulum, clear selection
             if self.selected_pendulum and self.selected_pendulum.id == pendulum_id:
                 self.selected_pendulum = None
                 
-            # Remove the pendulum
-            del self.pendulums[pendulum_id]
-            print(f"Removed pendulum with ID: {pendulum_id}")
+            # Remove the pendulum and free its slot; the last pendulum
+            # moves into the gap, in the list as in the state arrays
+            pendulum = self.pendulums_by_id.pop(pendulum_id)
+            moved_from = self.state.release(pendulum.index)
+            moved = self.pendulums.pop()
+            if moved_from is not None:
+                moved.index = pendulum.index
+                self.pendulums[pendulum.index] = moved
+            log.debug("Removed pendulum with ID: %s", pendulum_id)
             return True
         else:
-            print(f"Pendulum with ID {pendulum_id} not found")
+            log.warning("Pendulum with ID %s not found", pendulum_id)
             return False
             
     def select_pendulum(self, pendulum_id):
@@ -803,12 +1442,13 @@ class PendulumSystem:
         Returns:
             Pendulum: The selected pendulum or None if not found
         """
-        if pendulum_id in self.pendulums:
-            self.selected_pendulum = self.pendulums[pendulum_id]
-            print(f"Selected pendulum with ID: {pendulum_id}")
+        pendulum = self.pendulums_by_id.get(pendulum_id)
+        if pendulum:
+            self.selected_pendulum = pendulum
+            log.debug("Selected pendulum with ID: %s", pendulum_id)
             return self.selected_pendulum
         else:
-            print(f"Pendulum with ID {pendulum_id} not found")
+            log.warning("Pendulum with ID %s not found", pendulum_id)
             return None
             
     def get_pendulum_by_id(self, pendulum_id):
@@ -821,7 +1461,7 @@ class PendulumSystem:
         Returns:
             Pendulum: The pendulum or None if not found
         """
-        return self.pendulums.get(pendulum_id)
+        return self.pendulums_by_id.get(pendulum_id)
         
     def get_selected_pendulum(self):
         """
@@ -844,8 +1484,37 @@ class PendulumSystem:
     def clear(self):
         """Remove all pendulums from the system"""
         self.pendulums.clear()
+        self.pendulums_by_id.clear()
+        self.state.clear()
         self.selected_pendulum = None
-        print("Cleared all pendulums")
+        log.debug("Cleared all pendulums")
+        
+    def simulate_ensemble(self, initial_states, n_steps, dt, gravity, use_gpu=True,
+                          dtype=np.float32):
+        """
+        Integrate a batch of independent pendulums and record their trajectories
+        
+        Meant for sweeps over initial conditions (thousands of pendulums)
+        rather than the interactive simulation; the system's own
+        pendulums are not touched. See app.physics.ensemble, which runs
+        on the GPU through numba.cuda when available.
+        
+        Args:
+            initial_states: (N, 8) array-like, one row per pendulum with
+                            columns in ensemble.FIELDS order
+            n_steps: Number of time steps to take
+            dt: Size of each time step
+            gravity: Gravity value to use
+            use_gpu: Whether to use the GPU when one is available
+            dtype: Storage type of the returned trajectories
+            
+        Returns:
+            numpy.ndarray: (n_steps + 1, 4, N) trajectories
+        """
+        # Imported here so numba.cuda is only loaded by ensemble runs
+        from app.physics import ensemble
+        return ensemble.simulate_ensemble(initial_states, n_steps, dt, gravity,
+                                          use_gpu=use_gpu, dtype=dtype)
         
     def try_select_pendulum_at_position(self, position, screen_center):
         """
@@ -858,35 +1527,42 @@ class PendulumSystem:
         Returns:
             Pendulum: The selected pendulum or None if none at position
         """
-        # Check each pendulum
-        for pendulum in self.pendulums.values():
-            # Adjust position to be relative to anchor point
-            anchor_x = screen_center[0] + pendulum.offset_x
-            anchor_y = screen_center[1] + pendulum.offset_y
-            
-            # Calculate screen positions of bobs
-            screen_x1 = anchor_x + pendulum.x1
-            screen_y1 = anchor_y + pendulum.y1
-            screen_x2 = anchor_x + pendulum.x2
-            screen_y2 = anchor_y + pendulum.y2
-            
-            # Check if position is near second bob
-            dx2 = position[0] - screen_x2
-            dy2 = position[1] - screen_y2
-            dist2 = math.sqrt(dx2*dx2 + dy2*dy2)
-            
-            if dist2 <= max(10, pendulum.mass2):
-                self.selected_pendulum = pendulum
-                return pendulum
-            
-            # Check if position is near first bob
-            dx1 = position[0] - screen_x1
-            dy1 = position[1] - screen_y1
-            dist1 = math.sqrt(dx1*dx1 + dy1*dy1)
-            
-            if dist1 <= max(10, pendulum.mass1):
-                self.selected_pendulum = pendulum
-                return pendulum
+        state = self.state
+        n = state.count
+        if n == 0:
+            return None
+            
+        # Bob positions changed by a setter or drag since the last update
+        # are only recomputed on use, so refresh them before reading the
+        # arrays
+        for pendulum in self.pendulums:
+            if pendulum._cart_dirty:
+                pendulum._calculate_cartesian_positions()
                 
-        # No pendulum found at position
-        return None
\ No newline at end of file
+        # Position relative to every anchor at once (int16, like the offsets)
+        rel_x = (position[0] - screen_center[0]) - state.offset_x[:n]
+        rel_y = (position[1] - screen_center[1]) - state.offset_y[:n]
+        
+        # Squared distances to both bobs, in the bobs' single precision,
+        # counted only within their squared hit radii
+        dx1 = rel_x - state.x1[:n]
+        dy1 = rel_y - state.y1[:n]
+        dx2 = rel_x - state.x2[:n]
+        dy2 = rel_y - state.y2[:n]
+        mass1 = state.mass1[:n]
+        mass2 = state.mass2[:n]
+        dist1 = dx1*dx1 + dy1*dy1
+        dist2 = dx2*dx2 + dy2*dy2
+        dist = np.minimum(
+            np.where(dist1 <= np.maximum(MIN_HIT_RADIUS_SQ, mass1*mass1), dist1, np.inf),
+            np.where(dist2 <= np.maximum(MIN_HIT_RADIUS_SQ, mass2*mass2), dist2, np.inf))
+            
+        # Where pendulums overlap, pick the one with the bob nearest the
+        # position rather than whichever was created first
+        index = int(np.argmin(dist))
+        if dist[index] == np.inf:
+            return None
+            
+        pendulum = self.pendulums[index]
+        self.selected_pendulum = pendulum
+        return pendulum
@@ -3,108 +3,134 @@ Home scene implementation for the double pendulum simulation.
 Provides the main menu and navigation to other scenes.
 """
 
+import logging
 import pygame
 import pygame_gui
 from app.scenes.scene_manager import Scene
 from app.util.scene_navigation import change_scene
+from app.util.glyph_pen import get_pen
+from app.util.fonts import get_font
+
+log = logging.getLogger(__name__)
+
+# Event constants used on every event, bound once at import
+_UI_BUTTON_PRESSED = pygame_gui.UI_BUTTON_PRESSED
 
 class HomeScene(Scene):
     """
     Home scene that serves as the main menu
     """
     
+    __slots__ = ("surface", "config_manager", "ui_manager", "ui_root",
+                 "menu_buttons", "button_rects", "button_actions",
+                 "title_font", "text_font", "background_color", "theme_colors",
+                 "title_surface", "title_rect", "subtitle_surface", "subtitle_rect",
+                 "_dirty", "_animating", "_full_redraw")
+    
     def __init__(self):
         """Initialize scene attributes"""
         self.surface = None
         self.config_manager = None
         self.ui_manager = None
+        self.ui_root = None
         self.menu_buttons = []
+        self.button_rects = []
+        self.button_actions = {}  # Maps id(button) to its click handler
         self.title_font = None
         self.text_font = None
         self.background_color = (240, 240, 245)  # Default light theme
         self.theme_colors = {}
-        
-    def initialize(self, surface, config_manager):
+        self._dirty = True  # Whether the surface needs to be redrawn
+        self._animating = self.UI_SETTLE_TIME  # Seconds left to keep updating the UI
+        self._full_redraw = True  # Whether the next render must repaint everything
+        self.title_surface = None
+        self.title_rect = None
+        self.subtitle_surface = None
+        self.subtitle_rect = None
+        
+    def initialize(self, surface, config_manager, ui_manager):
         """
         Initialize the scene with required resources
         
         Args:
             surface: The pygame surface to render on
             config_manager: The application's configuration manager
+            ui_manager: The pygame_gui.UIManager shared by all scenes
         """
         self.surface = surface
         self.config_manager = config_manager
         
-        # Initialize UI manager
-        self.ui_manager = pygame_gui.UIManager(
-            (surface.get_width(), surface.get_height()))
+        # Use the shared UI manager, keeping this scene's widgets in one container
+        self.ui_manager = ui_manager
+        self.ui_root = pygame_gui.core.UIContainer(surface.get_rect(), manager=ui_manager)
         
         # Load theme colors
-        theme_name = self.config_manager.get_setting("theme", "light")
-        self.theme_colors = self.config_manager.apply_theme(theme_name)
-        self.background_color = self.theme_colors["background"]
+        self.refresh_theme()
         
         # Initialize fonts
-        pygame.font.init()
-        self.title_font = pygame.font.SysFont('Arial', 60, bold=True)
-        self.text_font = pygame.font.SysFont('Arial', 24)
+        self.title_font = get_font('Arial', 60, bold=True)
+        self.text_font = get_font('Arial', 24)
+        
+        # Render the static text once
+        self._rebuild_text_cache()
         
         # Create UI elements
         self._create_ui_elements()
         
-        print("Home scene initialized")
+        log.info("Home scene initialized")
+        
+    def on_enter(self):
+        """Pick up theme changes made elsewhere and redraw"""
+        super().on_enter()
+        self._animating = self.UI_SETTLE_TIME
+        self._full_redraw = True
+        if self.refresh_theme():
+            self._rebuild_text_cache()
+        self._dirty = True
+        
+    def _rebuild_text_cache(self):
+        """
+        Render the title and subtitle surfaces and their positions
+        
+        Call again whenever the fonts or theme colors change.
+        """
+        text_color = self.theme_colors["text"]
+        center_x = self.surface.get_width() // 2
+        
+        self.title_surface = get_pen(self.title_font, text_color).render(
+            'Double Pendulum Simulation')
+        self.title_rect = self.title_surface.get_rect(center=(center_x, 150))
+        
+        self.subtitle_surface = get_pen(self.text_font, text_color).render(
+            'An Educational Physics Tool')
+        self.subtitle_rect = self.subtitle_surface.get_rect(center=(center_x, 210))
         
     def _create_ui_elements(self):
         """Create UI buttons and elements"""
         button_width = 300
         button_height = 60
-        center_x = self.surface.get_width() // 2
+        x = self.surface.get_width() // 2 - button_width // 2
         start_y = 300
         spacing = 80
         
-        # Create simulation button
-        simulation_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                (center_x - button_width // 2, start_y),
-                (button_width, button_height)
-            ),
-            text="Start Simulation",
-            manager=self.ui_manager
-        )
-        self.menu_buttons.append(simulation_button)
-        
-        # Create settings button
-        settings_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                (center_x - button_width // 2, start_y + spacing),
-                (button_width, button_height)
-            ),
-            text="Settings",
-            manager=self.ui_manager
-        )
-        self.menu_buttons.append(settings_button)
-        
-        # Create information button
-        info_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                (center_x - button_width // 2, start_y + spacing * 2),
-                (button_width, button_height)
-            ),
-            text="Information",
-            manager=self.ui_manager
+        # One button per menu entry, stacked down the center of the screen
+        entries = (
+            ("Start Simulation", lambda: change_scene("simulation")),
+            ("Settings", lambda: change_scene("settings")),
+            ("Information", lambda: change_scene("information")),
+            ("Exit", lambda: pygame.event.post(pygame.event.Event(pygame.QUIT))),
         )
-        self.menu_buttons.append(info_button)
-        
-        # Create exit button
-        exit_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                (center_x - button_width // 2, start_y + spacing * 3),
-                (button_width, button_height)
-            ),
-            text="Exit",
-            manager=self.ui_manager
-        )
-        self.menu_buttons.append(exit_button)
+        self.button_rects = [pygame.Rect((x, start_y + spacing * i), (button_width, button_height))
+                             for i in range(len(entries))]
+        for rect, (label, action) in zip(self.button_rects, entries):
+            button = pygame_gui.elements.UIButton(
+                relative_rect=rect,
+                text=label,
+                manager=self.ui_manager,
+                container=self.ui_root
+            )
+            self.menu_buttons.append(button)
+            self.button_actions[id(button)] = action
         
     def update(self, dt):
         """
@@ -113,29 +139,64 @@ class HomeScene(Scene):
         Args:
             dt: Delta time in seconds since last update
         """
-        # Update UI manager
-        self.ui_manager.update(dt)
+        # Widgets only change in response to input, so the UI manager is
+        # left alone once it has settled after the last event
+        if self._animating > 0.0:
+            self._animating -= dt
+            self.ui_manager.update(dt)
+            self._dirty = True
         
     def render(self):
-        """Render the scene to its surface"""
+        """
+        Render the scene to its surface
+        
+        Returns:
+            list: pygame.Rect areas of the surface that changed this frame
+        """
+        self._dirty = False
+        
+        # After input only the buttons can have changed; repaint just them
+        if not self._full_redraw:
+            for rect in self.button_rects:
+                self.surface.fill(self.background_color, rect)
+            self.ui_manager.draw_ui(self.surface)
+            return self.button_rects
+            
         # Clear the screen
         self.surface.fill(self.background_color)
         
-        # Draw title
-        title_text = self.title_font.render('Double Pendulum Simulation', 
-                                          True, self.theme_colors["text"])
-        title_rect = title_text.get_rect(center=(self.surface.get_width() // 2, 150))
-        self.surface.blit(title_text, title_rect)
-        
-        # Draw subtitle
-        subtitle_text = self.text_font.render('An Educational Physics Tool', 
-                                           True, self.theme_colors["text"])
-        subtitle_rect = subtitle_text.get_rect(center=(self.surface.get_width() // 2, 210))
-        self.surface.blit(subtitle_text, subtitle_rect)
+        # Draw title and subtitle from the cached surfaces
+        self.surface.blit(self.title_surface, self.title_rect)
+        self.surface.blit(self.subtitle_surface, self.subtitle_rect)
         
         # Draw UI elements
         self.ui_manager.draw_ui(self.surface)
         
+        # Whole surface is redrawn
+        self._full_redraw = False
+        return [self.surface.get_rect()]
+        
+    def needs_redraw(self):
+        """
+        Check whether render would change anything on the surface
+        
+        The scene is static between events, so it is only redrawn after
+        one arrives.
+        
+        Returns:
+            bool: False if the surface still shows the last rendered frame
+        """
+        return self._dirty
+        
+    def is_idle(self):
+        """
+        Check whether the scene can wait for input without falling behind
+        
+        Returns:
+            bool: True once the widgets have settled and the frame is drawn
+        """
+        return self._animating <= 0.0 and not self._dirty
+        
     def handle_event(self, event):
         """
         Process pygame events
@@ -143,26 +204,21 @@ class HomeScene(Scene):
         Args:
             event: The pygame event to handle
         """
+        # Any input can change widget state (hover, press), so update and redraw
+        self._animating = self.UI_SETTLE_TIME
+        self._dirty = True
+        
         # Process UI events
         self.ui_manager.process_events(event)
         
         # Handle button clicks
-        if event.type == pygame.USEREVENT:
-            if event.user_type == pygame_gui.UI_BUTTON_PRESSED:
-                if event.ui_element == self.menu_buttons[0]:
-                    # Simulation button clicked
-                    change_scene("simulation")
-                elif event.ui_element == self.menu_buttons[1]:
-                    # Settings button clicked
-                    change_scene("settings")
-                elif event.ui_element == self.menu_buttons[2]:
-                    # Information button clicked
-                    change_scene("information")
-                elif event.ui_element == self.menu_buttons[3]:
-                    # Exit button clicked
-                    pygame.event.post(pygame.event.Event(pygame.QUIT))
+        if event.type == _UI_BUTTON_PRESSED:
+            action = self.button_actions.get(id(event.ui_element))
+            if action is not None:
+                action()
                     
     def cleanup(self):
         """Release scene resources"""
-        # Clean up UI manager
+        # Remove this scene's widgets from the shared UI manager
+        super().cleanup()
         self.ui_manager = None
\ No newline at end of file
@@ -3,78 +3,32 @@ Information scene implementation for the double pendulum simulation.
 Provides educational content and usage instructions.
 """
 
+import logging
 import pygame
 import pygame_gui
 from app.scenes.scene_manager import Scene
 from app.util.scene_navigation import change_scene
+from app.util.glyph_pen import get_pen
+from app.util.fonts import get_font
 
-class InformationScene(Scene):
-    """
-    Information scene that provides educational content and usage instructions
-    """
-    
-    def __init__(self):
-        """Initialize scene attributes"""
-        self.surface = None
-        self.config_manager = None
-        self.ui_manager = None
-        self.info_widgets = {}
-        self.title_font = None
-        self.text_font = None
-        self.background_color = (240, 240, 245)  # Default light theme
-        self.theme_colors = {}
-        self.current_section = 0
-        self.info_sections = []
-        self.section_texts = []
-        
-    def initialize(self, surface, config_manager):
-        """
-        Initialize the scene with required resources
-        
-        Args:
-            surface: The pygame surface to render on
-            config_manager: The application's configuration manager
-        """
-        self.surface = surface
-        self.config_manager = config_manager
-        
-        # Initialize UI manager
-        self.ui_manager = pygame_gui.UIManager(
-            (surface.get_width(), surface.get_height()))
-            
-        # Load theme colors
-        theme_name = self.config_manager.get_setting("theme", "light")
-        self.theme_colors = self.config_manager.apply_theme(theme_name)
-        self.background_color = self.theme_colors["background"]
-        
-        # Initialize fonts
-        pygame.font.init()
-        self.title_font = pygame.font.SysFont('Arial', 36, bold=True)
-        self.text_font = pygame.font.SysFont('Arial', 20)
-        
-        # Define information sections
-        self._define_info_sections()
-        
-        # Create UI elements
-        self._create_ui_elements()
-        
-        print("Information scene initialized")
-        
-    def _define_info_sections(self):
-        """Define the content for information sections"""
-        # Section titles
-        self.info_sections = [
-            "About Double Pendulums",
-            "The Physics Behind It",
-            "Application Features",
-            "How to Use the Simulation",
-            "Understanding Chaos Theory"
-        ]
-        
-        # Section content texts
-        self.section_texts = [
-            # About Double Pendulums
-            """A double pendulum consists of two pendulums attached end to end. While it might seem simple, 
+log = logging.getLogger(__name__)
+
+# Event constants used on every event, bound once at import
+_UI_BUTTON_PRESSED = pygame_gui.UI_BUTTON_PRESSED
+
+# Section titles
+SECTION_TITLES = (
+    "About Double Pendulums",
+    "The Physics Behind It",
+    "Application Features",
+    "How to Use the Simulation",
+    "Understanding Chaos Theory",
+)
+
+# Section content texts, in the same order as SECTION_TITLES
+SECTION_TEXTS = (
+    # About Double Pendulums
+    """A double pendulum consists of two pendulums attached end to end. While it might seem simple, 
 its motion is remarkably complex and demonstrates chaotic behavior.
 
 This educational tool allows you to visualize and experiment with the fascinating dynamics of a double pendulum
@@ -84,8 +38,8 @@ The double pendulum is a classic example of a chaotic system - a system that is
 conditions. Even tiny differences in starting position or velocity can lead to completely different paths 
 over time, making long-term prediction impossible despite the system being completely deterministic.""",
 
-            # The Physics Behind It
-            """The motion of a double pendulum is governed by a set of coupled differential equations derived
+    # The Physics Behind It
+    """The motion of a double pendulum is governed by a set of coupled differential equations derived
 from Lagrangian mechanics.
 
 These equations account for:
@@ -95,15 +49,15 @@ These equations account for:
 • The lengths of both rods
 • Gravitational force
 
-This simulation uses a numerical integration technique called the Velocity Verlet method, which provides good
-energy conservation properties. This is important because in a physical double pendulum, total energy should
-remain constant (ignoring air resistance).
+This simulation uses a numerical integration technique called the fourth-order Runge-Kutta method (RK4), which
+keeps the error of each step very small and so conserves energy well. This is important because in a physical
+double pendulum, total energy should remain constant (ignoring air resistance).
 
 The equations of motion are complex and nonlinear, which gives rise to the chaotic behavior observed. Small
 changes in initial conditions can lead to drastically different trajectories.""",
 
-            # Application Features
-            """This application offers several features to help you explore double pendulum physics:
+    # Application Features
+    """This application offers several features to help you explore double pendulum physics:
 
 • Start/Stop/Reset controls to manage simulation flow
 • Adjustable simulation speed
@@ -121,8 +75,8 @@ changes in initial conditions can lead to drastically different trajectories."""
 
 All settings can be adjusted in real-time, allowing you to see the immediate effects of your changes.""",
 
-            # How to Use the Simulation
-            """Getting started with the simulation:
+    # How to Use the Simulation
+    """Getting started with the simulation:
 
 1. From the main menu, click "Start Simulation" to open the simulation screen.
 2. Use the control panel on the left side to adjust parameters.
@@ -142,8 +96,8 @@ Adding Multiple Pendulums:
 
 Remember that small changes to initial conditions can produce dramatically different results!""",
 
-            # Understanding Chaos Theory
-            """The double pendulum is a perfect demonstration of chaos theory in action.
+    # Understanding Chaos Theory
+    """The double pendulum is a perfect demonstration of chaos theory in action.
 
 Key characteristics of chaotic systems include:
 
@@ -159,8 +113,91 @@ With this simulation, you can observe how two pendulums with nearly identical st
 eventually follow completely different paths. This divergence occurs exponentially over time.
 
 Chaos theory has applications in weather forecasting, economics, population dynamics, and many other
-fields where complex, nonlinear systems are studied."""
-        ]
+fields where complex, nonlinear systems are studied.""",
+)
+
+class InformationScene(Scene):
+    """
+    Information scene that provides educational content and usage instructions
+    """
+    
+    __slots__ = ("surface", "config_manager", "ui_manager", "ui_root",
+                 "panel", "text_boxes", "prev_button", "next_button", "return_button",
+                 "section_indicator", "title_surfaces", "title_center",
+                 "button_actions", "border_rects", "button_states",
+                 "title_font", "text_font", "background_color", "theme_colors",
+                 "current_section", "info_sections", "section_texts", "_dirty",
+                 "_animating", "_full_redraw")
+    
+    def __init__(self):
+        """Initialize scene attributes"""
+        self.surface = None
+        self.config_manager = None
+        self.ui_manager = None
+        self.ui_root = None
+        self.panel = None
+        self.text_boxes = []  # One text box per section
+        self.prev_button = None
+        self.next_button = None
+        self.return_button = None
+        self.section_indicator = None
+        self.title_surfaces = {}  # Maps (section index, color) to rendered titles
+        self.title_center = (0, 0)
+        self.button_actions = {}  # Maps id(button) to its click handler
+        self.border_rects = []  # Screen areas not covered by the panel
+        self.button_states = {}  # Last enabled state applied to each navigation button
+        self.title_font = None
+        self.text_font = None
+        self.background_color = (240, 240, 245)  # Default light theme
+        self.theme_colors = {}
+        self._dirty = True  # Whether the surface needs to be redrawn
+        self._animating = self.UI_SETTLE_TIME  # Seconds left to keep updating the UI
+        self._full_redraw = True  # Whether the next render must present everything
+        self.current_section = 0
+        self.info_sections = SECTION_TITLES
+        self.section_texts = SECTION_TEXTS
+        
+    def initialize(self, surface, config_manager, ui_manager):
+        """
+        Initialize the scene with required resources
+        
+        Args:
+            surface: The pygame surface to render on
+            config_manager: The application's configuration manager
+            ui_manager: The pygame_gui.UIManager shared by all scenes
+        """
+        self.surface = surface
+        self.config_manager = config_manager
+        
+        # Use the shared UI manager, keeping this scene's widgets in one container
+        self.ui_manager = ui_manager
+        self.ui_root = pygame_gui.core.UIContainer(surface.get_rect(), manager=ui_manager)
+            
+        # Load theme colors
+        self.refresh_theme()
+        
+        # Initialize fonts
+        self.title_font = get_font('Arial', 36, bold=True)
+        self.text_font = get_font('Arial', 20)
+        
+        # Create UI elements
+        self._create_ui_elements()
+        
+        log.info("Information scene initialized")
+        
+    def on_enter(self):
+        """Pick up theme changes made elsewhere and redraw"""
+        super().on_enter()
+        self._animating = self.UI_SETTLE_TIME
+        self._full_redraw = True
+        
+        # Showing the scene shows every text box; keep only the current one
+        for section_index, text_box in enumerate(self.text_boxes):
+            if section_index != self.current_section:
+                text_box.hide()
+                
+        self.refresh_theme()
+        self._dirty = True
         
     def _create_ui_elements(self):
         """Create information UI elements"""
@@ -176,76 +213,114 @@ fields where complex, nonlinear systems are studied."""
         
         panel = pygame_gui.elements.UIPanel(
             relative_rect=panel_rect,
-            manager=self.ui_manager
-        )
-        self.info_widgets["panel"] = panel
-        
-        # Information title (changes with section)
-        title_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(0, 20, panel_width, 40),
-            text=self.info_sections[self.current_section],
             manager=self.ui_manager,
-            container=panel
+            container=self.ui_root
         )
-        self.info_widgets["title_label"] = title_label
+        self.panel = panel
         
-        # Information text area
-        text_box = pygame_gui.elements.UITextBox(
-            html_text=self.section_texts[self.current_section],
-            relative_rect=pygame.Rect(50, 80, panel_width - 100, panel_height - 180),
-            manager=self.ui_manager,
-            container=panel
+        # The panel is opaque inside its shadow, so only the area around
+        # that needs clearing
+        width, height = self.surface.get_size()
+        opaque = panel_rect.inflate(-2 * panel.shadow_width, -2 * panel.shadow_width)
+        border_rects = (
+            pygame.Rect(0, 0, width, opaque.top),
+            pygame.Rect(0, opaque.bottom, width, height - opaque.bottom),
+            pygame.Rect(0, opaque.top, opaque.left, opaque.height),
+            pygame.Rect(opaque.right, opaque.top, width - opaque.right, opaque.height),
         )
-        self.info_widgets["text_box"] = text_box
+        self.border_rects = [rect for rect in border_rects if rect.width > 0 and rect.height > 0]
         
-        # Navigation buttons
-        prev_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(50, panel_height - 80, 120, 40),
-            text="Previous",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.info_widgets["prev_button"] = prev_button
+        # Information title (changes with section), drawn over the panel
+        # from surfaces cached per (section, color)
+        self.title_surfaces = {}
+        self.title_center = (panel_rect.centerx, panel_rect.top + 40)
+        for section_index in range(len(self.info_sections)):
+            self._get_title_surface(section_index)
         
-        next_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(panel_width - 170, panel_height - 80, 120, 40),
-            text="Next",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.info_widgets["next_button"] = next_button
+        # Information text areas, one per section laid out up front so
+        # navigating only switches which one is visible
+        text_rect = pygame.Rect(50, 80, panel_width - 100, panel_height - 180)
+        self.text_boxes = []
+        for section_index, section_text in enumerate(self.section_texts):
+            self.text_boxes.append(pygame_gui.elements.UITextBox(
+                html_text=section_text,
+                relative_rect=text_rect,
+                manager=self.ui_manager,
+                container=panel,
+                visible=int(section_index == self.current_section)
+            ))
         
-        # Return to menu button
-        return_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(panel_width // 2 - 60, panel_height - 80, 120, 40),
-            text="Return",
-            manager=self.ui_manager,
-            container=panel
+        # Navigation and return buttons along the bottom of the panel,
+        # each placed by moving a shared template rect
+        button_template = pygame.Rect(0, panel_height - 80, 120, 40)
+        nav_buttons = (
+            ("prev_button", "Previous", 50,
+             lambda: self._navigate_to_section(self.current_section - 1)),
+            ("next_button", "Next", panel_width - 170,
+             lambda: self._navigate_to_section(self.current_section + 1)),
+            ("return_button", "Return", panel_width // 2 - 60,
+             lambda: change_scene("home")),
         )
-        self.info_widgets["return_button"] = return_button
-        
+        self.button_actions = {}
+        for name, label, x, action in nav_buttons:
+            button = pygame_gui.elements.UIButton(
+                relative_rect=button_template.move(x, 0),
+                text=label,
+                manager=self.ui_manager,
+                container=panel
+            )
+            setattr(self, name, button)
+            self.button_actions[id(button)] = action
+            
         # Section indicator
-        section_indicator = pygame_gui.elements.UILabel(
+        self.section_indicator = pygame_gui.elements.UILabel(
             relative_rect=pygame.Rect(0, panel_height - 30, panel_width, 20),
             text=f"Section {self.current_section + 1} of {len(self.info_sections)}",
             manager=self.ui_manager,
             container=panel
         )
-        self.info_widgets["section_indicator"] = section_indicator
         
         # Update button states based on current section
         self._update_button_states()
         
     def _update_button_states(self):
         """Update navigation button states based on current section"""
-        # Disable previous button if on first section
-        if self.info_widgets.get("prev_button"):
-            self.info_widgets["prev_button"].disable() if self.current_section == 0 else self.info_widgets["prev_button"].enable()
+        # Previous is only available past the first section, Next before the last
+        desired_states = (
+            ("prev_button", self.prev_button, self.current_section > 0),
+            ("next_button", self.next_button, self.current_section < len(self.info_sections) - 1),
+        )
+        
+        # Only touch buttons whose state changes, as each change redraws the button
+        for name, button, enabled in desired_states:
+            if button is None or self.button_states.get(name) == enabled:
+                continue
+                
+            if enabled:
+                button.enable()
+            else:
+                button.disable()
+            self.button_states[name] = enabled
             
-        # Disable next button if on last section
-        if self.info_widgets.get("next_button"):
-            self.info_widgets["next_button"].disable() if self.current_section == len(self.info_sections) - 1 else self.info_widgets["next_button"].enable()
+    def _get_title_surface(self, section_index):
+        """
+        Get the rendered title of a section, rendering it on first use
+        
+        Args:
+            section_index: Index of the section
             
+        Returns:
+            pygame.Surface: The section title
+        """
+        # Match the panel's own label text so the title stays readable on it
+        color = self.ui_manager.get_theme().get_colour("normal_text", ["label"])
+        key = (section_index, tuple(color))
+        surface = self.title_surfaces.get(key)
+        if surface is None:
+            surface = get_pen(self.title_font, color).render(self.info_sections[section_index])
+            self.title_surfaces[key] = surface
+        return surface
+        
     def _navigate_to_section(self, section_index):
         """
         Navigate to a specific information section
@@ -257,24 +332,20 @@ fields where complex, nonlinear systems are studied."""
         if section_index < 0 or section_index >= len(self.info_sections):
             return
             
-        # Update current section
+        # Swap the visible text box and update current section
+        text_boxes = self.text_boxes
+        if text_boxes:
+            text_boxes[self.current_section].hide()
+            text_boxes[section_index].show()
         self.current_section = section_index
         
-        # Update title
-        if self.info_widgets.get("title_label"):
-            self.info_widgets["title_label"].set_text(self.info_sections[self.current_section])
-            
-        # Update text content
-        if self.info_widgets.get("text_box"):
-            self.info_widgets["text_box"].html_text = self.section_texts[self.current_section]
-            self.info_widgets["text_box"].rebuild()
-            
         # Update section indicator
-        if self.info_widgets.get("section_indicator"):
-            self.info_widgets["section_indicator"].set_text(f"Section {self.current_section + 1} of {len(self.info_sections)}")
+        if self.section_indicator is not None:
+            self.section_indicator.set_text(f"Section {self.current_section + 1} of {len(self.info_sections)}")
             
         # Update button states
         self._update_button_states()
+        self._dirty = True
         
     def update(self, dt):
         """
@@ -283,17 +354,64 @@ fields where complex, nonlinear systems are studied."""
         Args:
             dt: Delta time in seconds since last update
         """
-        # Update UI manager
-        self.ui_manager.update(dt)
+        # Widgets only change in response to input, so the UI manager is
+        # left alone once it has settled after the last event
+        if self._animating > 0.0:
+            self._animating -= dt
+            self.ui_manager.update(dt)
+            self._dirty = True
         
     def render(self):
-        """Render the scene to its surface"""
-        # Clear the screen
-        self.surface.fill(self.background_color)
+        """
+        Render the scene to its surface
         
+        Returns:
+            list: pygame.Rect areas of the surface that changed this frame
+        """
+        # Clear the area around the panel
+        for rect in self.border_rects:
+            self.surface.fill(self.background_color, rect)
+            
         # Draw UI elements
         self.ui_manager.draw_ui(self.surface)
         
+        # Draw the section title
+        title_surface = self._get_title_surface(self.current_section)
+        self.surface.blit(title_surface,
+                          title_surface.get_rect(center=self.title_center))
+        
+        self._dirty = False
+        
+        # The margin never changes after the first frame, so after input
+        # only the panel needs presenting
+        if not self._full_redraw:
+            return [self.panel.rect]
+            
+        # Whole surface is redrawn
+        self._full_redraw = False
+        return [self.surface.get_rect()]
+        
+    def needs_redraw(self):
+        """
+        Check whether render would change anything on the surface
+        
+        The scene is static between events, so it is only redrawn after
+        one arrives.
+        
+        Returns:
+            bool: False if the surface still shows the last rendered frame
+        """
+        return self._dirty
+        
+    def is_idle(self):
+        """
+        Check whether the scene can wait for input without falling behind
+        
+        Returns:
+            bool: True once the widgets have settled and the frame is drawn
+        """
+        return self._animating <= 0.0 and not self._dirty
+        
     def handle_event(self, event):
         """
         Process pygame events
@@ -301,20 +419,21 @@ fields where complex, nonlinear systems are studied."""
         Args:
             event: The pygame event to handle
         """
+        # Any input can change widget state (hover, press), so update and redraw
+        self._animating = self.UI_SETTLE_TIME
+        self._dirty = True
+        
         # Process UI events
         self.ui_manager.process_events(event)
         
         # Handle UI interactions
-        if event.type == pygame.USEREVENT:
-            if event.user_type == pygame_gui.UI_BUTTON_PRESSED:
-                if event.ui_element == self.info_widgets.get("prev_button"):
-                    self._navigate_to_section(self.current_section - 1)
-                elif event.ui_element == self.info_widgets.get("next_button"):
-                    self._navigate_to_section(self.current_section + 1)
-                elif event.ui_element == self.info_widgets.get("return_button"):
-                    change_scene("home")
+        if event.type == _UI_BUTTON_PRESSED:
+            action = self.button_actions.get(id(event.ui_element))
+            if action is not None:
+                action()
                     
     def cleanup(self):
         """Release scene resources"""
-        # Clean up UI manager
+        # Remove this scene's widgets from the shared UI manager
+        super().cleanup()
         self.ui_manager = None
\ No newline at end of file
@@ -2,35 +2,119 @@
 SceneManager - Manages the application's scenes and scene transitions
 """
 
+import logging
+import importlib
+import pygame
+
+log = logging.getLogger(__name__)
+
 class Scene:
     """
     Base interface for all scenes in the application
     Each scene represents a distinct screen or state in the application
+    
+    A scene is initialized once and kept when it is left, so returning to
+    it restores its state; on_enter and on_exit run on each visit.
     """
     
-    def initialize(self, surface, config_manager):
+    # No per-instance dict here; subclasses may declare their own slots
+    __slots__ = ()
+    
+    # Discard the scene when it is left, so every visit starts fresh
+    reset_on_enter = False
+    
+    # Container holding the scene's widgets in the shared UI manager
+    ui_root = None
+    
+    # Seconds a static scene keeps updating its UI after the last input,
+    # long enough for pygame_gui to settle hover and press states
+    UI_SETTLE_TIME = 0.3
+    
+    def initialize(self, surface, config_manager, ui_manager):
         """
         Initialize the scene with required resources
         
         Args:
             surface: The pygame surface to render on
             config_manager: The application's configuration manager
+            ui_manager: The pygame_gui.UIManager shared by all scenes
         """
         pass
         
+    def on_enter(self):
+        """Prepare the scene to be shown again after it became current"""
+        if self.ui_root is not None:
+            self.ui_root.show()
+            
+    def on_exit(self):
+        """Suspend the scene when another one becomes current"""
+        if self.ui_root is not None:
+            self.ui_root.hide()
+        
+    def refresh_theme(self):
+        """
+        Load the configured theme's colors into theme_colors and background_color
+        
+        Returns:
+            bool: True if the colors differ from the ones already loaded
+        """
+        # Themes are built once and shared, so an identity check spots changes
+        theme_colors = self.config_manager.get_theme_colors()
+        if theme_colors is self.theme_colors:
+            return False
+            
+        self.theme_colors = theme_colors
+        self.background_color = theme_colors["background"]
+        return True
+        
     def update(self, dt):
         """
-        Update scene logic
+        Update scene logic, once per rendered frame
         
         Args:
             dt: Delta time in seconds since last update
         """
         pass
         
-    def render(self):
-        """Render the scene to its surface"""
+    def step(self, dt):
+        """
+        Advance time-dependent state by one fixed-size step
+        
+        Called zero or more times per frame so that simulated time keeps
+        pace with real time independently of the frame rate.
+        
+        Args:
+            dt: Fixed step size in seconds
+        """
         pass
         
+    def render(self):
+        """
+        Render the scene to its surface
+        
+        Returns:
+            list: pygame.Rect areas of the surface that changed this frame
+        """
+        return []
+        
+    def needs_redraw(self):
+        """
+        Check whether render would change anything on the surface
+        
+        Returns:
+            bool: False if the surface still shows the last rendered frame
+        """
+        return True
+        
+    def is_idle(self):
+        """
+        Check whether the scene can wait for input without falling behind
+        
+        Returns:
+            bool: True if nothing changes until the next event arrives
+        """
+        return False
+        
     def handle_event(self, event):
         """
         Process pygame events
@@ -42,7 +126,9 @@ class Scene:
         
     def cleanup(self):
         """Release scene resources"""
-        pass
+        if self.ui_root is not None:
+            self.ui_root.kill()
+            self.ui_root = None
 
 
 class SceneManager:
@@ -60,9 +146,29 @@ class SceneManager:
         """
         self.surface = surface
         self.config_manager = config_manager
+        
+        # One UI manager for every scene, so themes and fonts load once.
+        # Created by the first scene change, so pygame_gui is only
+        # imported once a scene needs it.
+        self.ui_manager = None
+        
         self.scenes = {}  # Maps scene names to scene classes
-        self.current_scene = None
-        self.current_scene_name = None
+        self.scene_instances = {}  # Maps scene names to initialized scenes
+        self.lazy_scenes = {}  # Maps scene names to (module name, class name) pairs
+        
+        # (name, scene) of the active scene, rebound as a whole on every
+        # change so the name and the scene can never be read out of step
+        self._active = (None, None)
+        
+    @property
+    def current_scene(self):
+        """The active scene, or None before the first scene change"""
+        return self._active[1]
+        
+    @property
+    def current_scene_name(self):
+        """Name of the active scene, or None before the first scene change"""
+        return self._active[0]
         
     def register_scene(self, name, scene_class):
         """
@@ -73,7 +179,48 @@ class SceneManager:
             scene_class: Class of the scene to register
         """
         self.scenes[name] = scene_class
-        print(f"Registered scene: {name}")
+        log.info("Registered scene: %s", name)
+        
+    def register_scene_lazy(self, name, module_name, class_name):
+        """
+        Register a scene whose module is imported on first use
+        
+        Args:
+            name: Unique name for the scene
+            module_name: Dotted path of the module defining the scene
+            class_name: Name of the scene class within that module
+        """
+        self.lazy_scenes[name] = (module_name, class_name)
+        log.info("Registered scene: %s", name)
+        
+    def _resolve_scene_class(self, scene_name):
+        """
+        Get the class for a scene, importing it if it was registered lazily
+        
+        Args:
+            scene_name: Name of the scene
+            
+        Returns:
+            The scene class or None if the scene is not registered
+        """
+        scene_class = self.scenes.get(scene_name)
+        if scene_class is None and scene_name in self.lazy_scenes:
+            module_name, class_name = self.lazy_scenes.pop(scene_name)
+            module = importlib.import_module(module_name)
+            scene_class = getattr(module, class_name)
+            self.scenes[scene_name] = scene_class
+            
+        return scene_class
+        
+    def _create_ui_manager(self):
+        """
+        Create the UI manager shared by all scenes
+        
+        Returns:
+            pygame_gui.UIManager: Manager sized to the display surface
+        """
+        import pygame_gui
+        return pygame_gui.UIManager((self.surface.get_width(), self.surface.get_height()))
         
     def change_scene(self, scene_name):
         """
@@ -86,23 +233,33 @@ class SceneManager:
             bool: True if successful, False if scene not found
         """
         # Check if the requested scene exists
-        if scene_name not in self.scenes:
-            print(f"Scene not found: {scene_name}")
+        scene_class = self._resolve_scene_class(scene_name)
+        if scene_class is None:
+            log.warning("Scene not found: %s", scene_name)
             return False
             
-        # Clean up current scene if one exists
-        if self.current_scene is not None:
-            self.current_scene.cleanup()
+        # Suspend the current scene, discarding it if it is rebuilt on every visit
+        current_name, current_scene = self._active
+        if current_scene is not None:
+            current_scene.on_exit()
+            if current_scene.reset_on_enter:
+                current_scene.cleanup()
+                del self.scene_instances[current_name]
+                
+        # Reuse the scene if it was visited before, otherwise create it
+        scene = self.scene_instances.get(scene_name)
+        if scene is None:
+            if self.ui_manager is None:
+                self.ui_manager = self._create_ui_manager()
+            scene = scene_class()
+            scene.initialize(self.surface, self.config_manager, self.ui_manager)
+            self.scene_instances[scene_name] = scene
+        else:
+            scene.on_enter()
             
-        # Create new scene instance
-        scene_class = self.scenes[scene_name]
-        self.current_scene = scene_class()
-        self.current_scene_name = scene_name
-        
-        # Initialize the new scene
-        self.current_scene.initialize(self.surface, self.config_manager)
+        self._active = (scene_name, scene)
         
-        print(f"Changed to scene: {scene_name}")
+        log.info("Changed to scene: %s", scene_name)
         return True
         
     def update(self, dt):
@@ -112,13 +269,42 @@ class SceneManager:
         Args:
             dt: Delta time in seconds since last update
         """
-        if self.current_scene is not None:
-            self.current_scene.update(dt)
+        scene = self._active[1]
+        if scene is not None:
+            scene.update(dt)
+            
+    def step(self, dt):
+        """
+        Advance the current scene by one fixed-size step
+        
+        Args:
+            dt: Fixed step size in seconds
+        """
+        scene = self._active[1]
+        if scene is not None:
+            scene.step(dt)
             
     def render(self):
-        """Render the current scene"""
-        if self.current_scene is not None:
-            self.current_scene.render()
+        """
+        Render the current scene
+        
+        Returns:
+            list: pygame.Rect areas of the surface that changed this frame
+        """
+        scene = self._active[1]
+        if scene is not None and scene.needs_redraw():
+            return scene.render()
+        return []
+        
+    def is_idle(self):
+        """
+        Check whether the current scene is waiting for input
+        
+        Returns:
+            bool: True if the current scene has nothing to do until the next event
+        """
+        scene = self._active[1]
+        return scene is not None and scene.is_idle()
             
     def handle_event(self, event):
         """
@@ -127,9 +313,63 @@ class SceneManager:
         Args:
             event: The pygame event to handle
         """
-        if self.current_scene is not None:
-            self.current_scene.handle_event(event)
+        scene = self._active[1]
+        if scene is not None:
+            scene.handle_event(event)
+            
+    def handle_events(self, events):
+        """
+        Pass a batch of events to the current scene
+        
+        Args:
+            events: List of pygame events to handle, in queue order
+        """
+        scene = self._active[1]
+        if scene is None:
+            return
+            
+        events = self.coalesce_events(events)
+        
+        # Look up the handler once, re-binding only if an event changed scene
+        handle_event = scene.handle_event
+        for event in events:
+            if self._active[1] is not scene:
+                scene = self._active[1]
+                handle_event = scene.handle_event
+            handle_event(event)
+            
+    @staticmethod
+    def coalesce_events(events):
+        """
+        Drop events made redundant by the one that follows them
+        
+        Runs of consecutive mouse motion with the same buttons held
+        collapse to the last one, since handlers only read its position;
+        a change in held buttons starts a new run so no press state seen
+        during motion is lost. Every other event is kept, in order.
+        
+        Args:
+            events: List of pygame events, in queue order
+            
+        Returns:
+            list: The events that still need handling
+        """
+        if len(events) < 2:
+            return events
             
+        MOUSEMOTION = pygame.MOUSEMOTION
+        kept = []
+        previous = None
+        for event in events:
+            if (previous is not None and event.type == MOUSEMOTION
+                    and previous.type == MOUSEMOTION
+                    and event.buttons == previous.buttons):
+                kept[-1] = event
+            else:
+                kept.append(event)
+            previous = event
+        return kept
+        
     def get_current_scene_name(self):
         """
         Get the name of the current scene
@@ -137,11 +377,11 @@ class SceneManager:
         Returns:
             str: Name of the current scene or None if no scene is active
         """
-        return self.current_scene_name
+        return self._active[0]
         
     def cleanup(self):
         """Clean up all scenes and resources"""
-        if self.current_scene is not None:
-            self.current_scene.cleanup()
-            self.current_scene = None
-            self.current_scene_name = None
\ No newline at end of file
+        for scene in self.scene_instances.values():
+            scene.cleanup()
+        self.scene_instances.clear()
+        self._active = (None, None)
\ No newline at end of file
@@ -3,42 +3,128 @@ Settings scene implementation for the double pendulum simulation.
 Provides options to customize the application.
 """
 
+import logging
 import pygame
 import pygame_gui
 from app.scenes.scene_manager import Scene
+from app.util.fonts import get_font
 from app.util.scene_navigation import change_scene
 
+log = logging.getLogger(__name__)
+
+# Event constants read on every event, bound once at import
+_UI_BUTTON_PRESSED = pygame_gui.UI_BUTTON_PRESSED
+_UI_DROP_DOWN_MENU_CHANGED = pygame_gui.UI_DROP_DOWN_MENU_CHANGED
+_UI_HORIZONTAL_SLIDER_MOVED = pygame_gui.UI_HORIZONTAL_SLIDER_MOVED
+
+# Resolutions offered by the resolution dropdown
+_RESOLUTIONS = (
+    "1024x768",
+    "1280x720",
+    "1366x768",
+    "1600x900",
+    "1920x1080",
+)
+
+# Panel size, and the layout of the controls relative to the panel. pygame_gui
+# copies the rects it is given, so each one can be shared.
+_PANEL_WIDTH = 600
+_PANEL_HEIGHT = 500
+_TITLE_RECT = pygame.Rect(0, 20, _PANEL_WIDTH, 40)
+_THEME_LABEL_RECT = pygame.Rect(50, 80, 200, 30)
+_LIGHT_BUTTON_RECT = pygame.Rect(250, 80, 120, 30)
+_DARK_BUTTON_RECT = pygame.Rect(380, 80, 120, 30)
+_RESOLUTION_LABEL_RECT = pygame.Rect(50, 130, 200, 30)
+_RESOLUTION_DROPDOWN_RECT = pygame.Rect(250, 130, 250, 30)
+_FPS_LABEL_RECT = pygame.Rect(50, 180, 200, 30)
+_FPS_SLIDER_RECT = pygame.Rect(250, 180, 250, 30)
+_FPS_VALUE_RECT = pygame.Rect(510, 180, 40, 30)
+_SIM_SETTINGS_LABEL_RECT = pygame.Rect(50, 230, 500, 30)
+_GRAVITY_LABEL_RECT = pygame.Rect(70, 270, 180, 30)
+_GRAVITY_SLIDER_RECT = pygame.Rect(250, 270, 250, 30)
+_GRAVITY_VALUE_RECT = pygame.Rect(510, 270, 60, 30)
+_PATH_LABEL_RECT = pygame.Rect(70, 310, 180, 30)
+_PATH_SLIDER_RECT = pygame.Rect(250, 310, 250, 30)
+_PATH_VALUE_RECT = pygame.Rect(510, 310, 60, 30)
+_SAVE_BUTTON_RECT = pygame.Rect(150, _PANEL_HEIGHT - 60, 120, 40)
+_CANCEL_BUTTON_RECT = pygame.Rect(330, _PANEL_HEIGHT - 60, 120, 40)
+
+# Settings shown by the scene, with the value to show when one is not set
+_SETTING_DEFAULTS = {
+    "theme": "light",
+    "screen_width": 1024,
+    "screen_height": 768,
+    "fps": 60,
+    "simulation.gravity": 9.81,
+    "simulation.default_path_duration": 2.0,
+}
+
 class SettingsScene(Scene):
     """
     Settings scene that allows users to customize application settings
     """
     
+    # Seconds between applying slider values while a slider is dragged
+    SLIDER_FLUSH_INTERVAL = 0.05
+    
+    __slots__ = ("surface", "config_manager", "ui_manager", "ui_root",
+                 "panel", "light_button", "dark_button", "resolution_dropdown",
+                 "fps_slider", "fps_value_label", "gravity_slider", "gravity_value_label",
+                 "path_slider", "path_value_label", "save_button", "cancel_button",
+                 "title_font", "text_font",
+                 "background_color", "theme_colors", "modified_settings",
+                 "panel_cache", "_panel_dirty", "_panel_settle", "_full_redraw",
+                 "pending_slider_values", "_slider_flush_timer",
+                 "button_actions", "dropdown_handlers", "slider_handlers")
+    
     def __init__(self):
         """Initialize scene attributes"""
         self.surface = None
         self.config_manager = None
         self.ui_manager = None
-        self.settings_widgets = {}
+        self.ui_root = None
+        self.panel = None
+        self.light_button = None
+        self.dark_button = None
+        self.resolution_dropdown = None
+        self.fps_slider = None
+        self.fps_value_label = None
+        self.gravity_slider = None
+        self.gravity_value_label = None
+        self.path_slider = None
+        self.path_value_label = None
+        self.save_button = None
+        self.cancel_button = None
         self.title_font = None
         self.text_font = None
         self.background_color = (240, 240, 245)  # Default light theme
         self.theme_colors = {}
         self.modified_settings = {}
-        
-    def initialize(self, surface, config_manager):
+        self.panel_cache = None  # Image of the settings panel as last drawn
+        self._panel_dirty = True  # Whether the panel must be drawn again
+        self._panel_settle = self.UI_SETTLE_TIME  # Seconds left to keep redrawing the panel
+        self._full_redraw = True  # Whether the background outside the panel must be drawn
+        self.pending_slider_values = {}  # Maps value handlers to their latest slider value
+        self._slider_flush_timer = 0.0
+        self.button_actions = {}  # Maps id(button) to its click handler
+        self.dropdown_handlers = {}  # Maps id(dropdown) to its selection handler
+        self.slider_handlers = {}  # Maps id(slider) to its value handler
+        
+    def initialize(self, surface, config_manager, ui_manager):
         """
         Initialize the scene with required resources
         
         Args:
             surface: The pygame surface to render on
             config_manager: The application's configuration manager
+            ui_manager: The pygame_gui.UIManager shared by all scenes
         """
         self.surface = surface
         self.config_manager = config_manager
         
-        # Initialize UI manager
-        self.ui_manager = pygame_gui.UIManager(
-            (surface.get_width(), surface.get_height()))
+        # Use the shared UI manager, keeping this scene's widgets in one container
+        self.ui_manager = ui_manager
+        self.ui_root = pygame_gui.core.UIContainer(surface.get_rect(), manager=ui_manager)
             
         # Load theme colors
         theme_name = self.config_manager.get_setting("theme", "light")
@@ -46,9 +132,8 @@ class SettingsScene(Scene):
         self.background_color = self.theme_colors["background"]
         
         # Initialize fonts
-        pygame.font.init()
-        self.title_font = pygame.font.SysFont('Arial', 36, bold=True)
-        self.text_font = pygame.font.SysFont('Arial', 24)
+        self.title_font = get_font('Arial', 36, bold=True)
+        self.text_font = get_font('Arial', 24)
         
         # Create UI elements
         self._create_ui_elements()
@@ -56,50 +141,50 @@ class SettingsScene(Scene):
         # Initialize modified settings with current values
         self.modified_settings = {}
         
-        print("Settings scene initialized")
+        log.info("Settings scene initialized")
         
     def _create_ui_elements(self):
         """Create settings UI controls"""
+        # Current values of every setting the controls start from
+        current = self.config_manager.get_settings(_SETTING_DEFAULTS)
+        
         # Create panel to contain all settings widgets
-        panel_width = 600
-        panel_height = 500
         panel_rect = pygame.Rect(
-            (self.surface.get_width() - panel_width) // 2,
-            (self.surface.get_height() - panel_height) // 2,
-            panel_width,
-            panel_height
+            (self.surface.get_width() - _PANEL_WIDTH) // 2,
+            (self.surface.get_height() - _PANEL_HEIGHT) // 2,
+            _PANEL_WIDTH,
+            _PANEL_HEIGHT
         )
         
         panel = pygame_gui.elements.UIPanel(
             relative_rect=panel_rect,
-            manager=self.ui_manager
+            manager=self.ui_manager,
+            container=self.ui_root
         )
-        self.settings_widgets["panel"] = panel
+        self.panel = panel
         
         # Settings title
-        title_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(0, 20, panel_width, 40),
+        pygame_gui.elements.UILabel(
+            relative_rect=_TITLE_RECT,
             text="Settings",
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["title_label"] = title_label
         
         # Theme selection
-        theme_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(50, 80, 200, 30),
+        pygame_gui.elements.UILabel(
+            relative_rect=_THEME_LABEL_RECT,
             text="Theme:",
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["theme_label"] = theme_label
         
         # Current theme
-        current_theme = self.config_manager.get_setting("theme", "light")
+        current_theme = current["theme"]
         
         # Light theme button
         light_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(250, 80, 120, 30),
+            relative_rect=_LIGHT_BUTTON_RECT,
             text="Light",
             manager=self.ui_manager,
             container=panel,
@@ -107,11 +192,11 @@ class SettingsScene(Scene):
         )
         if current_theme == "light":
             light_button.select()
-        self.settings_widgets["light_button"] = light_button
+        self.light_button = light_button
         
         # Dark theme button
         dark_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(380, 80, 120, 30),
+            relative_rect=_DARK_BUTTON_RECT,
             text="Dark",
             manager=self.ui_manager,
             container=panel,
@@ -119,151 +204,201 @@ class SettingsScene(Scene):
         )
         if current_theme == "dark":
             dark_button.select()
-        self.settings_widgets["dark_button"] = dark_button
+        self.dark_button = dark_button
         
         # Screen resolution settings
-        resolution_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(50, 130, 200, 30),
+        pygame_gui.elements.UILabel(
+            relative_rect=_RESOLUTION_LABEL_RECT,
             text="Screen Resolution:",
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["resolution_label"] = resolution_label
         
         # Current resolution
-        current_width = self.config_manager.get_setting("screen_width", 1024)
-        current_height = self.config_manager.get_setting("screen_height", 768)
-        
-        # Resolution options
-        resolutions = [
-            "1024x768",
-            "1280x720",
-            "1366x768",
-            "1600x900",
-            "1920x1080"
-        ]
-        
-        resolution_dropdown = pygame_gui.elements.UIDropDownMenu(
-            options_list=resolutions,
-            starting_option=f"{current_width}x{current_height}",
-            relative_rect=pygame.Rect(250, 130, 250, 30),
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.settings_widgets["resolution_dropdown"] = resolution_dropdown
+        self._create_resolution_dropdown(f"{current['screen_width']}x{current['screen_height']}")
         
         # Frame rate settings
-        fps_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(50, 180, 200, 30),
+        pygame_gui.elements.UILabel(
+            relative_rect=_FPS_LABEL_RECT,
             text="Frame Rate:",
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["fps_label"] = fps_label
         
         # Current FPS
-        current_fps = self.config_manager.get_setting("fps", 60)
+        current_fps = current["fps"]
         
         fps_slider = pygame_gui.elements.UIHorizontalSlider(
-            relative_rect=pygame.Rect(250, 180, 250, 30),
+            relative_rect=_FPS_SLIDER_RECT,
             start_value=current_fps,
             value_range=(30, 120),
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["fps_slider"] = fps_slider
+        self.fps_slider = fps_slider
         
         fps_value_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(510, 180, 40, 30),
+            relative_rect=_FPS_VALUE_RECT,
             text=str(current_fps),
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["fps_value_label"] = fps_value_label
+        self.fps_value_label = fps_value_label
         
         # Default simulation settings
-        sim_settings_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(50, 230, 500, 30),
+        pygame_gui.elements.UILabel(
+            relative_rect=_SIM_SETTINGS_LABEL_RECT,
             text="Default Simulation Settings:",
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["sim_settings_label"] = sim_settings_label
         
         # Gravity
-        gravity_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(70, 270, 180, 30),
+        pygame_gui.elements.UILabel(
+            relative_rect=_GRAVITY_LABEL_RECT,
             text="Default Gravity:",
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["gravity_label"] = gravity_label
         
         # Current gravity
-        current_gravity = self.config_manager.get_setting("simulation.gravity", 9.81)
+        current_gravity = current["simulation.gravity"]
         
         gravity_slider = pygame_gui.elements.UIHorizontalSlider(
-            relative_rect=pygame.Rect(250, 270, 250, 30),
+            relative_rect=_GRAVITY_SLIDER_RECT,
             start_value=current_gravity,
             value_range=(0.0, 20.0),
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["gravity_slider"] = gravity_slider
+        self.gravity_slider = gravity_slider
         
         gravity_value_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(510, 270, 60, 30),
+            relative_rect=_GRAVITY_VALUE_RECT,
             text=f"{current_gravity:.2f}",
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["gravity_value_label"] = gravity_value_label
+        self.gravity_value_label = gravity_value_label
         
         # Default path duration
-        path_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(70, 310, 180, 30),
+        pygame_gui.elements.UILabel(
+            relative_rect=_PATH_LABEL_RECT,
             text="Default Path Duration:",
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["path_label"] = path_label
         
         # Current path duration
-        current_path_duration = self.config_manager.get_setting("simulation.default_path_duration", 2.0)
+        current_path_duration = current["simulation.default_path_duration"]
         
         path_slider = pygame_gui.elements.UIHorizontalSlider(
-            relative_rect=pygame.Rect(250, 310, 250, 30),
+            relative_rect=_PATH_SLIDER_RECT,
             start_value=current_path_duration,
             value_range=(0.1, 10.0),
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["path_slider"] = path_slider
+        self.path_slider = path_slider
         
         path_value_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(510, 310, 60, 30),
+            relative_rect=_PATH_VALUE_RECT,
             text=f"{current_path_duration:.1f}s",
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["path_value_label"] = path_value_label
+        self.path_value_label = path_value_label
         
         # Buttons for saving and canceling changes
         save_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(150, panel_height - 60, 120, 40),
+            relative_rect=_SAVE_BUTTON_RECT,
             text="Save Settings",
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["save_button"] = save_button
+        self.save_button = save_button
         
         cancel_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(330, panel_height - 60, 120, 40),
+            relative_rect=_CANCEL_BUTTON_RECT,
             text="Cancel",
             manager=self.ui_manager,
             container=panel
         )
-        self.settings_widgets["cancel_button"] = cancel_button
+        self.cancel_button = cancel_button
+        
+        # Route UI events to their handlers by the widget that sent them
+        self.button_actions = {
+            id(light_button): lambda: self._change_theme("light"),
+            id(dark_button): lambda: self._change_theme("dark"),
+            id(save_button): self._save_and_return,
+            id(cancel_button): lambda: change_scene("home"),
+        }
+        self.slider_handlers = {
+            id(fps_slider): self._update_fps,
+            id(gravity_slider): self._update_gravity,
+            id(path_slider): self._update_path_duration,
+        }
+        
+    def _create_resolution_dropdown(self, selected):
+        """
+        Create the resolution dropdown, replacing any existing one
+        
+        Args:
+            selected: Resolution shown as selected, in format "widthxheight"
+        """
+        if self.resolution_dropdown is not None:
+            self.resolution_dropdown.kill()
+            
+        resolution_dropdown = pygame_gui.elements.UIDropDownMenu(
+            options_list=_RESOLUTIONS,
+            starting_option=selected,
+            relative_rect=_RESOLUTION_DROPDOWN_RECT,
+            manager=self.ui_manager,
+            container=self.panel
+        )
+        self.resolution_dropdown = resolution_dropdown
+        self.dropdown_handlers = {id(resolution_dropdown): self._change_resolution}
+        
+    def on_enter(self):
+        """Show the saved settings, dropping edits from the last visit"""
+        super().on_enter()
+        self.refresh_theme()
+        self._sync_widgets()
+        self._panel_settle = self.UI_SETTLE_TIME
+        self._panel_dirty = True
+        self._full_redraw = True
+        
+    def _sync_widgets(self):
+        """Set every control to the saved value of its setting"""
+        current = self.config_manager.get_settings(_SETTING_DEFAULTS)
+        
+        # Theme buttons
+        for theme_name, button in (("light", self.light_button), ("dark", self.dark_button)):
+            if current["theme"] == theme_name:
+                button.select()
+            else:
+                button.unselect()
+                
+        # The dropdown cannot change its selection, so it is only rebuilt
+        # when the saved resolution differs from the one it shows
+        resolution = f"{current['screen_width']}x{current['screen_height']}"
+        if self.resolution_dropdown.selected_option != resolution:
+            self._create_resolution_dropdown(resolution)
+            
+        # Sliders, with their value labels set through the value handlers
+        sliders = (
+            (self.fps_slider, "fps", self._update_fps),
+            (self.gravity_slider, "simulation.gravity", self._update_gravity),
+            (self.path_slider, "simulation.default_path_duration", self._update_path_duration),
+        )
+        for slider, key, handler in sliders:
+            slider.set_current_value(current[key])
+            handler(current[key])
+            
+        # Nothing has been changed yet on this visit
+        self.modified_settings = {}
+        self.pending_slider_values.clear()
+        self._slider_flush_timer = 0.0
         
     def update(self, dt):
         """
@@ -272,16 +407,70 @@ class SettingsScene(Scene):
         Args:
             dt: Delta time in seconds since last update
         """
-        # Update UI manager
-        self.ui_manager.update(dt)
+        # Apply slider values at a bounded rate while they are dragged
+        if self.pending_slider_values:
+            self._slider_flush_timer += dt
+            if self._slider_flush_timer >= self.SLIDER_FLUSH_INTERVAL:
+                self._flush_slider_values()
+        
+        # Hover and press states change shortly after input, so keep
+        # updating and redrawing the panel until they have settled; once
+        # idle the UI manager is left alone
+        if self._panel_settle > 0.0:
+            self._panel_settle -= dt
+            self.ui_manager.update(dt)
+            self._panel_dirty = True
         
     def render(self):
-        """Render the scene to its surface"""
-        # Clear the screen
-        self.surface.fill(self.background_color)
+        """
+        Render the scene to its surface
+        
+        Returns:
+            list: pygame.Rect areas of the surface that changed this frame
+        """
+        panel_rect = self.panel.rect
+        
+        # Clear the screen, or only under the panel when the rest of it
+        # still shows the background
+        if self._full_redraw:
+            self.surface.fill(self.background_color)
+        else:
+            self.surface.fill(self.background_color, panel_rect)
+        
+        # Draw UI elements, keeping an image of the panel; while nothing
+        # changes that single image is blitted instead
+        if self._panel_dirty or self.panel_cache is None:
+            self.ui_manager.draw_ui(self.surface)
+            self.panel_cache = self.surface.subsurface(panel_rect).copy()
+            self._panel_dirty = False
+        else:
+            self.surface.blit(self.panel_cache, panel_rect)
+        
+        if self._full_redraw:
+            self._full_redraw = False
+            return [self.surface.get_rect()]
+        return [panel_rect]
+        
+    def needs_redraw(self):
+        """
+        Check whether render would change anything on the surface
+        
+        Returns:
+            bool: False while the panel is idle and the screen already
+                  shows its cached image
+        """
+        return self._panel_dirty or self._full_redraw
         
-        # Draw UI elements
-        self.ui_manager.draw_ui(self.surface)
+    def is_idle(self):
+        """
+        Check whether the scene can wait for input without falling behind
+        
+        Returns:
+            bool: True once the panel has settled, no slider value is
+                  waiting to be applied and the frame is drawn
+        """
+        return (self._panel_settle <= 0.0 and not self.pending_slider_values
+                and not self.needs_redraw())
         
     def handle_event(self, event):
         """
@@ -290,34 +479,40 @@ class SettingsScene(Scene):
         Args:
             event: The pygame event to handle
         """
+        # Any input can change widget state, so redraw the panel
+        self._panel_settle = self.UI_SETTLE_TIME
+        self._panel_dirty = True
+        
         # Process UI events
         self.ui_manager.process_events(event)
         
-        # Handle UI interactions
-        if event.type == pygame.USEREVENT:
-            if event.user_type == pygame_gui.UI_BUTTON_PRESSED:
-                if event.ui_element == self.settings_widgets.get("light_button"):
-                    self._change_theme("light")
-                elif event.ui_element == self.settings_widgets.get("dark_button"):
-                    self._change_theme("dark")
-                elif event.ui_element == self.settings_widgets.get("save_button"):
-                    self._save_settings()
-                    change_scene("home")
-                elif event.ui_element == self.settings_widgets.get("cancel_button"):
-                    change_scene("home")
-                    
-            elif event.user_type == pygame_gui.UI_DROP_DOWN_MENU_CHANGED:
-                if event.ui_element == self.settings_widgets.get("resolution_dropdown"):
-                    self._change_resolution(event.text)
-                    
-            elif event.user_type == pygame_gui.UI_HORIZONTAL_SLIDER_MOVED:
-                if event.ui_element == self.settings_widgets.get("fps_slider"):
-                    self._update_fps(event.value)
-                elif event.ui_element == self.settings_widgets.get("gravity_slider"):
-                    self._update_gravity(event.value)
-                elif event.ui_element == self.settings_widgets.get("path_slider"):
-                    self._update_path_duration(event.value)
-                    
+        # Handle UI interactions; pygame_gui posts each widget event under
+        # its own event type
+        event_type = event.type
+        if event_type == _UI_BUTTON_PRESSED:
+            action = self.button_actions.get(id(event.ui_element))
+            if action is not None:
+                action()
+                
+        elif event_type == _UI_DROP_DOWN_MENU_CHANGED:
+            handler = self.dropdown_handlers.get(id(event.ui_element))
+            if handler is not None:
+                handler(event.text)
+                
+        elif event_type == _UI_HORIZONTAL_SLIDER_MOVED:
+            # Sliders emit a value for every pixel dragged; only the
+            # latest one per slider is applied, on the next flush
+            handler = self.slider_handlers.get(id(event.ui_element))
+            if handler is not None:
+                self.pending_slider_values[handler] = event.value
+                
+    def _flush_slider_values(self):
+        """Apply the latest value of each slider moved since the last flush"""
+        for handler, value in self.pending_slider_values.items():
+            handler(value)
+        self.pending_slider_values.clear()
+        self._slider_flush_timer = 0.0
+        
     def _change_theme(self, theme_name):
         """
         Change application theme
@@ -328,9 +523,11 @@ class SettingsScene(Scene):
         # Store in modified settings
         self.modified_settings["theme"] = theme_name
 
-        # Apply theme colors to preview
+        # Apply theme colors to preview, redrawing the panel over the new background
         self.theme_colors = self.config_manager.apply_theme(theme_name)
         self.background_color = self.theme_colors["background"]
+        self._panel_dirty = True
+        self._full_redraw = True
 
     def _change_resolution(self, resolution_text):
         """
@@ -344,7 +541,22 @@ class SettingsScene(Scene):
             self.modified_settings["screen_width"] = width
             self.modified_settings["screen_height"] = height
         except (ValueError, AttributeError):
-            print(f"Invalid resolution format: {resolution_text}")
+            log.warning("Invalid resolution format: %s", resolution_text)
+            
+    def _set_value_label(self, label, text):
+        """
+        Show a slider's value in its label
+        
+        Slider values change in steps finer than the labels display, so
+        most updates leave the text as it is and need no redraw.
+        
+        Args:
+            label: UILabel showing the value
+            text: Formatted value
+        """
+        if text != label.text:
+            label.set_text(text)
+            self._panel_dirty = True
             
     def _update_fps(self, value):
         """
@@ -357,9 +569,7 @@ class SettingsScene(Scene):
         fps = int(round(value))
         
         # Update display
-        fps_value_label = self.settings_widgets.get("fps_value_label")
-        if fps_value_label:
-            fps_value_label.set_text(str(fps))
+        self._set_value_label(self.fps_value_label, str(fps))
             
         # Store in modified settings
         self.modified_settings["fps"] = fps
@@ -372,9 +582,7 @@ class SettingsScene(Scene):
             value: New gravity value
         """
         # Update display
-        gravity_value_label = self.settings_widgets.get("gravity_value_label")
-        if gravity_value_label:
-            gravity_value_label.set_text(f"{value:.2f}")
+        self._set_value_label(self.gravity_value_label, f"{value:.2f}")
             
         # Store in modified settings
         self.modified_settings["simulation.gravity"] = value
@@ -387,24 +595,30 @@ class SettingsScene(Scene):
             value: New path duration in seconds
         """
         # Update display
-        path_value_label = self.settings_widgets.get("path_value_label")
-        if path_value_label:
-            path_value_label.set_text(f"{value:.1f}s")
+        self._set_value_label(self.path_value_label, f"{value:.1f}s")
             
         # Store in modified settings
         self.modified_settings["simulation.default_path_duration"] = value
         
+    def _save_and_return(self):
+        """Save the settings and go back to the home scene"""
+        self._save_settings()
+        change_scene("home")
+        
     def _save_settings(self):
         """Save modified settings to configuration"""
+        # Include slider moves not yet applied
+        self._flush_slider_values()
+        
         # Apply settings to configuration manager
-        for key, value in self.modified_settings.items():
-            self.config_manager.set_setting(key, value)
-            
-        # Save to file
-        self.config_manager.save_configuration()
-        print("Settings saved")
+        self.config_manager.update_settings(self.modified_settings)
+        
+        # Save to file off the UI thread; repeated saves are coalesced
+        self.config_manager.schedule_save()
+        log.info("Settings saved")
         
     def cleanup(self):
         """Release scene resources"""
-        # Clean up UI manager
+        # Remove this scene's widgets from the shared UI manager
+        super().cleanup()
         self.ui_manager = None
\ No newline at end of file
@@ -3,34 +3,150 @@ Simulation scene implementation for the double pendulum simulation.
 Provides interactive controls and visualization of the pendulum physics.
 """
 
+import logging
+import functools
 import pygame
 import pygame_gui
 import math
 from app.scenes.scene_manager import Scene
-from app.physics.pendulum_physics import PhysicsEngine, PendulumSystem, PendulumParams
+from app.physics.pendulum_physics import PhysicsEngine, Pendulum, PendulumSystem, PendulumParams
+from app.util.fonts import get_font
 from app.util.scene_navigation import change_scene
 
+log = logging.getLogger(__name__)
+
+# Event constants read on every event, bound once at import
+_MOUSEMOTION = pygame.MOUSEMOTION
+_MOUSEBUTTONDOWN = pygame.MOUSEBUTTONDOWN
+_MOUSEBUTTONUP = pygame.MOUSEBUTTONUP
+_UI_BUTTON_PRESSED = pygame_gui.UI_BUTTON_PRESSED
+_UI_HORIZONTAL_SLIDER_MOVED = pygame_gui.UI_HORIZONTAL_SLIDER_MOVED
+
+# Settings new pendulums are created from, with the value used when one is not set
+_PENDULUM_DEFAULTS = {
+    "simulation.default_length1": 120,
+    "simulation.default_length2": 120,
+    "simulation.default_mass1": 10,
+    "simulation.default_mass2": 10,
+    "simulation.default_angle1": 0.8,
+    "simulation.default_angle2": 0.5,
+    "simulation.default_velocity1": 0,
+    "simulation.default_velocity2": 0,
+    "simulation.default_path_color": (0, 128, 255),
+    "simulation.default_path_duration": 2.0,
+    "simulation.default_show_wire": True,
+}
+
+# Control panel widgets, as (class, name, rect relative to the panel,
+# constructor options). Slider start values are filled in from the
+# simulation when the widgets are created.
+_UI_SPEC = (
+    # Simulation controls
+    (pygame_gui.elements.UILabel, "title_label", (20, 20, 260, 30), {"text": "Simulation Controls"}),
+    (pygame_gui.elements.UIButton, "toggle_button", (20, 60, 120, 40), {"text": "Start"}),
+    (pygame_gui.elements.UIButton, "reset_button", (150, 60, 120, 40), {"text": "Reset"}),
+    
+    # Speed controls
+    (pygame_gui.elements.UILabel, "speed_label", (20, 110, 260, 20), {"text": "Simulation Speed"}),
+    (pygame_gui.elements.UIHorizontalSlider, "speed_slider", (20, 140, 260, 20), {"value_range": (0.1, 10.0)}),
+    
+    # Parameter controls
+    (pygame_gui.elements.UILabel, "params_label", (20, 170, 260, 20), {"text": "Pendulum Parameters"}),
+    (pygame_gui.elements.UILabel, "gravity_label", (20, 200, 120, 20), {"text": "Gravity:"}),
+    (pygame_gui.elements.UIHorizontalSlider, "gravity_slider", (150, 200, 120, 20), {"value_range": (0.0, 20.0)}),
+    (pygame_gui.elements.UILabel, "length1_label", (20, 230, 120, 20), {"text": "Length 1:"}),
+    (pygame_gui.elements.UIHorizontalSlider, "length1_slider", (150, 230, 120, 20), {"value_range": (10, 200)}),
+    (pygame_gui.elements.UILabel, "length2_label", (20, 260, 120, 20), {"text": "Length 2:"}),
+    (pygame_gui.elements.UIHorizontalSlider, "length2_slider", (150, 260, 120, 20), {"value_range": (10, 200)}),
+    (pygame_gui.elements.UILabel, "mass1_label", (20, 290, 120, 20), {"text": "Mass 1:"}),
+    (pygame_gui.elements.UIHorizontalSlider, "mass1_slider", (150, 290, 120, 20), {"value_range": (1, 20)}),
+    (pygame_gui.elements.UILabel, "mass2_label", (20, 320, 120, 20), {"text": "Mass 2:"}),
+    (pygame_gui.elements.UIHorizontalSlider, "mass2_slider", (150, 320, 120, 20), {"value_range": (1, 20)}),
+    (pygame_gui.elements.UILabel, "angle1_label", (20, 350, 120, 20), {"text": "Angle 1:"}),
+    (pygame_gui.elements.UIHorizontalSlider, "angle1_slider", (150, 350, 120, 20), {"value_range": (-math.pi, math.pi)}),
+    (pygame_gui.elements.UILabel, "angle2_label", (20, 380, 120, 20), {"text": "Angle 2:"}),
+    (pygame_gui.elements.UIHorizontalSlider, "angle2_slider", (150, 380, 120, 20), {"value_range": (-math.pi, math.pi)}),
+    
+    # Path options
+    (pygame_gui.elements.UILabel, "path_label", (20, 410, 260, 20), {"text": "Path Options"}),
+    (pygame_gui.elements.UILabel, "duration_label", (20, 440, 120, 20), {"text": "Path Duration:"}),
+    (pygame_gui.elements.UIHorizontalSlider, "duration_slider", (150, 440, 120, 20), {"value_range": (0.1, 10.0)}),
+    (pygame_gui.elements.UILabel, "color_label", (20, 470, 120, 20), {"text": "Path Color:"}),
+    (pygame_gui.elements.UIButton, "wire_checkbox", (20, 500, 260, 30), {"text": "Toggle Wire Visibility"}),
+    (pygame_gui.elements.UIButton, "grid_checkbox", (20, 540, 260, 30), {"text": "Toggle Grid"}),
+    
+    # Multiple pendulums
+    (pygame_gui.elements.UILabel, "pendulum_label", (20, 580, 260, 20), {"text": "Pendulum Management"}),
+    (pygame_gui.elements.UIButton, "add_pendulum_button", (20, 610, 120, 30), {"text": "Add Pendulum"}),
+    (pygame_gui.elements.UIButton, "remove_pendulum_button", (150, 610, 120, 30), {"text": "Remove"}),
+)
+
 class SimulationScene(Scene):
     """
     Simulation scene with interactive pendulum visualization and controls
     """
     
+    # Most status lines kept rendered; the oldest is dropped beyond this
+    STATUS_CACHE_SIZE = 64
+    
+    # Without recent input the UI manager runs on one update in this many
+    IDLE_UI_INTERVAL = 3
+    
+    # Sliders showing a pendulum attribute, as (widget name, attribute)
+    _SLIDER_SYNC = (
+        ("length1_slider", "length1"),
+        ("length2_slider", "length2"),
+        ("mass1_slider", "mass1"),
+        ("mass2_slider", "mass2"),
+        ("angle1_slider", "angle1"),
+        ("angle2_slider", "angle2"),
+    )
+    
+    # The sliders a drag can change
+    _DRAG_SLIDER_SYNC = (
+        ("length1_slider", "length1"),
+        ("length2_slider", "length2"),
+        ("angle1_slider", "angle1"),
+        ("angle2_slider", "angle2"),
+    )
+    
     def __init__(self):
         """Initialize simulation scene attributes"""
         self.surface = None
         self.config_manager = None
         self.ui_manager = None
         self.ui_widgets = {}
+        self.button_actions = {}  # Maps id(button) to its click handler
+        self.slider_handlers = {}  # Maps id(slider) to its value handler
+        self.parameter_sliders = ()  # (slider, attribute) pairs resolved from _SLIDER_SYNC
+        self.drag_sliders = ()  # (slider, attribute) pairs resolved from _DRAG_SLIDER_SYNC
         self.physics_engine = None
         self.pendulum_system = None
         self.is_running = False
         self.simulation_speed = 1.0
+        self.gravity = 9.81  # Copy of the physics engine's gravity, read by the status line
         self.show_grid = True
         self.theme_colors = {}
         self.background_color = (240, 240, 245)  # Default light theme
+        self.status_background = None  # pygame.Color behind the status line, from the theme
+        self.status_cache = {}  # Maps displayed status values to (surface, rect, background rect)
+        self.background_surface = None  # Background color and grid, composed on first use
+        
+        # Partial redraw state
+        self._full_redraw = True  # Whether the next frame redraws the whole surface
+        self._ui_settle = 0.0  # Seconds left to keep updating the UI after input
+        self._ui_dirty = True  # Whether the UI changed since the last frame
+        self._prev_pendulum_area = None  # Area the pendulums covered last frame
+        self._prev_status = None  # Status line drawn last frame
+        self._ui_tick = 0  # Updates since the UI manager last ran while idle
+        self._ui_tick_dt = 0.0  # Time accumulated over those updates
         
         # Simulation variables
         self.dragging = False
+        self._drag_target = None  # Pendulum being dragged, from press to release
+        self._panel_right = 300  # Left edge of the simulation area, past the control panel
+        self._center = None  # Center of the surface, where the pendulums hang from
+        self._drag_sync_pending = False  # Whether a drag moved the pendulum since the sliders were set
         self.selected_pendulum_id = None
         
         # Fonts
@@ -38,36 +154,39 @@ class SimulationScene(Scene):
         self.text_font = None
         self.small_font = None
         
-    def initialize(self, surface, config_manager):
+    def initialize(self, surface, config_manager, ui_manager):
         """
         Initialize the scene with required resources
         
         Args:
             surface: The pygame surface to render on
             config_manager: The application's configuration manager
+            ui_manager: The pygame_gui.UIManager shared by all scenes
         """
         self.surface = surface
+        self._center = surface.get_rect().center
         self.config_manager = config_manager
         
-        # Initialize UI manager
-        self.ui_manager = pygame_gui.UIManager(
-            (surface.get_width(), surface.get_height()))
+        # Use the shared UI manager, keeping this scene's widgets in one container
+        self.ui_manager = ui_manager
+        self.ui_root = pygame_gui.core.UIContainer(surface.get_rect(), manager=ui_manager)
             
         # Load theme colors
         theme_name = self.config_manager.get_setting("theme", "light")
         self.theme_colors = self.config_manager.apply_theme(theme_name)
         self.background_color = self.theme_colors["background"]
+        self.status_background = pygame.Color(*self.background_color[:3], 200)
         
         # Initialize fonts
-        pygame.font.init()
-        self.title_font = pygame.font.SysFont('Arial', 28, bold=True)
-        self.text_font = pygame.font.SysFont('Arial', 18)
-        self.small_font = pygame.font.SysFont('Arial', 14)
+        self.title_font = get_font('Arial', 28, bold=True)
+        self.text_font = get_font('Arial', 18)
+        self.small_font = get_font('Arial', 14)
         
         # Initialize physics engine
         self.physics_engine = PhysicsEngine()
         gravity = self.config_manager.get_setting("simulation.gravity", 9.81)
         self.physics_engine.initialize(gravity)
+        self.gravity = gravity
         
         # Initialize pendulum system
         self.pendulum_system = PendulumSystem()
@@ -82,254 +201,112 @@ class SimulationScene(Scene):
         # Show grid by default
         self.show_grid = self.config_manager.get_setting("show_grid", True)
         
-        print("Simulation scene initialized")
+        log.info("Simulation scene initialized")
+        
+    def on_enter(self):
+        """Pick up theme changes made in the settings scene"""
+        super().on_enter()
+        if self.refresh_theme():
+            self.status_cache.clear()
+            self.status_background = pygame.Color(*self.background_color[:3], 200)
+            self.background_surface = None
+        self._full_redraw = True
         
     def _create_default_pendulum(self):
         """Create the default pendulum with settings from config"""
-        params = PendulumParams(
-            offset_x=0,
-            offset_y=0,
-            length1=self.config_manager.get_setting("simulation.default_length1", 120),
-            length2=self.config_manager.get_setting("simulation.default_length2", 120),
-            mass1=self.config_manager.get_setting("simulation.default_mass1", 10),
-            mass2=self.config_manager.get_setting("simulation.default_mass2", 10),
-            angle1=self.config_manager.get_setting("simulation.default_angle1", 0.8),
-            angle2=self.config_manager.get_setting("simulation.default_angle2", 0.5),
-            velocity1=self.config_manager.get_setting("simulation.default_velocity1", 0),
-            velocity2=self.config_manager.get_setting("simulation.default_velocity2", 0),
-            path_color=tuple(self.config_manager.get_setting("simulation.default_path_color", [0, 128, 255])),
-            path_duration=self.config_manager.get_setting("simulation.default_path_duration", 2.0),
-            show_wire=self.config_manager.get_setting("simulation.default_show_wire", True)
-        )
-        
+        params = self._default_params(0, 0)
         self.pendulum_system.create_pendulum(params)
         
+    def _default_params(self, offset_x, offset_y, path_color=None):
+        """
+        Build parameters for a new pendulum from the configured defaults
+        
+        Args:
+            offset_x: Horizontal offset of the anchor from the surface center
+            offset_y: Vertical offset of the anchor from the surface center
+            path_color: RGB path color, or None for the configured one
+            
+        Returns:
+            PendulumParams: Parameters for the new pendulum
+        """
+        defaults = self.config_manager.get_settings(_PENDULUM_DEFAULTS)
+        if path_color is None:
+            path_color = tuple(defaults["simulation.default_path_color"])
+            
+        return PendulumParams(
+            offset_x=offset_x,
+            offset_y=offset_y,
+            length1=defaults["simulation.default_length1"],
+            length2=defaults["simulation.default_length2"],
+            mass1=defaults["simulation.default_mass1"],
+            mass2=defaults["simulation.default_mass2"],
+            angle1=defaults["simulation.default_angle1"],
+            angle2=defaults["simulation.default_angle2"],
+            velocity1=defaults["simulation.default_velocity1"],
+            velocity2=defaults["simulation.default_velocity2"],
+            path_color=path_color,
+            path_duration=defaults["simulation.default_path_duration"],
+            show_wire=defaults["simulation.default_show_wire"]
+        )
+        
     def _create_ui_elements(self):
         """Create simulation UI controls"""
+        # Names used for every widget, looked up once
+        Rect = pygame.Rect
+        elements = pygame_gui.elements
+        ui_manager = self.ui_manager
+        
         # Control panel background
-        panel_rect = pygame.Rect(10, 10, 280, self.surface.get_height() - 20)
-        panel = pygame_gui.elements.UIPanel(
+        panel_rect = Rect(10, 10, 280, self.surface.get_height() - 20)
+        panel = elements.UIPanel(
             relative_rect=panel_rect,
-            manager=self.ui_manager
+            manager=ui_manager,
+            container=self.ui_root
         )
         self.ui_widgets["panel"] = panel
         
-        # Simulation controls
-        title_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(20, 20, 260, 30),
-            text="Simulation Controls",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["title_label"] = title_label
-        
-        # Start/stop button
-        toggle_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(20, 60, 120, 40),
-            text="Start",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["toggle_button"] = toggle_button
-        
-        # Reset button
-        reset_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(150, 60, 120, 40),
-            text="Reset",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["reset_button"] = reset_button
-        
-        # Speed controls
-        speed_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(20, 110, 260, 20),
-            text="Simulation Speed",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["speed_label"] = speed_label
-        
-        speed_slider = pygame_gui.elements.UIHorizontalSlider(
-            relative_rect=pygame.Rect(20, 140, 260, 20),
-            start_value=1.0,
-            value_range=(0.1, 10.0),
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["speed_slider"] = speed_slider
-        
-        # Parameter controls
-        params_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(20, 170, 260, 20),
-            text="Pendulum Parameters",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["params_label"] = params_label
-        
-        # Gravity
-        gravity_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(20, 200, 120, 20),
-            text="Gravity:",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["gravity_label"] = gravity_label
-        
-        gravity_slider = pygame_gui.elements.UIHorizontalSlider(
-            relative_rect=pygame.Rect(150, 200, 120, 20),
-            start_value=self.physics_engine.get_gravity(),
-            value_range=(0.0, 20.0),
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["gravity_slider"] = gravity_slider
-        
-        # Length controls
-        length1_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(20, 230, 120, 20),
-            text="Length 1:",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["length1_label"] = length1_label
-        
+        # Labels, buttons and sliders, in the order listed in _UI_SPEC
         selected_pendulum = self.pendulum_system.get_selected_pendulum()
-        length1_slider = pygame_gui.elements.UIHorizontalSlider(
-            relative_rect=pygame.Rect(150, 230, 120, 20),
-            start_value=selected_pendulum.length1 if selected_pendulum else 120,
-            value_range=(10, 200),
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["length1_slider"] = length1_slider
-        
-        length2_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(20, 260, 120, 20),
-            text="Length 2:",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["length2_label"] = length2_label
-        
-        length2_slider = pygame_gui.elements.UIHorizontalSlider(
-            relative_rect=pygame.Rect(150, 260, 120, 20),
-            start_value=selected_pendulum.length2 if selected_pendulum else 120,
-            value_range=(10, 200),
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["length2_slider"] = length2_slider
-        
-        # Mass controls
-        mass1_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(20, 290, 120, 20),
-            text="Mass 1:",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["mass1_label"] = mass1_label
-        
-        mass1_slider = pygame_gui.elements.UIHorizontalSlider(
-            relative_rect=pygame.Rect(150, 290, 120, 20),
-            start_value=selected_pendulum.mass1 if selected_pendulum else 10,
-            value_range=(1, 20),
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["mass1_slider"] = mass1_slider
-        
-        mass2_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(20, 320, 120, 20),
-            text="Mass 2:",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["mass2_label"] = mass2_label
-        
-        mass2_slider = pygame_gui.elements.UIHorizontalSlider(
-            relative_rect=pygame.Rect(150, 320, 120, 20),
-            start_value=selected_pendulum.mass2 if selected_pendulum else 10,
-            value_range=(1, 20),
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["mass2_slider"] = mass2_slider
-        
-        # Initial angle controls
-        angle1_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(20, 350, 120, 20),
-            text="Angle 1:",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["angle1_label"] = angle1_label
-        
-        angle1_slider = pygame_gui.elements.UIHorizontalSlider(
-            relative_rect=pygame.Rect(150, 350, 120, 20),
-            start_value=selected_pendulum.angle1 if selected_pendulum else 0.8,
-            value_range=(-math.pi, math.pi),
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["angle1_slider"] = angle1_slider
-        
-        angle2_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(20, 380, 120, 20),
-            text="Angle 2:",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["angle2_label"] = angle2_label
-        
-        angle2_slider = pygame_gui.elements.UIHorizontalSlider(
-            relative_rect=pygame.Rect(150, 380, 120, 20),
-            start_value=selected_pendulum.angle2 if selected_pendulum else 0.5,
-            value_range=(-math.pi, math.pi),
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["angle2_slider"] = angle2_slider
-        
-        # Path options
-        path_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(20, 410, 260, 20),
-            text="Path Options",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["path_label"] = path_label
-        
-        # Path duration
-        duration_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(20, 440, 120, 20),
-            text="Path Duration:",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["duration_label"] = duration_label
-        
-        duration_slider = pygame_gui.elements.UIHorizontalSlider(
-            relative_rect=pygame.Rect(150, 440, 120, 20),
-            start_value=selected_pendulum.path_tracer.max_points / 60 if selected_pendulum else 2.0,
-            value_range=(0.1, 10.0),
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["duration_slider"] = duration_slider
-        
-        # Path color picker (simplified)
-        color_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(20, 470, 120, 20),
-            text="Path Color:",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["color_label"] = color_label
+        if selected_pendulum:
+            pendulum_values = {
+                "length1_slider": selected_pendulum.length1,
+                "length2_slider": selected_pendulum.length2,
+                "mass1_slider": selected_pendulum.mass1,
+                "mass2_slider": selected_pendulum.mass2,
+                "angle1_slider": selected_pendulum.angle1,
+                "angle2_slider": selected_pendulum.angle2,
+                "duration_slider": selected_pendulum.path_tracer.max_points / 60,
+            }
+        else:
+            pendulum_values = {
+                "length1_slider": 120,
+                "length2_slider": 120,
+                "mass1_slider": 10,
+                "mass2_slider": 10,
+                "angle1_slider": 0.8,
+                "angle2_slider": 0.5,
+                "duration_slider": 2.0,
+            }
+        start_values = {
+            "speed_slider": 1.0,
+            "gravity_slider": self.gravity,
+            **pendulum_values
+        }
+        
+        UIHorizontalSlider = elements.UIHorizontalSlider
+        ui_widgets = self.ui_widgets
+        for widget_class, name, rect, options in _UI_SPEC:
+            if widget_class is UIHorizontalSlider:
+                options = dict(options, start_value=start_values[name])
+            ui_widgets[name] = widget_class(
+                relative_rect=Rect(rect),
+                manager=ui_manager,
+                container=panel,
+                **options
+            )
         
         # Create color buttons
-        color_buttons_rect = pygame.Rect(150, 470, 120, 20)
+        color_buttons_rect = Rect(150, 470, 120, 20)
         colors = [
             ((0, 128, 255), "Blue"),
             ((255, 0, 0), "Red"),
@@ -339,136 +316,220 @@ class SimulationScene(Scene):
         
         for i, (color, name) in enumerate(colors):
             btn_width = color_buttons_rect.width // len(colors)
-            color_btn = pygame_gui.elements.UIButton(
-                relative_rect=pygame.Rect(
+            color_btn = elements.UIButton(
+                relative_rect=Rect(
                     color_buttons_rect.x + i * btn_width, 
                     color_buttons_rect.y, 
                     btn_width, 
                     color_buttons_rect.height
                 ),
                 text="",
-                manager=self.ui_manager,
+                manager=ui_manager,
                 container=panel,
                 object_id=f"color_btn_{i}"
             )
             # Store color with button for reference
             color_btn.color = color
             self.ui_widgets[f"color_btn_{i}"] = color_btn
-        
-        # Toggle wire visibility
-        wire_checkbox = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(20, 500, 260, 30),
-            text="Toggle Wire Visibility",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["wire_checkbox"] = wire_checkbox
-        
-        # Toggle grid visibility
-        grid_checkbox = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(20, 540, 260, 30),
-            text="Toggle Grid",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["grid_checkbox"] = grid_checkbox
-        
-        # Multiple pendulums
-        pendulum_label = pygame_gui.elements.UILabel(
-            relative_rect=pygame.Rect(20, 580, 260, 20),
-            text="Pendulum Management",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["pendulum_label"] = pendulum_label
-        
-        add_pendulum_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(20, 610, 120, 30),
-            text="Add Pendulum",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["add_pendulum_button"] = add_pendulum_button
-        
-        remove_pendulum_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(150, 610, 120, 30),
-            text="Remove",
-            manager=self.ui_manager,
-            container=panel
-        )
-        self.ui_widgets["remove_pendulum_button"] = remove_pendulum_button
+            self.button_actions[id(color_btn)] = functools.partial(self.set_path_color, color)
         
         # Return to menu button
-        return_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(20, panel.relative_rect.height - 50, 260, 40),
+        return_button = elements.UIButton(
+            relative_rect=Rect(20, panel.relative_rect.height - 50, 260, 40),
             text="Return to Menu",
-            manager=self.ui_manager,
+            manager=ui_manager,
             container=panel
         )
         self.ui_widgets["return_button"] = return_button
         
+        # Route UI events to their handlers by the widget that sent them
+        widgets = self.ui_widgets
+        self.button_actions.update({
+            id(widgets["toggle_button"]): self.toggle_simulation,
+            id(widgets["reset_button"]): self.reset_simulation,
+            id(widgets["wire_checkbox"]): self.toggle_wire_visibility,
+            id(widgets["grid_checkbox"]): self.toggle_grid_visibility,
+            id(widgets["add_pendulum_button"]): self.add_pendulum,
+            id(widgets["remove_pendulum_button"]): self.remove_selected_pendulum,
+            id(return_button): lambda: change_scene("home"),
+        })
+        update_parameter = self.update_pendulum_parameter
+        self.slider_handlers = {
+            id(widgets["speed_slider"]): self.set_simulation_speed,
+            id(widgets["gravity_slider"]): self.set_gravity,
+            id(widgets["length1_slider"]): functools.partial(update_parameter, Pendulum.set_length, 1),
+            id(widgets["length2_slider"]): functools.partial(update_parameter, Pendulum.set_length, 2),
+            id(widgets["mass1_slider"]): functools.partial(update_parameter, Pendulum.set_mass, 1),
+            id(widgets["mass2_slider"]): functools.partial(update_parameter, Pendulum.set_mass, 2),
+            id(widgets["angle1_slider"]): functools.partial(update_parameter, Pendulum.set_angle, 1),
+            id(widgets["angle2_slider"]): functools.partial(update_parameter, Pendulum.set_angle, 2),
+            id(widgets["duration_slider"]): self.update_path_duration,
+        }
+        
+        # Resolve the slider tables to widgets once, so syncing them does
+        # no name lookups
+        self.parameter_sliders = tuple((widgets[name], attribute)
+                                       for name, attribute in self._SLIDER_SYNC)
+        self.drag_sliders = tuple((widgets[name], attribute)
+                                  for name, attribute in self._DRAG_SLIDER_SYNC)
+        
     def update(self, dt):
         """
-        Update simulation logic
+        Update the control panel widgets
         
         Args:
             dt: Delta time in seconds since last update
         """
-        # Update UI manager
-        self.ui_manager.update(dt)
+        if dt <= 0.0:
+            return
+            
+        if self._drag_sync_pending:
+            self._flush_drag_sync()
+            
+        # Widget states change in response to input and settle shortly
+        # after, so the UI manager runs on every update until then; once
+        # idle it runs less often, with the time accumulated in between
+        if self._ui_settle > 0.0:
+            self._ui_settle -= dt
+            self._ui_dirty = True
+            self.ui_manager.update(dt + self._ui_tick_dt)
+            self._ui_tick = 0
+            self._ui_tick_dt = 0.0
+        else:
+            self._ui_tick += 1
+            self._ui_tick_dt += dt
+            if self._ui_tick >= self.IDLE_UI_INTERVAL:
+                self.ui_manager.update(self._ui_tick_dt)
+                self._ui_tick = 0
+                self._ui_tick_dt = 0.0
+                
+    def step(self, dt):
+        """
+        Advance the physics by one fixed-size step
         
+        Args:
+            dt: Fixed step size in seconds
+        """
         # Skip physics update if paused
         if self.is_running:
-            # Scale dt by simulation speed
-            scaled_dt = dt * self.simulation_speed
-            
-            # Update physics engine
-            self.physics_engine.update(scaled_dt)
-            
-            # Update pendulum system
-            self.pendulum_system.update(scaled_dt, self.physics_engine.get_gravity())
+            # Advance every pendulum by dt scaled by the simulation speed
+            self.physics_engine.step(self.pendulum_system, dt * self.simulation_speed)
             
     def render(self):
-        """Render the simulation to the surface"""
-        # Clear the screen
-        self.surface.fill(self.background_color)
+        """
+        Render the simulation to the surface
         
-        # Draw grid if enabled
-        if self.show_grid:
-            self._draw_grid()
+        Returns:
+            list: pygame.Rect areas of the surface that changed this frame
+        """
+        surface = self.surface
+        status = self._get_status()
+        pendulum_area = self.pendulum_system.get_bounds(self._center)
+        panel_rect = self.ui_widgets["panel"].rect
+        
+        # Redraw only what can have changed: the pendulums where they are
+        # and where they were, the control panel while it reacts to input,
+        # and the status line when its text changes
+        if self._full_redraw:
+            dirty = surface.get_rect()
+            self._full_redraw = False
+        else:
+            changed = [area for area in (pendulum_area, self._prev_pendulum_area)
+                       if area is not None]
+            if self._ui_dirty:
+                changed.append(panel_rect)
+            if status is not self._prev_status:
+                changed.append(status[2])
+                changed.append(self._prev_status[2])
+            if not changed:
+                return []
+            dirty = changed[0].unionall(changed[1:])
+        self._prev_pendulum_area = pendulum_area
+        self._prev_status = status
+        self._ui_dirty = False
+        
+        # Everything below is drawn in full but clipped to the dirty area
+        surface.set_clip(dirty)
+        
+        # Clear the screen to the background and grid
+        self._draw_background()
         
         # Render pendulum system
-        self.pendulum_system.render(self.surface)
+        self.pendulum_system.render(surface)
         
-        # Draw UI elements
-        self.ui_manager.draw_ui(self.surface)
+        # The control panel and status line are static between changes;
+        # when only the pendulums moved, the dirty area usually misses
+        # them and they are left as they are on screen
+        if dirty.colliderect(panel_rect):
+            self.ui_manager.draw_ui(surface)
+            
+        # Draw status text with background
+        status_surface, status_rect, bg_rect = status
+        if dirty.colliderect(bg_rect):
+            pygame.draw.rect(surface, self.status_background, bg_rect, border_radius=5)
+            surface.blit(status_surface, status_rect)
         
-        # Draw status text
-        status_text = f"Status: {'Running' if self.is_running else 'Paused'} | Speed: {self.simulation_speed:.1f}x | Gravity: {self.physics_engine.get_gravity():.1f}"
+        surface.set_clip(None)
+        return [dirty]
         
-        # Draw status text with background
-        status_surface = self.text_font.render(status_text, True, self.theme_colors["text"])
+    def _get_status(self):
+        """
+        Get the rendered status line for the current simulation state
+        
+        The line only changes when a displayed value does, so it is
+        rendered once per distinct set of values and reused.
+        
+        Returns:
+            tuple: (text surface, its rect, rect of the background behind it)
+        """
+        gravity = self.gravity
+        key = (self.is_running, round(self.simulation_speed, 1), round(gravity, 1))
+        status = self.status_cache.get(key)
+        if status is not None:
+            return status
+            
+        status_text = f"Status: {'Running' if self.is_running else 'Paused'} | Speed: {self.simulation_speed:.1f}x | Gravity: {gravity:.1f}"
+        status_surface = self.text_font.render(status_text, True, self.theme_colors["text"]).convert_alpha()
         status_rect = status_surface.get_rect()
         status_rect.bottomright = (self.surface.get_width() - 10, self.surface.get_height() - 10)
         
         # Add background for status text
-        bg_rect = status_rect.copy()
-        bg_rect.inflate_ip(20, 10)
-        pygame.draw.rect(self.surface, (*self.theme_colors["background"], 200), bg_rect, border_radius=5)
-        
-        # Draw text
-        self.surface.blit(status_surface, status_rect)
+        bg_rect = status_rect.inflate(20, 10)
+        
+        # Drop the oldest entry to bound the cache while a slider is dragged
+        if len(self.status_cache) >= self.STATUS_CACHE_SIZE:
+            del self.status_cache[next(iter(self.status_cache))]
+        status = self.status_cache[key] = (status_surface, status_rect, bg_rect)
+        return status
+        
+    def _draw_background(self):
+        """Draw the background color and, if enabled, the reference grid"""
+        # Neither changes while the scene runs, so both are composed once
+        # into an opaque surface and drawn with a single blit
+        if self.background_surface is None:
+            self.background_surface = self._build_background_surface()
+        self.surface.blit(self.background_surface, (0, 0))
+        
+    def _build_background_surface(self):
+        """
+        Fill a surface with the background color and draw the grid on it
         
-    def _draw_grid(self):
-        """Draw reference grid on the simulation surface"""
+        Returns:
+            pygame.Surface: Opaque surface the size of the scene surface
+        """
         width, height = self.surface.get_width(), self.surface.get_height()
+        background = pygame.Surface((width, height)).convert()
+        background.fill(self.background_color)
+        if not self.show_grid:
+            return background
+            
         grid_color = self.theme_colors["grid"]
         grid_spacing = 50
         
         # Vertical lines
-        for x in range(300, width, grid_spacing):  # Start after control panel
+        for x in range(self._panel_right, width, grid_spacing):
             pygame.draw.line(
-                self.surface,
+                background,
                 grid_color,
                 (x, 0),
                 (x, height),
@@ -478,16 +539,29 @@ class SimulationScene(Scene):
         # Horizontal lines
         for y in range(0, height, grid_spacing):
             pygame.draw.line(
-                self.surface,
+                background,
                 grid_color,
-                (300, y),  # Start after control panel
+                (self._panel_right, y),
                 (width, y),
                 1
             )
             
         # Draw center point (anchor)
         center_x, center_y = width // 2, height // 2
-        pygame.draw.circle(self.surface, self.theme_colors["primary"], (center_x, center_y), 5)
+        pygame.draw.circle(background, self.theme_colors["primary"], (center_x, center_y), 5)
+        
+        return background
+        
+    def is_idle(self):
+        """
+        Check whether the scene can wait for input without falling behind
+        
+        Returns:
+            bool: True while paused and not dragging, once the control
+                  panel has settled and the last frame is drawn
+        """
+        return (not self.is_running and not self.dragging and self._ui_settle <= 0.0
+                and not self._ui_dirty and not self._full_redraw)
         
     def handle_event(self, event):
         """
@@ -496,64 +570,58 @@ class SimulationScene(Scene):
         Args:
             event: The pygame event to handle
         """
+        # Any input can change widget state (hover, press), so redraw the panel
+        self._ui_settle = self.UI_SETTLE_TIME
+        self._ui_dirty = True
+        
         # Process UI events
         self.ui_manager.process_events(event)
         
-        # Mouse events for dragging
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        # pygame_gui posts each widget event under its own event type, so
+        # one comparison chain dispatches everything, most frequent first
+        event_type = event.type
+        if event_type == _MOUSEMOTION:
+            if self.dragging and event.pos[0] > self._panel_right:
+                self._handle_simulation_drag(event.pos)
+                
+        elif event_type == _UI_BUTTON_PRESSED:
+            action = self.button_actions.get(id(event.ui_element))
+            if action is not None:
+                action()
+                
+        elif event_type == _UI_HORIZONTAL_SLIDER_MOVED:
+            handler = self.slider_handlers.get(id(event.ui_element))
+            if handler is not None:
+                handler(event.value)
+                
+        elif event_type == _MOUSEBUTTONDOWN and event.button == 1:
             # Check if click is in simulation area (not on UI panel)
-            if event.pos[0] > 300:  # UI panel width
+            if event.pos[0] > self._panel_right:
                 self._handle_simulation_click(event.pos)
                 
-        elif event.type == pygame.MOUSEMOTION:
-            if self.dragging and event.pos[0] > 300:
-                self._handle_simulation_drag(event.pos)
-                
-        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+        elif event_type == _MOUSEBUTTONUP and event.button == 1:
             if self.dragging:
                 self._handle_simulation_release()
                 
-        # Handle UI interactions
-        if event.type == pygame.USEREVENT:
-            if event.user_type == pygame_gui.UI_BUTTON_PRESSED:
-                if event.ui_element == self.ui_widgets.get("toggle_button"):
-                    self.toggle_simulation()
-                elif event.ui_element == self.ui_widgets.get("reset_button"):
-                    self.reset_simulation()
-                elif event.ui_element == self.ui_widgets.get("wire_checkbox"):
-                    self.toggle_wire_visibility()
-                elif event.ui_element == self.ui_widgets.get("grid_checkbox"):
-                    self.toggle_grid_visibility()
-                elif event.ui_element == self.ui_widgets.get("add_pendulum_button"):
-                    self.add_pendulum()
-                elif event.ui_element == self.ui_widgets.get("remove_pendulum_button"):
-                    self.remove_selected_pendulum()
-                elif event.ui_element == self.ui_widgets.get("return_button"):
-                    change_scene("home")
-                # Color buttons
-                elif "color_btn_" in event.ui_element.object_ids:
-                    self.set_path_color(event.ui_element.color)
-                    
-            elif event.user_type == pygame_gui.UI_HORIZONTAL_SLIDER_MOVED:
-                if event.ui_element == self.ui_widgets.get("speed_slider"):
-                    self.simulation_speed = event.value
-                elif event.ui_element == self.ui_widgets.get("gravity_slider"):
-                    self.physics_engine.set_gravity(event.value)
-                elif event.ui_element == self.ui_widgets.get("length1_slider"):
-                    self.update_pendulum_parameter("length1", event.value)
-                elif event.ui_element == self.ui_widgets.get("length2_slider"):
-                    self.update_pendulum_parameter("length2", event.value)
-                elif event.ui_element == self.ui_widgets.get("mass1_slider"):
-                    self.update_pendulum_parameter("mass1", event.value)
-                elif event.ui_element == self.ui_widgets.get("mass2_slider"):
-                    self.update_pendulum_parameter("mass2", event.value)
-                elif event.ui_element == self.ui_widgets.get("angle1_slider"):
-                    self.update_pendulum_parameter("angle1", event.value)
-                elif event.ui_element == self.ui_widgets.get("angle2_slider"):
-                    self.update_pendulum_parameter("angle2", event.value)
-                elif event.ui_element == self.ui_widgets.get("duration_slider"):
-                    self.update_path_duration(event.value)
-                
+    def set_simulation_speed(self, speed):
+        """
+        Set the simulation speed multiplier
+        
+        Args:
+            speed: Simulated seconds per real second
+        """
+        self.simulation_speed = speed
+        
+    def set_gravity(self, gravity):
+        """
+        Set the gravity used by the physics engine
+        
+        Args:
+            gravity: Gravity value in m/s²
+        """
+        self.physics_engine.set_gravity(gravity)
+        self.gravity = gravity
+        
     def toggle_simulation(self):
         """Toggle simulation between running and paused states"""
         self.is_running = not self.is_running
@@ -570,43 +638,20 @@ class SimulationScene(Scene):
             selected_pendulum.reset()
             
             # Update UI sliders to match reset values
-            if self.ui_widgets.get("length1_slider"):
-                self.ui_widgets["length1_slider"].set_current_value(selected_pendulum.length1)
-            if self.ui_widgets.get("length2_slider"):
-                self.ui_widgets["length2_slider"].set_current_value(selected_pendulum.length2)
-            if self.ui_widgets.get("mass1_slider"):
-                self.ui_widgets["mass1_slider"].set_current_value(selected_pendulum.mass1)
-            if self.ui_widgets.get("mass2_slider"):
-                self.ui_widgets["mass2_slider"].set_current_value(selected_pendulum.mass2)
-            if self.ui_widgets.get("angle1_slider"):
-                self.ui_widgets["angle1_slider"].set_current_value(selected_pendulum.angle1)
-            if self.ui_widgets.get("angle2_slider"):
-                self.ui_widgets["angle2_slider"].set_current_value(selected_pendulum.angle2)
+            self._sync_sliders(selected_pendulum, self.parameter_sliders)
                 
-    def update_pendulum_parameter(self, param_name, value):
+    def update_pendulum_parameter(self, setter, index, value):
         """
         Update a parameter for the selected pendulum
         
         Args:
-            param_name: Name of the parameter to update
+            setter: Pendulum method that sets the parameter, e.g. Pendulum.set_length
+            index: Rod, bob or joint number passed to the setter (1 or 2)
             value: New value for the parameter
         """
         selected_pendulum = self.pendulum_system.get_selected_pendulum()
-        if not selected_pendulum:
-            return
-            
-        if param_name == "length1":
-            selected_pendulum.set_length(1, value)
-        elif param_name == "length2":
-            selected_pendulum.set_length(2, value)
-        elif param_name == "mass1":
-            selected_pendulum.set_mass(1, value)
-        elif param_name == "mass2":
-            selected_pendulum.set_mass(2, value)
-        elif param_name == "angle1":
-            selected_pendulum.set_angle(1, value)
-        elif param_name == "angle2":
-            selected_pendulum.set_angle(2, value)
+        if selected_pendulum:
+            setter(selected_pendulum, index, value)
             
     def toggle_wire_visibility(self):
         """Toggle visibility of pendulum wires/rods"""
@@ -618,6 +663,8 @@ class SimulationScene(Scene):
         """Toggle grid visibility"""
         self.show_grid = not self.show_grid
         self.config_manager.set_setting("show_grid", self.show_grid)
+        self.background_surface = None
+        self._full_redraw = True
         
     def set_path_color(self, color):
         """
@@ -664,21 +711,7 @@ class SimulationScene(Scene):
         
         color_index = self.pendulum_system.get_pendulum_count() % len(colors)
         
-        params = PendulumParams(
-            offset_x=offset_x,
-            offset_y=offset_y,
-            length1=self.config_manager.get_setting("simulation.default_length1", 120),
-            length2=self.config_manager.get_setting("simulation.default_length2", 120),
-            mass1=self.config_manager.get_setting("simulation.default_mass1", 10),
-            mass2=self.config_manager.get_setting("simulation.default_mass2", 10),
-            angle1=self.config_manager.get_setting("simulation.default_angle1", 0.8),
-            angle2=self.config_manager.get_setting("simulation.default_angle2", 0.5),
-            velocity1=self.config_manager.get_setting("simulation.default_velocity1", 0),
-            velocity2=self.config_manager.get_setting("simulation.default_velocity2", 0),
-            path_color=colors[color_index],
-            path_duration=self.config_manager.get_setting("simulation.default_path_duration", 2.0),
-            show_wire=self.config_manager.get_setting("simulation.default_show_wire", True)
-        )
+        params = self._default_params(offset_x, offset_y, colors[color_index])
         
         # Create and select the new pendulum
         new_pendulum = self.pendulum_system.create_pendulum(params)
@@ -694,7 +727,7 @@ class SimulationScene(Scene):
             
             # Select the first available pendulum
             if self.pendulum_system.get_pendulum_count() > 0:
-                first_id = next(iter(self.pendulum_system.pendulums.keys()))
+                first_id = self.pendulum_system.pendulums[0].id
                 self.pendulum_system.select_pendulum(first_id)
                 
             # Update UI for newly selected pendulum
@@ -707,22 +740,28 @@ class SimulationScene(Scene):
             return
             
         # Update sliders to match pendulum properties
-        if self.ui_widgets.get("length1_slider"):
-            self.ui_widgets["length1_slider"].set_current_value(selected_pendulum.length1)
-        if self.ui_widgets.get("length2_slider"):
-            self.ui_widgets["length2_slider"].set_current_value(selected_pendulum.length2)
-        if self.ui_widgets.get("mass1_slider"):
-            self.ui_widgets["mass1_slider"].set_current_value(selected_pendulum.mass1)
-        if self.ui_widgets.get("mass2_slider"):
-            self.ui_widgets["mass2_slider"].set_current_value(selected_pendulum.mass2)
-        if self.ui_widgets.get("angle1_slider"):
-            self.ui_widgets["angle1_slider"].set_current_value(selected_pendulum.angle1)
-        if self.ui_widgets.get("angle2_slider"):
-            self.ui_widgets["angle2_slider"].set_current_value(selected_pendulum.angle2)
-        if self.ui_widgets.get("duration_slider"):
-            self.ui_widgets["duration_slider"].set_current_value(
+        self._sync_sliders(selected_pendulum, self.parameter_sliders)
+        duration_slider = self.ui_widgets.get("duration_slider")
+        if duration_slider is not None:
+            duration_slider.set_current_value(
                 selected_pendulum.path_tracer.max_points / 60)  # Convert points to seconds
                 
+    def _sync_sliders(self, pendulum, sliders):
+        """
+        Set the parameter sliders to a pendulum's values
+        
+        Args:
+            pendulum: Pendulum whose values to show
+            sliders: (slider, attribute) pairs of the sliders to set, e.g.
+                     self.parameter_sliders; empty until the widgets exist
+        """
+        # Setting a slider repositions its handle even when the value is
+        # the same, and a drag usually changes only two of the four
+        for slider, attribute in sliders:
+            value = getattr(pendulum, attribute)
+            if value != slider.current_value:
+                slider.set_current_value(value)
+                
     def _handle_simulation_click(self, pos):
         """
         Handle mouse click in the simulation area
@@ -731,13 +770,14 @@ class SimulationScene(Scene):
             pos: (x, y) mouse position
         """
         # Try to select a pendulum at the clicked position
-        pendulum = self.pendulum_system.try_select_pendulum_at_position(
-            pos, (self.surface.get_width() // 2, self.surface.get_height() // 2))
+        pendulum = self.pendulum_system.try_select_pendulum_at_position(pos, self._center)
             
         if pendulum:
-            # Start dragging if a pendulum was selected
-            self.dragging = pendulum.start_drag(
-                pos, (self.surface.get_width() // 2, self.surface.get_height() // 2))
+            # Start dragging if a pendulum was selected; motion events go
+            # straight to it until the button is released
+            self.dragging = pendulum.start_drag(pos, self._center)
+            if self.dragging:
+                self._drag_target = pendulum
                 
             # Update UI to reflect selected pendulum
             self._update_ui_for_selected_pendulum()
@@ -749,31 +789,35 @@ class SimulationScene(Scene):
         Args:
             pos: (x, y) mouse position
         """
-        selected_pendulum = self.pendulum_system.get_selected_pendulum()
-        if selected_pendulum and self.dragging:
-            selected_pendulum.update_drag(
-                pos, (self.surface.get_width() // 2, self.surface.get_height() // 2))
-                
-            # Update UI sliders to match the new pendulum state
-            if self.ui_widgets.get("angle1_slider"):
-                self.ui_widgets["angle1_slider"].set_current_value(selected_pendulum.angle1)
-            if self.ui_widgets.get("angle2_slider"):
-                self.ui_widgets["angle2_slider"].set_current_value(selected_pendulum.angle2)
-            if self.ui_widgets.get("length1_slider"):
-                self.ui_widgets["length1_slider"].set_current_value(selected_pendulum.length1)
-            if self.ui_widgets.get("length2_slider"):
-                self.ui_widgets["length2_slider"].set_current_value(selected_pendulum.length2)
+        pendulum = self._drag_target
+        if pendulum:
+            pendulum.update_drag(pos, self._center)
+            
+            # The sliders follow the dragged pendulum once per frame, in
+            # update, however many motion events arrive in between
+            self._drag_sync_pending = True
                 
+    def _flush_drag_sync(self):
+        """Set the sliders changed by dragging to the dragged pendulum's values"""
+        self._drag_sync_pending = False
+        pendulum = self._drag_target
+        if pendulum:
+            self._sync_sliders(pendulum, self.drag_sliders)
+            
     def _handle_simulation_release(self):
         """Handle mouse release at the end of a drag operation"""
-        selected_pendulum = self.pendulum_system.get_selected_pendulum()
-        if selected_pendulum:
-            selected_pendulum.end_drag()
+        pendulum = self._drag_target
+        if pendulum:
+            pendulum.end_drag()
+        if self._drag_sync_pending:
+            self._flush_drag_sync()
             
         # End dragging state
         self.dragging = False
+        self._drag_target = None
         
     def cleanup(self):
         """Release scene resources"""
-        # Clean up UI manager
+        # Remove this scene's widgets from the shared UI manager
+        super().cleanup()
         self.ui_manager = None
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""
+Shared font loading for the double pendulum simulation
+"""
+
+import functools
+import pygame
+
+@functools.lru_cache(maxsize=64)
+def get_font(name, size, bold=False):
+    """
+    Get a system font, loading it only the first time it is requested
+    
+    Args:
+        name: Font family name (e.g. 'Arial')
+        size: Point size
+        bold: Whether to use the bold face
+        
+    Returns:
+        pygame.font.Font: The font, shared by every caller
+    """
+    if not pygame.font.get_init():
+        pygame.font.init()
+    return pygame.font.SysFont(name, size, bold=bold)
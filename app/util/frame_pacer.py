@@ -0,0 +1,85 @@
+"""
+Frame pacing that predicts how far sleeps overrun
+"""
+
+import collections
+import time
+
+class FramePacer:
+    """
+    Frame limiter that sleeps through most of each frame and spins the rest
+    
+    time.sleep usually wakes up late, by an amount that depends on the OS
+    and the load. The pacer remembers how late recent sleeps were and
+    shortens the next one by that much, then busy-waits the remaining
+    stretch, so frames end close to their target without spinning for the
+    whole wait the way pygame's tick_busy_loop does.
+    """
+    
+    __slots__ = ("_last", "_overshoots", "_overshoot_total")
+    
+    # Number of recent sleeps the overshoot prediction is averaged over
+    HISTORY = 120
+    
+    # Extra time (seconds) left for spinning on top of the predicted
+    # overshoot, absorbing sleeps that overrun more than usual
+    SPIN_MARGIN = 0.0005
+    
+    def __init__(self):
+        """Initialize the pacer, timing the first frame from now"""
+        self._last = time.perf_counter()
+        self._overshoots = collections.deque()
+        self._overshoot_total = 0.0
+        
+    def _record_overshoot(self, overshoot):
+        """
+        Add how late a sleep woke up to the history
+        
+        Args:
+            overshoot: Seconds the sleep ran past its requested length
+        """
+        overshoots = self._overshoots
+        if len(overshoots) == self.HISTORY:
+            self._overshoot_total -= overshoots.popleft()
+        overshoots.append(overshoot)
+        self._overshoot_total += overshoot
+        
+    def predicted_overshoot(self):
+        """
+        Estimate how late the next sleep will wake up
+        
+        Returns:
+            float: Average overshoot of the recent sleeps in seconds
+        """
+        count = len(self._overshoots)
+        return self._overshoot_total / count if count else 0.0
+        
+    def tick(self, framerate=0):
+        """
+        Wait until the current frame has lasted 1 / framerate seconds
+        
+        Same contract as pygame.time.Clock.tick, so the two can be swapped.
+        
+        Args:
+            framerate: Target frames per second, or 0 to return at once
+            
+        Returns:
+            float: Milliseconds since the previous call
+        """
+        perf_counter = time.perf_counter
+        now = perf_counter()
+        if framerate > 0:
+            target = self._last + 1.0 / framerate
+            sleep_time = target - now - self.predicted_overshoot() - self.SPIN_MARGIN
+            if sleep_time > 0.0:
+                time.sleep(sleep_time)
+                self._record_overshoot(perf_counter() - now - sleep_time)
+                
+            # Spin for the last fraction of the frame
+            now = perf_counter()
+            while now < target:
+                now = perf_counter()
+                
+        elapsed = now - self._last
+        self._last = now
+        return elapsed * 1000.0
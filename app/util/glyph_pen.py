@@ -0,0 +1,133 @@
+"""
+Glyph cache for drawing text without rasterizing it on every call
+"""
+
+import pygame
+
+# Pens shared across scenes, keyed by (font, color)
+_pens = {}
+
+class Pen:
+    """
+    Draws text in one font and color from individually cached glyphs
+    
+    Each character is rasterized the first time it is drawn; strings are
+    then composed by blitting the cached glyphs at their advances, which
+    include the kerning the font reports for each pair.
+    """
+    
+    def __init__(self, font, color):
+        """
+        Initialize the pen
+        
+        Args:
+            font: pygame.font.Font to draw with
+            color: Text color
+        """
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        self.characters = {}  # Maps characters to rendered glyph surfaces
+        self.advances = {}  # Maps character pairs to the first one's advance
+        
+    def _glyph(self, char):
+        """
+        Get the rendered surface for a character
+        
+        Args:
+            char: Character to get
+            
+        Returns:
+            pygame.Surface: The glyph, rendered on first use
+        """
+        glyph = self.characters.get(char)
+        if glyph is None:
+            glyph = self.font.render(char, True, self.color).convert_alpha()
+            self.characters[char] = glyph
+        return glyph
+        
+    def _layout(self, text):
+        """
+        Compute the x offset of each character in a string
+        
+        Args:
+            text: String to lay out
+            
+        Returns:
+            tuple: (list of x offsets, total width)
+        """
+        offsets = []
+        x = 0
+        prev = ""
+        size = self.font.size
+        for char in text:
+            if prev:
+                pair = prev + char
+                advance = self.advances.get(pair)
+                if advance is None:
+                    advance = size(pair)[0] - size(char)[0]
+                    self.advances[pair] = advance
+                x += advance
+            offsets.append(x)
+            prev = char
+            
+        width = x + size(prev)[0] if prev else 0
+        return offsets, width
+        
+    def write(self, surface, text, pos, anchor="topleft"):
+        """
+        Draw a string onto a surface
+        
+        Args:
+            surface: Surface to draw on
+            text: String to draw
+            pos: (x, y) position of the anchor point
+            anchor: Name of the pygame.Rect point placed at pos
+            
+        Returns:
+            pygame.Rect: Area covered by the text
+        """
+        offsets, width = self._layout(text)
+        rect = pygame.Rect(0, 0, width, self.height)
+        setattr(rect, anchor, pos)
+        
+        glyph = self._glyph
+        left, top = rect.topleft
+        surface.blits([(glyph(char), (left + x, top)) for char, x in zip(text, offsets)],
+                      doreturn=False)
+        return rect
+        
+    def render(self, text):
+        """
+        Draw a string onto a new transparent surface
+        
+        Args:
+            text: String to draw
+            
+        Returns:
+            pygame.Surface: Surface exactly fitting the text, in the
+                            display's pixel format so blitting it needs
+                            no per-pixel conversion
+        """
+        width = self._layout(text)[1]
+        surface = pygame.Surface((max(1, width), self.height), pygame.SRCALPHA)
+        self.write(surface, text, (0, 0))
+        return surface.convert_alpha()
+
+
+def get_pen(font, color):
+    """
+    Get the shared pen for a font and color
+    
+    Args:
+        font: pygame.font.Font to draw with
+        color: Text color
+        
+    Returns:
+        Pen: Pen whose glyph cache is shared by every caller
+    """
+    key = (font, tuple(color))
+    pen = _pens.get(key)
+    if pen is None:
+        pen = _pens[key] = Pen(font, color)
+    return pen
@@ -9,16 +9,27 @@ def initialize_navigator(scene_manager):
     """
     Initialize the scene navigator with a reference to the scene manager
     
+    The module's change_scene and get_current_scene_name are then replaced
+    by the scene manager's bound methods, so modules that import them
+    afterwards (scenes are imported lazily, after this runs) call the
+    manager directly. Earlier imports keep the functions below, which
+    forward to the same methods.
+    
     Args:
         scene_manager: The application's SceneManager instance
     """
-    global _scene_manager
+    global _scene_manager, change_scene, get_current_scene_name
     _scene_manager = scene_manager
+    change_scene = scene_manager.change_scene
+    get_current_scene_name = scene_manager.get_current_scene_name
     
 def change_scene(scene_name):
     """
     Change to a different scene
     
+    Calling this before initialize_navigator is a programming error and
+    raises RuntimeError.
+    
     Args:
         scene_name: Name of the scene to change to
         
@@ -27,8 +38,7 @@ def change_scene(scene_name):
     """
     global _scene_manager
     if _scene_manager is None:
-        print("Error: Scene navigator not initialized")
-        return False
+        raise RuntimeError("Scene navigator not initialized")
         
     return _scene_manager.change_scene(scene_name)
     
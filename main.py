@@ -3,6 +3,7 @@ Double Pendulum Simulation
 An educational physics simulation that demonstrates chaos theory and double pendulum dynamics
 """
 
+import atexit
 import os
 import sys
 import pygame
@@ -12,22 +13,24 @@ def main():
     """
     Application entry point
     """
-    # Initialize pygame
-    pygame.init()
-    
-    # Create and initialize the application
+    # Cleanup is registered with atexit so it runs however the interpreter
+    # exits, Ctrl+C and uncaught errors included
     app = DoublePendulumApp()
-    app.initialize()
+    atexit.register(pygame.quit)
     
+    # Initialize and run the application; unexpected errors propagate
+    # with their traceback
     try:
-        # Run the application
+        app.initialize()
+        
+        # Only an initialized app has settings and scenes to clean up.
+        # atexit runs handlers in reverse order, so it shuts down before
+        # pygame.
+        atexit.register(app.exit)
         app.run()
-    except Exception as e:
-        print(f"Error: {e}")
-    finally:
-        # Clean up resources
-        app.exit()
-        pygame.quit()
+    except (pygame.error, RuntimeError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        sys.exit(1)
         
     print("Application closed successfully")
     
@@ -0,0 +1,67 @@
+"""
+Checks that ConfigManager writes settings it can read back
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from app.config.config_manager import ConfigManager
+
+
+class ConfigRoundTripTest(unittest.TestCase):
+    """Settings saved by one manager are loaded by the next"""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "settings.json")
+        
+    def make_manager(self):
+        """
+        Create and initialize a manager on the test settings file
+        
+        Returns:
+            ConfigManager: The initialized manager
+        """
+        manager = ConfigManager(self.path)
+        manager.initialize()
+        return manager
+        
+    def test_missing_file_uses_defaults(self):
+        manager = self.make_manager()
+        self.assertEqual(manager.get_setting("theme"), "light")
+        self.assertEqual(manager.get_setting("fps"), 60)
+        
+    def test_round_trip(self):
+        manager = self.make_manager()
+        manager.set_setting("theme", "dark")
+        manager.update_settings({"fps": 144, "simulation.gravity": 3.7})
+        self.assertTrue(manager.save_configuration())
+        
+        loaded = self.make_manager()
+        self.assertEqual(loaded.get_setting("theme"), "dark")
+        self.assertEqual(loaded.get_setting("fps"), 144)
+        self.assertEqual(loaded.get_setting("simulation.gravity"), 3.7)
+        
+        # Keys that were never changed still come from the defaults
+        self.assertEqual(loaded.get_setting("screen_width"), 1024)
+        
+    def test_file_keeps_four_space_indent(self):
+        manager = self.make_manager()
+        self.assertTrue(manager.save_configuration())
+        
+        with open(self.path) as f:
+            self.assertEqual(f.read(), json.dumps(manager.settings, indent=4))
+            
+    def test_corrupt_file_keeps_defaults(self):
+        with open(self.path, "w") as f:
+            f.write("{not json")
+            
+        manager = self.make_manager()
+        self.assertEqual(manager.get_setting("theme"), "light")
+
+
+if __name__ == "__main__":
+    unittest.main()
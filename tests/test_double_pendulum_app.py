@@ -0,0 +1,42 @@
+"""
+Checks DoublePendulumApp startup
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+# No window is needed; set before pygame creates the display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from app.config.config_manager import ConfigManager
+from app.double_pendulum_app import DoublePendulumApp
+
+
+class StartupTest(unittest.TestCase):
+    """Startup does only the work it needs"""
+    
+    def test_settings_loaded_once(self):
+        app = DoublePendulumApp()
+        self.addCleanup(pygame.quit)
+        with mock.patch.object(ConfigManager, "load_configuration") as load_configuration:
+            # Capturing the logs also keeps initialize from configuring logging
+            with self.assertLogs(level="INFO"):
+                app.initialize()
+            self.addCleanup(app.scene_manager.cleanup)
+        load_configuration.assert_called_once_with()
+        
+    def test_pygame_gui_not_imported_with_app(self):
+        # Checked in a fresh interpreter, since this process has imported it
+        code = "import sys, app.double_pendulum_app; sys.exit('pygame_gui' in sys.modules)"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True)
+        self.assertEqual(result.returncode, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Checks the CPU fallback of the batch ensemble simulation
+"""
+
+import math
+import unittest
+
+import numpy as np
+
+from app.physics import ensemble
+from app.physics.pendulum_physics import PendulumSystem
+
+
+def total_energy(a1, a2, v1, v2, m1, m2, l1, l2, g):
+    """Kinetic plus potential energy, with angles measured from straight down"""
+    kinetic = (0.5 * (m1 + m2) * l1 * l1 * v1 * v1
+               + 0.5 * m2 * l2 * l2 * v2 * v2
+               + m2 * l1 * l2 * v1 * v2 * np.cos(a1 - a2))
+    potential = -(m1 + m2) * g * l1 * np.cos(a1) - m2 * g * l2 * np.cos(a2)
+    return kinetic + potential
+
+
+class EnsembleTest(unittest.TestCase):
+    """Trajectories recorded by ensemble.simulate_ensemble without a GPU"""
+    
+    GRAVITY = 9.81
+    
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        count = 16
+        self.states = np.column_stack([
+            rng.uniform(-math.pi, math.pi, count),
+            rng.uniform(-math.pi, math.pi, count),
+            rng.uniform(-2.0, 2.0, count),
+            rng.uniform(-2.0, 2.0, count),
+            rng.uniform(5.0, 20.0, count),
+            rng.uniform(5.0, 20.0, count),
+            rng.uniform(1.0, 2.0, count),
+            rng.uniform(1.0, 2.0, count),
+        ])
+        
+    def test_trajectory_shape(self):
+        trajectories = ensemble.simulate_ensemble(self.states, 25, 0.01, self.GRAVITY,
+                                                  use_gpu=False)
+        self.assertEqual(trajectories.shape, (26, 4, len(self.states)))
+        self.assertEqual(trajectories.dtype, np.float32)
+        np.testing.assert_allclose(trajectories[0], self.states[:, :4].T.astype(np.float32))
+        
+    def test_conserves_energy(self):
+        n_steps = 2000
+        trajectories = ensemble.simulate_ensemble(self.states, n_steps, 0.001, self.GRAVITY,
+                                                  use_gpu=False, dtype=np.float64)
+        masses_lengths = self.states[:, 4:].T
+        start = total_energy(*trajectories[0], *masses_lengths, self.GRAVITY)
+        end = total_energy(*trajectories[n_steps], *masses_lengths, self.GRAVITY)
+        scale = np.abs(start) + 1.0
+        self.assertLess((np.abs(end - start) / scale).max(), 1e-6)
+        
+    def test_system_delegates(self):
+        trajectories = PendulumSystem().simulate_ensemble(self.states, 5, 0.01, self.GRAVITY,
+                                                          use_gpu=False)
+        expected = ensemble.simulate_ensemble(self.states, 5, 0.01, self.GRAVITY,
+                                              use_gpu=False)
+        np.testing.assert_array_equal(trajectories, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
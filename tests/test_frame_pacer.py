@@ -0,0 +1,112 @@
+"""
+Checks FramePacer timing against a fake clock
+"""
+
+import unittest
+from unittest import mock
+
+from app.util import frame_pacer
+from app.util.frame_pacer import FramePacer
+
+
+class FakeClock:
+    """
+    Stand-in for time.perf_counter and time.sleep
+    
+    Time only moves when the test advances it, when a sleep ends, or by
+    a fixed step on every reading, which lets the pacer's spin loop end.
+    """
+    
+    def __init__(self, oversleep=0.0, step=0.0):
+        """
+        Start the clock
+        
+        Args:
+            oversleep: Seconds every sleep wakes up late by
+            step: Seconds that pass on every reading
+        """
+        self.now = 100.0
+        self.oversleep = oversleep
+        self.step = step
+        self.sleeps = []
+        
+    def perf_counter(self):
+        """Read the clock, then advance it by one step"""
+        now = self.now
+        self.now += self.step
+        return now
+        
+    def sleep(self, seconds):
+        """Record a sleep and move past its end"""
+        self.sleeps.append(seconds)
+        self.now += seconds + self.oversleep
+
+
+class FramePacerTest(unittest.TestCase):
+    """The pacer sleeps through most of the frame and spins the rest"""
+    
+    def make_pacer(self, **clock_options):
+        """
+        Create a pacer that reads a fake clock
+        
+        Args:
+            **clock_options: Passed to FakeClock
+            
+        Returns:
+            tuple: (FramePacer, FakeClock)
+        """
+        clock = FakeClock(**clock_options)
+        for name in ("perf_counter", "sleep"):
+            patcher = mock.patch.object(frame_pacer.time, name, getattr(clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return FramePacer(), clock
+        
+    def test_sleep_leaves_room_for_predicted_overshoot(self):
+        pacer, clock = self.make_pacer(oversleep=0.002)
+        pacer._record_overshoot(0.001)
+        clock.now += 0.004
+        
+        elapsed_ms = pacer.tick(100)
+        
+        self.assertEqual(len(clock.sleeps), 1)
+        self.assertAlmostEqual(clock.sleeps[0], 0.010 - 0.004 - 0.001 - FramePacer.SPIN_MARGIN)
+        
+        # 4 ms of work, the 4.5 ms sleep and 2 ms of oversleep; that ends
+        # past the 10 ms target, so there was nothing to spin
+        self.assertAlmostEqual(elapsed_ms, 10.5)
+        self.assertAlmostEqual(pacer.predicted_overshoot(), (0.001 + 0.002) / 2)
+        
+    def test_spins_until_the_target(self):
+        pacer, clock = self.make_pacer(step=0.0001)
+        elapsed_ms = pacer.tick(100)
+        self.assertEqual(len(clock.sleeps), 1)
+        
+        # Spinning stops on the first reading at or past the target
+        self.assertGreaterEqual(elapsed_ms, 10.0)
+        self.assertLess(elapsed_ms, 10.0 + 0.1 + 1e-9)
+        
+    def test_late_frame_does_not_sleep(self):
+        pacer, clock = self.make_pacer()
+        clock.now += 0.015
+        self.assertAlmostEqual(pacer.tick(100), 15.0)
+        self.assertEqual(clock.sleeps, [])
+        
+    def test_zero_framerate_returns_at_once(self):
+        pacer, clock = self.make_pacer()
+        clock.now += 0.02
+        self.assertAlmostEqual(pacer.tick(0), 20.0)
+        self.assertEqual(clock.sleeps, [])
+        
+    def test_overshoot_history_is_bounded(self):
+        pacer = FramePacer()
+        for _ in range(FramePacer.HISTORY):
+            pacer._record_overshoot(1.0)
+        for _ in range(FramePacer.HISTORY):
+            pacer._record_overshoot(0.002)
+        self.assertEqual(len(pacer._overshoots), FramePacer.HISTORY)
+        self.assertAlmostEqual(pacer.predicted_overshoot(), 0.002)
+
+
+if __name__ == "__main__":
+    unittest.main()
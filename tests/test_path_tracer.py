@@ -0,0 +1,79 @@
+"""
+Checks PathTracer's incremental path layer
+"""
+
+import unittest
+from unittest import mock
+
+import pygame
+
+from app.physics import pendulum_physics
+from app.physics.pendulum_physics import PathTracer
+
+
+def traced(color=(0, 128, 255), points=30):
+    """
+    Build a tracer that has drawn a horizontal path
+    
+    Args:
+        color: Path color
+        points: Number of points drawn, one per render
+        
+    Returns:
+        tuple: (PathTracer, surface it renders to)
+    """
+    tracer = PathTracer(100, color)
+    surface = pygame.Surface((200, 100))
+    for i in range(points):
+        tracer.render(surface, point=(10 + 3 * i, 50))
+    return tracer, surface
+
+
+class PathTracerTest(unittest.TestCase):
+    """The layer follows color changes and resets"""
+    
+    def test_set_color_recolors_drawn_path(self):
+        tracer, _ = traced()
+        old = tracer.layer.get_at((20, 50))
+        tracer.set_color(255, 0, 0)
+        new = tracer.layer.get_at((20, 50))
+        self.assertEqual(tuple(new)[:3], (255, 0, 0))
+        self.assertEqual(new.a, old.a)
+        
+    def test_initialize_forgets_previous_path(self):
+        tracer, surface = traced()
+        tracer.initialize(100, (0, 255, 0))
+        self.assertIsNone(tracer._last_point)
+        self.assertIsNone(tracer._prev_point)
+        
+        # The first segment after the reset must not reach back to the old path
+        tracer.render(surface, point=(150, 80))
+        tracer.render(surface, point=(153, 80))
+        self.assertEqual(tracer.layer.get_at((100, 50)).a, 0)
+        
+    def test_short_path_discards_new_points(self):
+        tracer = PathTracer(100)
+        tracer.render(pygame.Surface((10, 10)), point=(1, 1))
+        self.assertEqual(tracer._new_points, 0)
+
+    def test_fade_follows_time_not_render_count(self):
+        def faded_alpha(renders):
+            # One second of path, rendered renders times over 0.2 seconds
+            clock = mock.Mock(return_value=0.0)
+            with mock.patch.object(pendulum_physics.time, "perf_counter", clock):
+                tracer = PathTracer(60)
+                surface = pygame.Surface((100, 100))
+                tracer.render(surface, point=(10, 10))
+                tracer.render(surface, point=(20, 10))
+                alpha = tracer.layer.get_at((15, 10)).a
+                for i in range(1, renders + 1):
+                    clock.return_value = 0.2 * i / renders
+                    tracer.render(surface)
+            return alpha - tracer.layer.get_at((15, 10)).a
+            
+        self.assertEqual(faded_alpha(2), 51)
+        self.assertEqual(faded_alpha(12), 51)
+
+
+if __name__ == "__main__":
+    unittest.main()
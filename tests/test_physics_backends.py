@@ -0,0 +1,134 @@
+"""
+Checks that the scalar, numpy and numba update paths of PendulumSystem agree
+"""
+
+import math
+import threading
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from app.physics import pendulum_physics
+from app.physics.pendulum_physics import PendulumParams, PendulumSystem
+
+# Enough pendulums that the count alone would pick a vectorized path
+PENDULUM_COUNT = 24
+FRAMES = 120
+GRAVITY = 9.81
+
+
+def run_system(scalar=False):
+    """
+    Simulate a fixed set of pendulums for FRAMES frames
+    
+    Args:
+        scalar: Force the one-pendulum-at-a-time update path
+        
+    Returns:
+        PendulumState: State of the simulated system
+    """
+    system = PendulumSystem()
+    system.initialize()
+    if scalar:
+        system.SCALAR_UPDATE_LIMIT = PENDULUM_COUNT
+        
+    for i in range(PENDULUM_COUNT):
+        system.create_pendulum(PendulumParams(
+            length1=80 + 5 * i, length2=120 - 3 * i,
+            mass1=5 + i % 7, mass2=12 - i % 5,
+            angle1=0.1 + 0.12 * i, angle2=math.pi - 0.09 * i,
+            velocity1=0.05 * i))
+            
+    for _ in range(FRAMES):
+        system.update(1.0 / 60.0, GRAVITY)
+    return system.state
+
+
+class PhysicsBackendTest(unittest.TestCase):
+    """Every update path must produce the same motion"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.reference = run_system(scalar=True)
+        
+    def assert_same_state(self, state):
+        """
+        Compare a state against the scalar reference
+        
+        Args:
+            state: PendulumState to check
+        """
+        n = self.reference.count
+        self.assertEqual(state.count, n)
+        for name in ("angle1", "angle2", "velocity1", "velocity2"):
+            np.testing.assert_allclose(getattr(state, name)[:n],
+                                       getattr(self.reference, name)[:n],
+                                       rtol=0, atol=1e-12, err_msg=name)
+                                       
+        # Bob positions are single precision
+        for name in ("x1", "y1", "x2", "y2"):
+            np.testing.assert_allclose(getattr(state, name)[:n],
+                                       getattr(self.reference, name)[:n],
+                                       rtol=0, atol=1e-3, err_msg=name)
+                                       
+    def test_vector_matches_scalar(self):
+        with mock.patch.object(pendulum_physics, "HAVE_NUMBA", False):
+            self.assert_same_state(run_system())
+            
+    @unittest.skipUnless(pendulum_physics.HAVE_NUMBA, "numba is not installed")
+    def test_numba_matches_scalar(self):
+        # The parallel kernel compiles in the background on first use
+        self.assertTrue(pendulum_physics._update_system_ready(wait=True))
+        self.assert_same_state(run_system())
+        
+    @unittest.skipUnless(pendulum_physics.HAVE_NUMBA, "numba is not installed")
+    def test_failed_compile_keeps_numpy_path(self):
+        kernel = mock.Mock()
+        kernel.compile.side_effect = RuntimeError("no compiler")
+        with mock.patch.multiple(pendulum_physics, _update_system_nb=kernel,
+                                 _update_system_done=threading.Event(),
+                                 _update_system_failed=False,
+                                 _update_system_compile_thread=None):
+            with self.assertLogs(pendulum_physics.log, level="WARNING"):
+                self.assertFalse(pendulum_physics._update_system_ready(wait=True))
+            self.assertFalse(pendulum_physics._update_system_ready())
+            
+            system = PendulumSystem()
+            system.initialize()
+            for _ in range(PENDULUM_COUNT):
+                system.create_pendulum(PendulumParams())
+            system.update(1.0 / 60.0, GRAVITY)
+            
+            # The numpy path stays selected rather than being chosen again
+            # on every update
+            self.assertEqual(system._update_impl, system._update_vector)
+            self.assertIsNotNone(system._update_key)
+        kernel.compile.assert_called_once()
+        
+    def test_pendulums_moved(self):
+        # Guards against the comparison passing on a system that never ran
+        n = self.reference.count
+        initial = np.array([0.1 + 0.12 * i for i in range(n)])
+        self.assertGreater(np.abs(self.reference.angle1[:n] - initial).max(), 0.1)
+
+
+class SelectionTest(unittest.TestCase):
+    """Selecting by position sees changes made since the last update"""
+    
+    def test_selects_bob_moved_by_setter(self):
+        system = PendulumSystem()
+        system.initialize()
+        pendulum = system.create_pendulum(PendulumParams(angle1=0.0, angle2=0.0))
+        system.selected_pendulum = None
+        
+        # Paused: the setter changes the angle without a system update
+        pendulum.set_angle(1, math.pi / 2)
+        center = (400, 300)
+        bob = (center[0] + pendulum.length1, center[1])
+        self.assertIs(system.try_select_pendulum_at_position(bob, center), pendulum)
+        self.assertEqual(pendulum.hit_test(bob, center), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Checks SceneManager.coalesce_events
+"""
+
+import unittest
+
+import pygame
+import pygame_gui
+
+from app.scenes.scene_manager import SceneManager
+
+
+def motion(pos, buttons=(0, 0, 0)):
+    """
+    Build a mouse motion event
+    
+    Args:
+        pos: (x, y) pointer position
+        buttons: Held mouse buttons
+        
+    Returns:
+        pygame.event.Event: The event
+    """
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=buttons)
+
+
+def press(pos):
+    """
+    Build a left mouse button press
+    
+    Args:
+        pos: (x, y) pointer position
+        
+    Returns:
+        pygame.event.Event: The event
+    """
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+
+class CoalesceEventsTest(unittest.TestCase):
+    """Only motion made redundant by later motion is dropped"""
+    
+    def test_short_batches_are_unchanged(self):
+        events = [motion((1, 1))]
+        self.assertIs(SceneManager.coalesce_events(events), events)
+        self.assertEqual(SceneManager.coalesce_events([]), [])
+        
+    def test_motion_run_keeps_last(self):
+        events = [motion((1, 1)), motion((2, 2)), motion((3, 3))]
+        self.assertEqual(SceneManager.coalesce_events(events), [events[-1]])
+        
+    def test_other_events_split_runs(self):
+        events = [motion((1, 1)), motion((2, 2)), press((2, 2)),
+                  motion((3, 3)), motion((4, 4))]
+        self.assertEqual(SceneManager.coalesce_events(events),
+                         [events[1], events[2], events[4]])
+                         
+    def test_button_change_splits_runs(self):
+        events = [motion((1, 1)), motion((2, 2), (1, 0, 0)), motion((3, 3), (1, 0, 0))]
+        self.assertEqual(SceneManager.coalesce_events(events), [events[0], events[2]])
+        
+    def test_repeated_presses_are_kept(self):
+        button = object()
+        events = [press((2, 2)), press((2, 2)),
+                  pygame.event.Event(pygame_gui.UI_BUTTON_PRESSED, ui_element=button),
+                  pygame.event.Event(pygame_gui.UI_BUTTON_PRESSED, ui_element=button)]
+        self.assertEqual(SceneManager.coalesce_events(events), events)
+
+
+if __name__ == "__main__":
+    unittest.main()